@@ -20,22 +20,56 @@
 
 import logging
 
-from bleak.exc import BleakError
-from bleak_retry_connector import (
-    close_stale_connections_by_address,
-    get_device,
-)
+from bleak.backends.device import BLEDevice
+from bleak_retry_connector import close_stale_connections_by_address
 from homeassistant.components import bluetooth
 from homeassistant.components.bluetooth.match import ADDRESS, BluetoothCallbackMatcher
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_ADDRESS, EVENT_HOMEASSISTANT_STOP, Platform
 from homeassistant.core import Event, HomeAssistant, callback
-from homeassistant.exceptions import ConfigEntryNotReady
 
-from .artsauna_ble import ArtsaunaBLEAdapter
-from .const import DOMAIN
-from .coordinator import ArtsaunaBLECoordinator
+from .artsauna_ble import (
+    ArtsaunaBLEAdapter,
+    ArtsaunaCaptureWriter,
+    ArtsaunaField,
+    ArtsaunaPipelineTracer,
+    ArtsaunaSlotScheduler,
+)
+from .const import (
+    CONF_CONNECTION_SLOTS,
+    CONF_COUNTDOWN_DEBOUNCE,
+    CONF_COUNTDOWN_MAX_STALENESS,
+    CONF_IDLE_DISCONNECT_TIMEOUT,
+    CONF_PIPELINE_TRACING,
+    CONF_RAW_CAPTURE,
+    CONF_TEMPERATURE_DEBOUNCE,
+    CONF_TEMPERATURE_MAX_STALENESS,
+    CONF_TEMPERATURE_STATISTICS,
+    CONF_TOGGLE_DEBOUNCE,
+    CONF_WRITE_WITHOUT_RESPONSE,
+    DATA_SLOT_SCHEDULER,
+    DEFAULT_CONNECTION_SLOTS,
+    DEFAULT_COUNTDOWN_DEBOUNCE,
+    DEFAULT_COUNTDOWN_MAX_STALENESS,
+    DEFAULT_IDLE_DISCONNECT_TIMEOUT,
+    DEFAULT_PIPELINE_TRACING,
+    DEFAULT_RAW_CAPTURE,
+    DEFAULT_TEMPERATURE_DEBOUNCE,
+    DEFAULT_TEMPERATURE_MAX_STALENESS,
+    DEFAULT_TEMPERATURE_STATISTICS,
+    DEFAULT_TOGGLE_DEBOUNCE,
+    DEFAULT_WRITE_WITHOUT_RESPONSE,
+    DOMAIN,
+)
+from .coordinator import (
+    COUNTDOWN_FIELDS,
+    DISCRETE_FIELDS,
+    TEMPERATURE_FIELDS,
+    ArtsaunaBLECoordinator,
+    DebouncePolicy,
+)
 from .models import ArtsaunaBLEData
+from .statistics import ArtsaunaTemperatureStatistics
 
 PLATFORMS: list[Platform] = [
     Platform.SENSOR,
@@ -49,29 +83,32 @@ _LOGGER = logging.getLogger(__name__)
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
-    """Set up Artsauna BLE from a config entry."""
-    address: str = entry.data[CONF_ADDRESS]
+    """Set up Artsauna BLE from a config entry.
 
-    await close_stale_connections_by_address(address)
+    The entities are set up right away and stay unavailable until the
+    connection, which is established in the background, delivers the first state.
+    """
+    address: str = entry.data[CONF_ADDRESS]
 
+    # until the sauna advertises, the connection is attempted by address
     ble_device = bluetooth.async_ble_device_from_address(
         hass, address.upper(), True
-    ) or await get_device(address)
-    if not ble_device:
-        raise ConfigEntryNotReady(
-            f"Could not find Artsauna device with address {address}"
-        )
-
-    artsauna_ble = ArtsaunaBLEAdapter(ble_device)
+    ) or BLEDevice(address, entry.title, None)
 
-    coordinator = ArtsaunaBLECoordinator(hass, artsauna_ble)
+    artsauna_ble = ArtsaunaBLEAdapter(
+        ble_device,
+        write_without_response=entry.options.get(
+            CONF_WRITE_WITHOUT_RESPONSE, DEFAULT_WRITE_WITHOUT_RESPONSE
+        ),
+        idle_disconnect_timeout=_idle_disconnect_timeout(entry),
+        slot_scheduler=_async_get_slot_scheduler(hass),
+    )
+    _async_update_tracer(entry, artsauna_ble)
+    await _async_update_capture(hass, entry, artsauna_ble)
 
-    try:
-        await artsauna_ble.initialise()
-    except BleakError as exc:
-        raise ConfigEntryNotReady(
-            f"Could not initialise Artsauna device with address {address}"
-        ) from exc
+    coordinator = ArtsaunaBLECoordinator(
+        hass, artsauna_ble, debounce_policies=_debounce_policies(entry)
+    )
 
     @callback
     def _async_update_ble(
@@ -92,9 +129,11 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         )
     )
 
-    hass.data.setdefault(DOMAIN, {})[entry.entry_id] = ArtsaunaBLEData(
+    data = hass.data[DOMAIN][entry.entry_id] = ArtsaunaBLEData(
         entry.title, artsauna_ble, coordinator
     )
+    _async_update_slot_limit(hass)
+    _async_update_statistics(hass, entry, data)
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
     entry.async_on_unload(entry.add_update_listener(_async_update_listener))
@@ -106,6 +145,15 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     entry.async_on_unload(
         hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, _async_stop)
     )
+
+    async def _async_connect() -> None:
+        """Connect to the sauna without holding up the setup."""
+        await close_stale_connections_by_address(address)
+        artsauna_ble.start()
+
+    entry.async_create_background_task(
+        hass, _async_connect(), f"{DOMAIN} {address} connect"
+    )
     return True
 
 
@@ -114,12 +162,121 @@ async def _async_update_listener(hass: HomeAssistant, entry: ConfigEntry) -> Non
     data: ArtsaunaBLEData = hass.data[DOMAIN][entry.entry_id]
     if entry.title != data.title:
         await hass.config_entries.async_reload(entry.entry_id)
+        return
+    data.device.write_without_response = entry.options.get(
+        CONF_WRITE_WITHOUT_RESPONSE, DEFAULT_WRITE_WITHOUT_RESPONSE
+    )
+    data.device.idle_disconnect_timeout = _idle_disconnect_timeout(entry)
+    data.coordinator.debounce_policies = _debounce_policies(entry)
+    _async_update_tracer(entry, data.device)
+    await _async_update_capture(hass, entry, data.device)
+    _async_update_slot_limit(hass)
+    _async_update_statistics(hass, entry, data)
+
+
+def _idle_disconnect_timeout(entry: ConfigEntry) -> float | None:
+    """Idle disconnect timeout of the entry, None if the connection is kept."""
+    return (
+        entry.options.get(CONF_IDLE_DISCONNECT_TIMEOUT, DEFAULT_IDLE_DISCONNECT_TIMEOUT)
+        or None
+    )
+
+
+def _debounce_policies(entry: ConfigEntry) -> dict[ArtsaunaField, DebouncePolicy]:
+    """Debounce policies of the field groups configured in the entry."""
+    options = entry.options
+    toggle_debounce = options.get(CONF_TOGGLE_DEBOUNCE, DEFAULT_TOGGLE_DEBOUNCE)
+    return {
+        DISCRETE_FIELDS: DebouncePolicy(toggle_debounce, toggle_debounce),
+        TEMPERATURE_FIELDS: DebouncePolicy(
+            options.get(CONF_TEMPERATURE_DEBOUNCE, DEFAULT_TEMPERATURE_DEBOUNCE),
+            options.get(
+                CONF_TEMPERATURE_MAX_STALENESS, DEFAULT_TEMPERATURE_MAX_STALENESS
+            ),
+        ),
+        COUNTDOWN_FIELDS: DebouncePolicy(
+            options.get(CONF_COUNTDOWN_DEBOUNCE, DEFAULT_COUNTDOWN_DEBOUNCE),
+            options.get(CONF_COUNTDOWN_MAX_STALENESS, DEFAULT_COUNTDOWN_MAX_STALENESS),
+        ),
+    }
 
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
         data: ArtsaunaBLEData = hass.data[DOMAIN].pop(entry.entry_id)
+        if data.statistics is not None:
+            data.statistics.async_stop()
         await data.device.stop()
+        _async_update_slot_limit(hass)
 
     return unload_ok
+
+
+@callback
+def _async_update_tracer(entry: ConfigEntry, device: ArtsaunaBLEAdapter) -> None:
+    """Start or stop tracing the notification pipeline of the device."""
+    if not entry.options.get(CONF_PIPELINE_TRACING, DEFAULT_PIPELINE_TRACING):
+        device.tracer = None
+    elif device.tracer is None:
+        device.tracer = ArtsaunaPipelineTracer()
+
+
+async def _async_update_capture(
+    hass: HomeAssistant, entry: ConfigEntry, device: ArtsaunaBLEAdapter
+) -> None:
+    """Start or stop capturing the raw packets of the device."""
+    if entry.options.get(CONF_RAW_CAPTURE, DEFAULT_RAW_CAPTURE):
+        if device.capture is None:
+            device.capture = ArtsaunaCaptureWriter(
+                hass.config.path(DOMAIN, f"{device.address.replace(':', '')}.cap")
+            )
+    elif device.capture is not None:
+        capture, device.capture = device.capture, None
+        await capture.async_flush()
+
+
+@callback
+def _async_update_statistics(
+    hass: HomeAssistant, entry: ConfigEntry, data: ArtsaunaBLEData
+) -> None:
+    """Start or stop importing the temperatures into the long-term statistics."""
+    if entry.options.get(CONF_TEMPERATURE_STATISTICS, DEFAULT_TEMPERATURE_STATISTICS):
+        if "recorder" not in hass.config.components:
+            _LOGGER.warning(
+                "%s: The recorder is not loaded, the temperature statistics"
+                " are not imported",
+                entry.title,
+            )
+        elif data.statistics is None:
+            data.statistics = ArtsaunaTemperatureStatistics(
+                hass, data.device, entry.title
+            )
+            data.statistics.async_start()
+    elif data.statistics is not None:
+        statistics, data.statistics = data.statistics, None
+        statistics.async_stop()
+
+
+@callback
+def _async_get_slot_scheduler(hass: HomeAssistant) -> ArtsaunaSlotScheduler:
+    """Get the connection slot scheduler shared by all entries."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    if DATA_SLOT_SCHEDULER not in domain_data:
+        domain_data[DATA_SLOT_SCHEDULER] = ArtsaunaSlotScheduler()
+    return domain_data[DATA_SLOT_SCHEDULER]
+
+
+@callback
+def _async_update_slot_limit(hass: HomeAssistant) -> None:
+    """Apply the lowest slot limit configured in the loaded entries."""
+    domain_data = hass.data[DOMAIN]
+    limits = [
+        slots
+        for entry in hass.config_entries.async_entries(DOMAIN)
+        if entry.entry_id in domain_data
+        and (
+            slots := entry.options.get(CONF_CONNECTION_SLOTS, DEFAULT_CONNECTION_SLOTS)
+        )
+    ]
+    _async_get_slot_scheduler(hass).set_slots(min(limits, default=None))
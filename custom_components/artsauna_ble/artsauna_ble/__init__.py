@@ -16,7 +16,80 @@
 # You should have received a copy of the GNU Affero General Public License
 # along with this program. If not, see <https://www.gnu.org/licenses/>.
 
-from .artsauna_ble_adapter import ArtsaunaBLEAdapter
-from .models import ArtsaunaState
+"""Protocol library of the Artsauna BLE saunas.
 
-__all__ = ["ArtsaunaBLEAdapter", "ArtsaunaState"]
+The library has no Home Assistant dependency. Its modules are imported
+lazily on first access of an exported name, so importing the package is cheap.
+"""
+
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .artsauna_ble_adapter import ArtsaunaBLEAdapter
+    from .capture import (
+        ArtsaunaCaptureWriter,
+        CaptureKind,
+        read_capture,
+        replay_capture,
+    )
+    from .change_filter import SignificantChange, SignificantChangeFilter
+    from .exceptions import ArtsaunaCommandError, ArtsaunaError
+    from .models import ArtsaunaField, ArtsaunaState
+    from .samples import HourlyAggregate, HourlySampleSeries
+    from .slot_scheduler import ArtsaunaSlotScheduler
+    from .tracing import ArtsaunaPipelineTracer, PipelineStage
+
+# module of every exported name
+_EXPORTS = {
+    "ArtsaunaBLEAdapter": "artsauna_ble_adapter",
+    "ArtsaunaCaptureWriter": "capture",
+    "ArtsaunaCommandError": "exceptions",
+    "ArtsaunaError": "exceptions",
+    "ArtsaunaField": "models",
+    "ArtsaunaPipelineTracer": "tracing",
+    "ArtsaunaSlotScheduler": "slot_scheduler",
+    "ArtsaunaState": "models",
+    "CaptureKind": "capture",
+    "HourlyAggregate": "samples",
+    "HourlySampleSeries": "samples",
+    "PipelineStage": "tracing",
+    "SignificantChange": "change_filter",
+    "SignificantChangeFilter": "change_filter",
+    "read_capture": "capture",
+    "replay_capture": "capture",
+}
+
+__all__ = [
+    "ArtsaunaBLEAdapter",
+    "ArtsaunaCaptureWriter",
+    "ArtsaunaCommandError",
+    "ArtsaunaError",
+    "ArtsaunaField",
+    "ArtsaunaPipelineTracer",
+    "ArtsaunaSlotScheduler",
+    "ArtsaunaState",
+    "CaptureKind",
+    "HourlyAggregate",
+    "HourlySampleSeries",
+    "PipelineStage",
+    "SignificantChange",
+    "SignificantChangeFilter",
+    "read_capture",
+    "replay_capture",
+]
+
+
+def __getattr__(name: str) -> object:
+    """Import the module of an exported name on first access."""
+    try:
+        module = _EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *_EXPORTS])
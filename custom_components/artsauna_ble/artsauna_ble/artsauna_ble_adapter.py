@@ -17,10 +17,12 @@
 # along with this program. If not, see <https://www.gnu.org/licenses/>.
 
 import asyncio
+import contextlib
 import logging
-import re
-import sys
-from collections.abc import Callable
+import random
+import time
+from collections.abc import Callable, Coroutine
+from typing import Any
 
 from bleak.backends.device import BLEDevice
 from bleak.backends.scanner import AdvertisementData
@@ -30,7 +32,6 @@ from bleak_retry_connector import (
     BleakClientWithServiceCache,
     BleakNotFoundError,
     establish_connection,
-    retry_bluetooth_connection_error,
 )
 
 from .artsauna_ble_device_mixin import ArtsaunaBLEDeviceMixin
@@ -38,88 +39,207 @@ from .artsauna_command_mixin import (
     ArtsaunaBLECommandMixin,
 )
 from .artsauna_state_mixin import ArtsaunaStateMixin
+from .capture import ArtsaunaCaptureWriter, CaptureKind
+from .command_queue import ArtsaunaCommandQueue
 from .const import (
     CHARACTERISTIC_NOTIFY,
     CHARACTERISTIC_WRITE,
-    FM_NOTIFICATION_REGEX,
-    STATE_NOTIFICATION_REGEX,
+    CMD_APP_AUTH,
 )
-from .models import ArtsaunaState
+from .exceptions import ArtsaunaCommandError
+from .frame_decoder import ArtsaunaFrameDecoder, FrameType
+from .histogram import LatencyHistogram
+from .models import ArtsaunaField, ArtsaunaState
+from .slot_scheduler import ArtsaunaSlotScheduler
+from .tracing import ArtsaunaPipelineTracer, PipelineStage
 
 _LOGGER = logging.getLogger(__name__)
-DEFAULT_ATTEMPTS = sys.maxsize
+COMMAND_ATTEMPTS = 3
+COMMAND_TIMEOUT = 30.0
+# seconds before the deadline of a command below which it is not retried
+COMMAND_ATTEMPT_MIN_TIME = 2.0
 BLEAK_BACKOFF_TIME = 0.25
+RECONNECT_BACKOFF_MAX_TIME = 120.0
+STEP_PROGRESS_TIMEOUT = 10.0
+WRITE_CONFIRMATION_TIMEOUT = 2.0
+COMMAND_CONFIRMATION_TIMEOUT = 5.0
+# changes of these fields keep the connection of an idle device
+_ACTIVITY_FIELDS = ArtsaunaField.STATE | ArtsaunaField.HEATING_STATE
 
 
 class ArtsaunaBLEAdapter(
     ArtsaunaStateMixin, ArtsaunaBLEDeviceMixin, ArtsaunaBLECommandMixin
 ):
-    def __init__(self, ble_device: BLEDevice) -> None:
+    def __init__(
+        self,
+        ble_device: BLEDevice,
+        write_without_response: bool = False,
+        idle_disconnect_timeout: float | None = None,
+        slot_scheduler: ArtsaunaSlotScheduler | None = None,
+    ) -> None:
         self._ble_device = ble_device
+        self._advertisement_data: AdvertisementData | None = None
+        self.write_without_response = write_without_response
+        self._frame_received = asyncio.Event()
         self._state = ArtsaunaState()
         self._client: BleakClientWithServiceCache | None = None
-        self._notification_buffer = b""
+        self._frame_decoder = ArtsaunaFrameDecoder()
         self._operation_lock = asyncio.Lock()
+        self._command_queue = ArtsaunaCommandQueue(self._send_command)
         self._connect_lock = asyncio.Lock()
-        self._callbacks: list[Callable[[ArtsaunaState], None]] = []
+        self._callbacks: list[Callable[[ArtsaunaState, ArtsaunaField], None]] = []
         self._disconnected_callbacks: list[Callable[[], None]] = []
+        self._state_waiters: list[
+            tuple[Callable[[ArtsaunaState], bool], asyncio.Future[ArtsaunaState]]
+        ] = []
+        self.last_round_trip_time: float | None = None
+        self.connect_latency = LatencyHistogram()
+        self.write_latency = LatencyHistogram()
+        self.confirmation_latency = LatencyHistogram()
+        # event loop time the last burst started to be written
+        self._burst_written_at: float | None = None
+        # pipeline tracing is off unless a tracer is set
+        self.tracer: ArtsaunaPipelineTracer | None = None
+        # raw packets are only captured if a capture writer is set
+        self.capture: ArtsaunaCaptureWriter | None = None
         self._expected_disconnect = False
+        self._reconnect_task: asyncio.Task[None] | None = None
+        # background tasks of the adapter, cancelled when it is stopped
+        self._tasks: set[asyncio.Task[None]] = set()
+        self._stopped = False
+        self._advertisement_received = asyncio.Event()
+        # the first state after (re)connecting is always passed on in full
+        self._resend_full_state = True
+        self._idle_disconnect_timeout = idle_disconnect_timeout
+        self._idle_disconnect_handle: asyncio.TimerHandle | None = None
+        self._idle_disconnected = False
+        self._created_at = time.monotonic()
+        self._connected_at: float | None = None
+        self._connected_time = 0.0
+        self.connection_count = 0
+        self._slot_scheduler = slot_scheduler
+        self.last_slot_wait_time: float | None = None
 
     async def initialise(self) -> None:
         await self._ensure_connected()
 
-        _LOGGER.debug("%s: Subscribe to notifications", self.name)
-        if self._client is not None:
-            _LOGGER.debug(self._client)
-
-            _LOGGER.debug("Sending auth commands")
-            await self.send_auth()
-            await asyncio.sleep(0.1)
+    def start(self) -> None:
+        """Connect in the background, retrying with backoff until connected.
 
-            await self._client.start_notify(
-                CHARACTERISTIC_NOTIFY, self._notification_handler
-            )
-        else:
-            _LOGGER.debug("Client is unexpectedly None")
+        Does nothing once the adapter is stopped.
+        """
+        self._schedule_reconnect()
 
     def set_ble_device_and_advertisement_data(
         self, ble_device: BLEDevice, advertisement_data: AdvertisementData
     ) -> None:
         """Set the ble device."""
+        previous_advertisement_data = self._advertisement_data
         self._ble_device = ble_device
         self._advertisement_data = advertisement_data
+        # the device is in range, wake up a backed off reconnect
+        self._advertisement_received.set()
+        if self._idle_disconnected and (
+            previous_advertisement_data is None
+            or _advertised_payload(previous_advertisement_data)
+            != _advertised_payload(advertisement_data)
+        ):
+            _LOGGER.debug("%s: Advertisement shows activity, reconnecting", self.name)
+            self._schedule_reconnect()
+
+    @property
+    def idle_disconnect_timeout(self) -> float | None:
+        """Seconds to stay connected while the sauna is off, None to stay connected."""
+        return self._idle_disconnect_timeout
+
+    @idle_disconnect_timeout.setter
+    def idle_disconnect_timeout(self, timeout: float | None) -> None:
+        self._idle_disconnect_timeout = timeout
+        self._update_idle_disconnect()
+
+    @property
+    def connected_time(self) -> float:
+        """Seconds connected to the device since the adapter was created."""
+        if self._connected_at is None:
+            return self._connected_time
+        return self._connected_time + time.monotonic() - self._connected_at
+
+    @property
+    def slot_usage(self) -> float:
+        """Share of the time since the adapter was created holding a connection slot."""
+        return self.connected_time / max(time.monotonic() - self._created_at, 1e-9)
+
+    @property
+    def has_slot_priority(self) -> bool:
+        """Commands are pending or the sauna is heating."""
+        return (
+            bool(self._command_queue)
+            or self._operation_lock.locked()
+            or self.is_heating_on
+        )
 
-    def _notification_handler(self, _sender: int, data: bytearray) -> None:
-        """Handle notification responses."""
-        _LOGGER.debug("%s: Notification received: %s", self.name, data.hex())
-
-        self._notification_buffer += data
-        msg = re.search(STATE_NOTIFICATION_REGEX, self._notification_buffer)
-        if msg:
-            self._notification_buffer = self._notification_buffer[msg.end() :]  # noqa: E203
-            state_data = bytearray(msg.group())
+    def yield_slot(self) -> None:
+        """Disconnect to free the connection slot unless commands are pending.
 
-            if ArtsaunaState.validate_ble_state_data(state_data):
-                _LOGGER.debug("State notification found: %s", state_data)
-                new_state = self._state.new_from_ble_state_data(state_data)
-                self._state = new_state
-                _LOGGER.debug("Setting new state: %s", new_state)
+        The adapter then waits for its next turn in the slot queue.
+        """
+        if self._client is None or self.has_slot_priority:
+            return
+        _LOGGER.debug("%s: Yielding the connection slot", self.name)
+        self._cancel_idle_disconnect()
+        self._idle_disconnected = True
+        self._create_task(self._execute_yield_slot())
 
-                self._fire_callbacks()
-            else:
-                _LOGGER.info("Incorrect state notification found: %s", data)
-            msg = None
+    async def _execute_yield_slot(self) -> None:
+        """Disconnect, then reconnect once the slot scheduler admits the adapter again."""
+        await self._execute_timed_disconnect()
+        self._schedule_reconnect()
 
-        msg = re.search(FM_NOTIFICATION_REGEX, self._notification_buffer)
-        if msg:
-            self._notification_buffer = self._notification_buffer[msg.end() :]  # noqa: E203
-            fm_data = bytearray(msg.group())
-            _LOGGER.debug("FM notification found: %s", fm_data)
+    @property
+    def frame_decoder(self) -> ArtsaunaFrameDecoder:
+        """The decoder of the notification stream, holds the link quality counters."""
+        return self._frame_decoder
 
-            new_state = self._state.new_from_ble_fm_data(fm_data)
+    def _notification_handler(self, _sender: int, data: bytearray) -> None:
+        """Handle notification responses."""
+        _LOGGER.debug("%s: Notification received: %s", self.name, data.hex())
+        if (capture := self.capture) is not None:
+            capture.record(CaptureKind.NOTIFICATION, data)
+        tracer = self.tracer
+        if tracer is not None:
+            trace = tracer.start()
+
+        frames = self._frame_decoder.feed(data)
+        if tracer is not None:
+            trace.mark(PipelineStage.PARSED)
+        if frames:
+            self._frame_received.set()
+        for frame_type, frame in frames:
+            if frame_type is FrameType.STATE:
+                _LOGGER.debug("State notification found: %s", frame)
+                new_state = self._state.new_from_ble_state_data(frame)
+            else:
+                _LOGGER.debug("FM notification found: %s", frame)
+                new_state = self._state.new_from_ble_fm_data(frame)
+            if tracer is not None:
+                trace.mark(PipelineStage.DECODED)
+            if self._resend_full_state:
+                self._resend_full_state = False
+                changed = ArtsaunaField.ALL
+            else:
+                changed = self._state.changed_fields(new_state)
             self._state = new_state
-            _LOGGER.debug("Setting new state: %s", new_state)
-            self._fire_callbacks()
+            if changed:
+                _LOGGER.debug("Setting new state: %s", new_state)
+                if changed & _ACTIVITY_FIELDS:
+                    self._update_idle_disconnect()
+                if self._state_waiters:
+                    self._check_state_waiters()
+                self._fire_callbacks(changed)
+        if tracer is not None and tracer.current is trace:
+            # no receiver took the trace over
+            tracer.take()
+            tracer.finish(trace)
 
     async def _ensure_connected(self) -> None:
         """Ensure connection to device is established."""
@@ -134,35 +254,107 @@ class ArtsaunaBLEAdapter(
             # Check again while holding the lock
             if self._client and self._client.is_connected:
                 return
+            if self._slot_scheduler is not None:
+                _LOGGER.debug("%s: Waiting for a connection slot", self.name)
+                self.last_slot_wait_time = await self._slot_scheduler.acquire(self)
             _LOGGER.debug("%s: Connecting", self.name)
-            client = await establish_connection(
-                BleakClientWithServiceCache,
-                self._ble_device,
-                self.name,
-                self._disconnected,
-                use_services_cache=True,
-                ble_device_callback=lambda: self._ble_device,
-            )
+            connect_start = time.monotonic()
+            try:
+                client = await establish_connection(
+                    BleakClientWithServiceCache,
+                    self._ble_device,
+                    self.name,
+                    self._disconnected,
+                    use_services_cache=True,
+                    ble_device_callback=lambda: self._ble_device,
+                )
+            except BaseException:
+                self._release_slot()
+                raise
             _LOGGER.debug("%s: Connected", self.name)
 
+            self._expected_disconnect = False
+            try:
+                await self._start_session(client)
+            except BaseException:
+                # without a session the connection is useless, start over
+                self._expected_disconnect = True
+                with contextlib.suppress(*BLEAK_RETRY_EXCEPTIONS):
+                    await client.disconnect()
+                self._release_slot()
+                raise
             self._client = client
+            self._idle_disconnected = False
+            self._connected_at = time.monotonic()
+            self.connect_latency.record(self._connected_at - connect_start)
+            self.connection_count += 1
+            self._update_idle_disconnect()
+
+    async def _start_session(self, client: BleakClientWithServiceCache) -> None:
+        """Authenticate and subscribe to notifications on a new connection."""
+        _LOGGER.debug("%s: Sending auth commands", self.name)
+        await client.write_gatt_char(CHARACTERISTIC_WRITE, data=CMD_APP_AUTH)
+        await asyncio.sleep(0.1)
+        _LOGGER.debug("%s: Subscribe to notifications", self.name)
+        await client.start_notify(CHARACTERISTIC_NOTIFY, self._notification_handler)
+
+    def _schedule_reconnect(self) -> None:
+        """Start the reconnect loop unless it is running already."""
+        if self._stopped:
+            return
+        if self._reconnect_task is None or self._reconnect_task.done():
+            self._reconnect_task = self._create_task(self._reconnect())
 
     async def _reconnect(self) -> None:
-        """Attempt a reconnect"""
-        _LOGGER.debug("ensuring connection")
-        try:
-            await self._ensure_connected()
-            _LOGGER.debug("ensured connection - initialising")
-            await self.initialise()
-        except BleakNotFoundError:
-            _LOGGER.debug("failed to ensure connection - backing off")
-            await asyncio.sleep(BLEAK_BACKOFF_TIME)
-            _LOGGER.debug("reconnecting again")
-            asyncio.create_task(self._reconnect())
+        """Reconnect with exponential backoff until connected.
+
+        The backoff is cut short by an advertisement of the device, but only
+        if the previous attempt was not already started by one. A device that
+        advertises but keeps failing to connect is retried at the backoff rate.
+        """
+        backoff_limit = BLEAK_BACKOFF_TIME
+        woken_by_advertisement = False
+        while True:
+            self._advertisement_received.clear()
+            _LOGGER.debug("%s: Reconnecting", self.name)
+            try:
+                await self.initialise()
+            except BLEAK_RETRY_EXCEPTIONS:
+                _LOGGER.debug("%s: Reconnect failed", self.name, exc_info=True)
+            else:
+                _LOGGER.debug("%s: Reconnected", self.name)
+                return
+            # full jitter, so several devices don't hit the adapter in lockstep
+            backoff_time = random.uniform(0, backoff_limit)
+            backoff_limit = min(RECONNECT_BACKOFF_MAX_TIME, 2 * backoff_limit)
+            if woken_by_advertisement:
+                _LOGGER.debug("%s: Backing off %.2fs", self.name, backoff_time)
+                await asyncio.sleep(backoff_time)
+                woken_by_advertisement = False
+                continue
+            _LOGGER.debug(
+                "%s: Backing off %.2fs or until the next advertisement",
+                self.name,
+                backoff_time,
+            )
+            try:
+                async with asyncio.timeout(backoff_time):
+                    await self._advertisement_received.wait()
+            except TimeoutError:
+                pass
+            else:
+                woken_by_advertisement = True
 
     # disconnect
     def _disconnected(self, client: BleakClientWithServiceCache) -> None:
         """Disconnected callback."""
+        if self._connected_at is not None:
+            self._connected_time += time.monotonic() - self._connected_at
+            self._connected_at = None
+        self._cancel_idle_disconnect()
+        self._release_slot()
+        self._frame_decoder.reset()
+        self._resend_full_state = True
         self._fire_disconnected_callbacks()
         if self._expected_disconnect:
             _LOGGER.debug("%s: Disconnected from device", self.name)
@@ -171,16 +363,67 @@ class ArtsaunaBLEAdapter(
             "%s: Device unexpectedly disconnected",
             self.name,
         )
-        asyncio.create_task(self._reconnect())
+        self._schedule_reconnect()
+
+    def _release_slot(self) -> None:
+        if self._slot_scheduler is not None:
+            self._slot_scheduler.release(self)
 
     def _disconnect(self) -> None:
         """Disconnect from device."""
-        asyncio.create_task(self._execute_timed_disconnect())
+        self._create_task(self._execute_timed_disconnect())
+
+    def _create_task(self, coro: Coroutine[Any, Any, None]) -> asyncio.Task[None]:
+        """Run a coroutine in a background task that is cancelled on stop."""
+        task = asyncio.create_task(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+
+    def _update_idle_disconnect(self) -> None:
+        """Restart the idle timer, it only runs while the sauna is off.
+
+        Called whenever commands are written or the power or heating state
+        changes.
+        """
+        self._cancel_idle_disconnect()
+        if (
+            self._idle_disconnect_timeout is None
+            or self._client is None
+            or self.is_power_on
+            or self.is_heating_on
+        ):
+            return
+        self._idle_disconnect_handle = asyncio.get_running_loop().call_later(
+            self._idle_disconnect_timeout, self._idle_disconnect
+        )
+
+    def _cancel_idle_disconnect(self) -> None:
+        if self._idle_disconnect_handle is not None:
+            self._idle_disconnect_handle.cancel()
+            self._idle_disconnect_handle = None
+
+    def _idle_disconnect(self) -> None:
+        """Free the connection slot of the idle device."""
+        self._idle_disconnect_handle = None
+        if self._operation_lock.locked() or self._command_queue:
+            self._update_idle_disconnect()
+            return
+        _LOGGER.debug("%s: Idle, freeing the connection slot", self.name)
+        self._idle_disconnected = True
+        self._disconnect()
 
     async def stop(self) -> None:
         """Stop the Artsauna integration."""
         _LOGGER.debug("%s: Stop", self.name)
+        self._stopped = True
+        for task in self._tasks:
+            task.cancel()
+        self._cancel_idle_disconnect()
+        self._command_queue.cancel()
         await self._execute_disconnect()
+        if self.capture is not None:
+            await self.capture.async_flush()
 
     async def _execute_timed_disconnect(self) -> None:
         """Execute timed disconnection."""
@@ -199,21 +442,128 @@ class ArtsaunaBLEAdapter(
             if client and client.is_connected:
                 await client.stop_notify(CHARACTERISTIC_NOTIFY)
                 await client.disconnect()
+            self._release_slot()
 
     # commands
+    def _command_deadline(self) -> float:
+        """Deadline in event loop time for a command queued now."""
+        return asyncio.get_running_loop().time() + COMMAND_TIMEOUT
+
+    async def _queue_commands(
+        self,
+        commands: list[bytes],
+        key: str | None = None,
+        expected_state: Callable[[ArtsaunaState], bool] | None = None,
+    ) -> None:
+        """Queue commands to be written with the next burst.
+
+        Pending commands with the same key are superseded by these.
+        If an expected state is given, this returns once the state after the
+        write or a later notification satisfies it and raises `TimeoutError`
+        if none does in time.
+        """
+        if expected_state is None:
+            await self._command_queue.put(commands, key, self._command_deadline())
+            return
+        confirmation = self._add_state_waiter(expected_state)
+        try:
+            await self._command_queue.put(commands, key, self._command_deadline())
+            # timed from the write, not including the queue, slot and connect time
+            written_at = self._burst_written_at
+            if not confirmation.done() and expected_state(self._state):
+                # already at the value, the notifications don't change the state
+                return
+            async with asyncio.timeout(COMMAND_CONFIRMATION_TIMEOUT):
+                await confirmation
+        finally:
+            self._remove_state_waiter(expected_state, confirmation)
+        if written_at is None:
+            return
+        self.last_round_trip_time = asyncio.get_running_loop().time() - written_at
+        self.confirmation_latency.record(self.last_round_trip_time)
+
+    async def _send_step_commands(
+        self,
+        command: bytes,
+        steps: int,
+        field: ArtsaunaField,
+        progress_callback: Callable[[int, int], None] | None = None,
+    ) -> None:
+        """Queue a step command, bursts of step commands are written together.
+
+        The optional progress callback is called with the number of confirmed
+        and total steps whenever a state notification moves the stepped field.
+        """
+        if steps < 1:
+            return
+        cancel_progress = (
+            self._track_step_progress(field, steps, progress_callback)
+            if progress_callback is not None
+            else None
+        )
+        try:
+            await self._command_queue.put(
+                [command] * steps, deadline=self._command_deadline()
+            )
+        except BaseException:
+            if cancel_progress is not None:
+                cancel_progress()
+            raise
+
+    def _track_step_progress(
+        self,
+        field: ArtsaunaField,
+        steps: int,
+        progress_callback: Callable[[int, int], None],
+    ) -> Callable[[], None]:
+        """Report the steps the stepped field moved since the commands were queued.
+
+        The steps are counted from the decoded value, so several steps reported
+        by a single notification are all confirmed at once.
+        """
+        name = field.name.lower()
+        start = getattr(self._state, name)
+        confirmed = 0
+
+        def _on_state(state: ArtsaunaState, changed: ArtsaunaField) -> None:
+            nonlocal confirmed
+            if not changed & field:
+                return
+            moved = min(abs(getattr(state, name) - start), steps)
+            if moved == confirmed:
+                return
+            confirmed = moved
+            progress_callback(confirmed, steps)
+            if confirmed >= steps:
+                cancel()
+
+        def cancel() -> None:
+            timeout_handle.cancel()
+            if _on_state in self._callbacks:
+                unregister()
+
+        unregister = self.register_callback(_on_state)
+        timeout_handle = asyncio.get_running_loop().call_later(
+            STEP_PROGRESS_TIMEOUT, cancel
+        )
+        return cancel
+
     async def _send_command(
-        self, commands: list[bytes] | bytes, retry: int | None = None
+        self, commands: list[bytes] | bytes, deadline: float | None = None
     ) -> None:
-        """Send command to device and read response."""
-        await self._ensure_connected()
+        """Send commands to the device, reconnecting between the attempts.
+
+        Each attempt, connecting included, is bounded by the deadline in event
+        loop time. A retry is skipped if less than `COMMAND_ATTEMPT_MIN_TIME`
+        is left until then.
+
+        Raises:
+            ArtsaunaCommandError: If the device is not in range, all
+                `COMMAND_ATTEMPTS` attempts failed, the deadline passed or a
+                write without response was not confirmed.
+        """
         if not isinstance(commands, list):
             commands = [commands]
-        await self._send_command_while_connected(commands, retry)
-
-    async def _send_command_while_connected(
-        self, commands: list[bytes], retry: int | None = None
-    ) -> None:
-        """Send command to device and read response."""
         _LOGGER.debug(
             "%s: Sending commands %s",
             self.name,
@@ -224,21 +574,48 @@ class ArtsaunaBLEAdapter(
                 "%s: Operation already in progress, waiting for it to complete",
                 self.name,
             )
+        loop = asyncio.get_running_loop()
         async with self._operation_lock:
-            try:
-                await self._send_command_locked(commands)
-                return
-            except BleakNotFoundError:
-                _LOGGER.exception(
-                    "%s: device not found, no longer in range",
-                    self.name,
-                )
-                raise
-            except BLEAK_RETRY_EXCEPTIONS:
-                _LOGGER.debug("%s: communication failed", self.name, exc_info=True)
-                raise
+            for attempt in range(1, COMMAND_ATTEMPTS + 1):
+                if (
+                    attempt > 1
+                    and deadline is not None
+                    and deadline - loop.time() < COMMAND_ATTEMPT_MIN_TIME
+                ):
+                    raise ArtsaunaCommandError(
+                        f"Commands to {self.name} failed after {attempt - 1}"
+                        " attempts, no time left for another one"
+                    )
+                try:
+                    async with asyncio.timeout_at(deadline) as timeout:
+                        await self._ensure_connected()
+                        await self._send_command_locked(commands)
+                    self._update_idle_disconnect()
+                    return
+                except BleakNotFoundError as exc:
+                    _LOGGER.exception(
+                        "%s: device not found, no longer in range",
+                        self.name,
+                    )
+                    raise ArtsaunaCommandError(f"{self.name} is not in range") from exc
+                except BLEAK_RETRY_EXCEPTIONS as exc:
+                    if timeout.expired():
+                        raise ArtsaunaCommandError(
+                            f"Commands to {self.name} were not written"
+                            " within their deadline"
+                        ) from exc
+                    _LOGGER.debug(
+                        "%s: communication failed, attempt %s of %s",
+                        self.name,
+                        attempt,
+                        COMMAND_ATTEMPTS,
+                        exc_info=True,
+                    )
+                    if attempt == COMMAND_ATTEMPTS:
+                        raise ArtsaunaCommandError(
+                            f"Commands to {self.name} failed after {attempt} attempts"
+                        ) from exc
 
-    @retry_bluetooth_connection_error(DEFAULT_ATTEMPTS)
     async def _send_command_locked(self, commands: list[bytes]) -> None:
         """Send command to device and read response."""
         try:
@@ -262,15 +639,131 @@ class ArtsaunaBLEAdapter(
 
     async def _execute_command_locked(self, commands: list[bytes]) -> None:
         """Execute command and read response."""
-        if self._client is not None:
+        if self._client is None:
+            return
+        if (capture := self.capture) is not None:
             for command in commands:
-                await self._client.write_gatt_char(CHARACTERISTIC_WRITE, data=command)
+                capture.record(CaptureKind.WRITE, command)
+        if self.write_without_response and self._supports_write_without_response():
+            await self._execute_command_without_response_locked(commands)
+            return
+        write_start = self._start_burst_write()
+        for command in commands:
+            await self._client.write_gatt_char(CHARACTERISTIC_WRITE, data=command)
+        self.write_latency.record(time.monotonic() - write_start)
+
+    def _start_burst_write(self) -> float:
+        """Mark the start of a burst write, returns the start for the write latency."""
+        self._burst_written_at = asyncio.get_running_loop().time()
+        return time.monotonic()
+
+    def _supports_write_without_response(self) -> bool:
+        """Check whether the write characteristic allows writes without response."""
+        characteristic = self._client.services.get_characteristic(CHARACTERISTIC_WRITE)
+        return (
+            characteristic is not None
+            and "write-without-response" in characteristic.properties
+        )
+
+    async def _execute_command_without_response_locked(
+        self, commands: list[bytes]
+    ) -> None:
+        """Write commands without response and confirm them by a notification.
+
+        If no notification follows, writes without response are disabled for
+        this device. The commands are not written again, toggles and steps
+        would be applied twice if the first write did arrive.
+
+        Raises:
+            ArtsaunaCommandError: If the commands were not confirmed.
+        """
+        self._frame_received.clear()
+        write_start = self._start_burst_write()
+        for command in commands:
+            await self._client.write_gatt_char(
+                CHARACTERISTIC_WRITE, data=command, response=False
+            )
+        self.write_latency.record(time.monotonic() - write_start)
+        try:
+            async with asyncio.timeout(WRITE_CONFIRMATION_TIMEOUT):
+                await self._frame_received.wait()
+        except TimeoutError as exc:
+            _LOGGER.warning(
+                "%s: Writes without response are not confirmed by the device,"
+                " falling back to writes with response",
+                self.name,
+            )
+            self.write_without_response = False
+            raise ArtsaunaCommandError(
+                f"Commands to {self.name} were not confirmed"
+            ) from exc
+
+    # state waiters
+    async def wait_for_state(
+        self, predicate: Callable[[ArtsaunaState], bool], timeout: float
+    ) -> ArtsaunaState:
+        """Wait until the state satisfies the predicate.
+
+        The predicate is checked against the current state and then once per
+        notification that changes the state.
+
+        Raises:
+            TimeoutError: If the predicate is not satisfied within the timeout.
+        """
+        if predicate(self._state):
+            return self._state
+        future = self._add_state_waiter(predicate)
+        try:
+            async with asyncio.timeout(timeout):
+                return await future
+        finally:
+            self._remove_state_waiter(predicate, future)
+
+    def _add_state_waiter(
+        self, predicate: Callable[[ArtsaunaState], bool]
+    ) -> asyncio.Future[ArtsaunaState]:
+        future: asyncio.Future[ArtsaunaState] = (
+            asyncio.get_running_loop().create_future()
+        )
+        self._state_waiters.append((predicate, future))
+        return future
+
+    def _remove_state_waiter(
+        self,
+        predicate: Callable[[ArtsaunaState], bool],
+        future: asyncio.Future[ArtsaunaState],
+    ) -> None:
+        try:
+            self._state_waiters.remove((predicate, future))
+        except ValueError:
+            pass
+
+    def _check_state_waiters(self) -> None:
+        """Resolve the waiters satisfied by the current state."""
+        state = self._state
+        pending = []
+        for predicate, future in self._state_waiters:
+            if future.done():
+                continue
+            try:
+                satisfied = predicate(state)
+            except Exception as exc:  # noqa: BLE001
+                future.set_exception(exc)
+                continue
+            if satisfied:
+                future.set_result(state)
+            else:
+                pending.append((predicate, future))
+        self._state_waiters = pending
 
     # handle callbacks
     def register_callback(
-        self, callback: Callable[[ArtsaunaState], None]
+        self, callback: Callable[[ArtsaunaState, ArtsaunaField], None]
     ) -> Callable[[], None]:
-        """Register a callback to be called when the state changes."""
+        """Register a callback to be called when the state changes.
+
+        The callback gets the new state and the bitmask of the changed fields.
+        """
 
         def unregister_callback() -> None:
             self._callbacks.remove(callback)
@@ -278,10 +771,11 @@ class ArtsaunaBLEAdapter(
         self._callbacks.append(callback)
         return unregister_callback
 
-    def _fire_callbacks(self) -> None:
+    def _fire_callbacks(self, changed: ArtsaunaField) -> None:
         """Fire the callbacks."""
-        for callback in self._callbacks:
-            callback(self._state)
+        # callbacks may unregister themselves
+        for callback in list(self._callbacks):
+            callback(self._state, changed)
 
     def register_disconnected_callback(
         self, callback: Callable[[], None]
@@ -296,5 +790,10 @@ class ArtsaunaBLEAdapter(
 
     def _fire_disconnected_callbacks(self) -> None:
         """Fire the callbacks."""
-        for callback in self._disconnected_callbacks:
+        for callback in list(self._disconnected_callbacks):
             callback()
+
+
+def _advertised_payload(advertisement_data: AdvertisementData) -> tuple:
+    """The advertised data that reflects the device state, without the RSSI."""
+    return (advertisement_data.manufacturer_data, advertisement_data.service_data)
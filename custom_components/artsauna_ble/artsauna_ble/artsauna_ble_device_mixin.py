@@ -18,7 +18,7 @@
 
 from functools import cached_property
 
-from homeassistant.helpers.device_registry import format_mac
+from .utils import format_mac
 
 
 class ArtsaunaBLEDeviceMixin:
@@ -16,6 +16,9 @@
 # You should have received a copy of the GNU Affero General Public License
 # along with this program. If not, see <https://www.gnu.org/licenses/>.
 
+from collections.abc import Callable
+from operator import attrgetter
+
 from . import utils
 from .const import (
     CMD_APP_AUTH,
@@ -32,60 +35,122 @@ from .const import (
     CMD_TOGGLE_POWER,
     CMD_TOGGLE_UNIT,
     CMD_TOGGLE_USB,
+    COMMAND_KEY_RGB,
+    COMMAND_KEY_VOLUME,
 )
+from .models import ArtsaunaField, ArtsaunaState
+from .protocol import RGB_STATE_VALUES
 
 
 class ArtsaunaBLECommandMixin:
     async def send_auth(self):
-        await self._send_command(CMD_APP_AUTH)
-
-    async def send_toggle_power(self):
-        await self._send_command(CMD_TOGGLE_POWER)
-
-    async def send_toggle_heating(self):
-        await self._send_command(CMD_TOGGLE_HEATING)
-
-    async def send_temp_up(self):
-        await self._send_command(CMD_TEMP_UP)
-
-    async def send_temp_down(self):
-        await self._send_command(CMD_TEMP_DOWN)
-
-    async def send_time_up(self):
-        await self._send_command(CMD_TIME_UP)
-
-    async def send_time_down(self):
-        await self._send_command(CMD_TIME_DOWN)
-
-    async def send_toggle_internal_light(self):
-        await self._send_command(CMD_TOGGLE_INTERNAL_LIGHT)
-
-    async def send_toggle_external_light(self):
-        await self._send_command(CMD_TOGGLE_EXTERNAL_LIGHT)
-
-    async def send_toggle_unit(self):
-        await self._send_command(CMD_TOGGLE_UNIT)
-
-    async def send_toggle_fm(self):
-        await self._send_command(CMD_TOGGLE_FM)
-
-    async def send_toggle_bt(self):
-        await self._send_command(CMD_TOGGLE_BT)
-
-    async def send_toggle_aux(self):
-        await self._send_command(CMD_TOGGLE_AUX)
-
-    async def send_toggle_usb(self):
-        await self._send_command(CMD_TOGGLE_USB)
-
-    async def send_cycle_rgb(self):
-        cmd_data = utils.construct_rgb_cmd_data(self._state.rgb)
-        await self._send_command(cmd_data)
-
-    async def send_set_rgb(self, rgb: int):
+        await self._queue_commands([CMD_APP_AUTH])
+
+    async def send_toggle_power(self, confirm: bool = False):
+        await self._queue_toggle(CMD_TOGGLE_POWER, attrgetter("is_power_on"), confirm)
+
+    async def send_toggle_heating(self, confirm: bool = False):
+        await self._queue_toggle(
+            CMD_TOGGLE_HEATING, attrgetter("is_heating_on"), confirm
+        )
+
+    async def send_temp_up(
+        self,
+        steps: int = 1,
+        progress_callback: Callable[[int, int], None] | None = None,
+    ):
+        await self._send_step_commands(
+            CMD_TEMP_UP, steps, ArtsaunaField.TARGET_TEMP, progress_callback
+        )
+
+    async def send_temp_down(
+        self,
+        steps: int = 1,
+        progress_callback: Callable[[int, int], None] | None = None,
+    ):
+        await self._send_step_commands(
+            CMD_TEMP_DOWN, steps, ArtsaunaField.TARGET_TEMP, progress_callback
+        )
+
+    async def send_time_up(
+        self,
+        steps: int = 1,
+        progress_callback: Callable[[int, int], None] | None = None,
+    ):
+        await self._send_step_commands(
+            CMD_TIME_UP, steps, ArtsaunaField.REMAINING_TIME, progress_callback
+        )
+
+    async def send_time_down(
+        self,
+        steps: int = 1,
+        progress_callback: Callable[[int, int], None] | None = None,
+    ):
+        await self._send_step_commands(
+            CMD_TIME_DOWN, steps, ArtsaunaField.REMAINING_TIME, progress_callback
+        )
+
+    async def send_toggle_internal_light(self, confirm: bool = False):
+        await self._queue_toggle(
+            CMD_TOGGLE_INTERNAL_LIGHT, attrgetter("is_internal_light_on"), confirm
+        )
+
+    async def send_toggle_external_light(self, confirm: bool = False):
+        await self._queue_toggle(
+            CMD_TOGGLE_EXTERNAL_LIGHT, attrgetter("is_external_light_on"), confirm
+        )
+
+    async def send_toggle_unit(self, confirm: bool = False):
+        await self._queue_toggle(
+            CMD_TOGGLE_UNIT, attrgetter("is_unit_celsius"), confirm
+        )
+
+    async def send_toggle_fm(self, confirm: bool = False):
+        await self._queue_toggle(CMD_TOGGLE_FM, attrgetter("is_fm_on"), confirm)
+
+    async def send_toggle_bt(self, confirm: bool = False):
+        await self._queue_toggle(CMD_TOGGLE_BT, attrgetter("is_bt_on"), confirm)
+
+    async def send_toggle_aux(self, confirm: bool = False):
+        await self._queue_toggle(CMD_TOGGLE_AUX, attrgetter("state"), confirm)
+
+    async def send_toggle_usb(self, confirm: bool = False):
+        await self._queue_toggle(CMD_TOGGLE_USB, attrgetter("state"), confirm)
+
+    async def send_cycle_rgb(self, confirm: bool = False):
+        # the RGB nibble of the state may hold values without a command
+        cmd_data = utils.construct_rgb_cmd_data(self._state.rgb % len(RGB_STATE_VALUES))
+        await self._queue_toggle(cmd_data, attrgetter("rgb"), confirm)
+
+    async def send_set_rgb(self, rgb: int, confirm: bool = False):
         cmd_data = utils.construct_rgb_cmd_data(rgb)
-        await self._send_command(cmd_data)
-
-    async def send_set_volume(self, volume: int):
+        rgb_state = RGB_STATE_VALUES[rgb]
+        await self._queue_commands(
+            [cmd_data],
+            COMMAND_KEY_RGB,
+            (lambda state: state.rgb == rgb_state) if confirm else None,
+        )
+
+    async def send_set_volume(self, volume: int, confirm: bool = False):
         cmd_data = utils.construct_volume_cmd_data(volume)
-        await self._send_command(cmd_data)
+        await self._queue_commands(
+            [cmd_data],
+            COMMAND_KEY_VOLUME,
+            (lambda state: state.volume == volume) if confirm else None,
+        )
+
+    async def _queue_toggle(
+        self,
+        command: bytes,
+        toggled_value: Callable[[ArtsaunaState], object],
+        confirm: bool,
+    ) -> None:
+        """Queue a toggle, if confirmed wait until the toggled value changes."""
+        if not confirm:
+            await self._queue_commands([command])
+            return
+        previous_value = toggled_value(self._state)
+        await self._queue_commands(
+            [command],
+            expected_state=lambda state: toggled_value(state) != previous_value,
+        )
@@ -42,19 +42,19 @@ class ArtsaunaStateMixin:
 
     @property
     def is_external_light_on(self) -> bool:
-        return self._state.light % 2 == 1
+        return self._state.is_external_light_on
 
     @property
     def is_internal_light_on(self) -> bool:
-        return self._state.light > 2
+        return self._state.is_internal_light_on
 
     @property
     def is_rgb_on(self) -> bool:
-        return self._state.rgb != 6
+        return self._state.is_rgb_on
 
     @property
     def is_light_on(self) -> bool:
-        return self.is_external_light_on or self.is_internal_light_on or self.is_rgb_on
+        return self._state.is_light_on
 
     @property
     def fm_frequency(self) -> float:
@@ -62,11 +62,11 @@ class ArtsaunaStateMixin:
 
     @property
     def is_power_on(self) -> bool:
-        return self._state.state != 5
+        return self._state.is_power_on
 
     @property
     def is_heating_on(self) -> bool:
-        return (self._state.heating_state == 1) and (self._state.previous_state != 5)
+        return self._state.is_heating_on
 
     @property
     def remaining_time(self) -> int:
@@ -74,12 +74,12 @@ class ArtsaunaStateMixin:
 
     @property
     def is_unit_celsius(self) -> bool:
-        return self._state.unit_is_celsius == 0
+        return self._state.is_unit_celsius
 
     @property
     def is_fm_on(self) -> bool:
-        return self._state.state == 0
+        return self._state.is_fm_on
 
     @property
     def is_bt_on(self) -> bool:
-        return self._state.state == 1
+        return self._state.is_bt_on
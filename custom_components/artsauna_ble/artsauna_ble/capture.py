@@ -0,0 +1,205 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+#
+# Artsauna-BLE - integration for Home Assistant
+# Copyright (C) 2025 David & Philipp Aderbauer
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+
+from __future__ import annotations
+
+import asyncio
+import os
+import time
+from collections.abc import Iterable, Iterator
+from enum import IntEnum
+from pathlib import Path
+from struct import Struct
+from typing import TYPE_CHECKING, NamedTuple
+
+if TYPE_CHECKING:
+    from .artsauna_ble_adapter import ArtsaunaBLEAdapter
+
+CAPTURE_MAGIC = b"ARTSCAP1"
+# kind, monotonic timestamp in seconds, payload length
+RECORD_HEADER_STRUCT = Struct("<BdH")
+DEFAULT_MAX_BYTES = 256 * 1024
+DEFAULT_BACKUP_COUNT = 1
+# pending records are written to the file once they exceed this size
+FLUSH_THRESHOLD = 4096
+
+
+class CaptureKind(IntEnum):
+    """Direction of a captured packet."""
+
+    NOTIFICATION = 0
+    WRITE = 1
+
+
+class CaptureRecord(NamedTuple):
+    """A captured packet."""
+
+    kind: CaptureKind
+    timestamp: float
+    data: bytes
+
+
+class ArtsaunaCaptureWriter:
+    """Records raw notifications and writes to an append-only capture file.
+
+    Records are collected in memory and appended to the file in an executor,
+    the file is rotated like a `logging.handlers.RotatingFileHandler` once it
+    exceeds the maximum size. Every file starts with `CAPTURE_MAGIC` followed
+    by the records, each a `RECORD_HEADER_STRUCT` and the payload.
+    """
+
+    __slots__ = (
+        "_flush_lock",
+        "_flush_task",
+        "_pending",
+        "backup_count",
+        "max_bytes",
+        "path",
+        "record_count",
+    )
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        backup_count: int = DEFAULT_BACKUP_COUNT,
+    ) -> None:
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self.record_count = 0
+        self._pending = bytearray()
+        self._flush_lock = asyncio.Lock()
+        self._flush_task: asyncio.Task[None] | None = None
+
+    def record(self, kind: CaptureKind, data: bytes | bytearray) -> None:
+        """Capture a packet, must be called from the event loop."""
+        self._pending += RECORD_HEADER_STRUCT.pack(kind, time.monotonic(), len(data))
+        self._pending += data
+        self.record_count += 1
+        if len(self._pending) >= FLUSH_THRESHOLD and self._flush_task is None:
+            self._flush_task = asyncio.get_running_loop().create_task(
+                self._background_flush()
+            )
+
+    async def _background_flush(self) -> None:
+        try:
+            await self.async_flush()
+        finally:
+            self._flush_task = None
+
+    async def async_flush(self) -> None:
+        """Append the pending records to the capture file."""
+        async with self._flush_lock:
+            if not self._pending:
+                return
+            pending, self._pending = bytes(self._pending), bytearray()
+            await asyncio.get_running_loop().run_in_executor(
+                None, self._append, pending
+            )
+
+    def _append(self, data: bytes) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        size = self.path.stat().st_size if self.path.exists() else 0
+        if size and size + len(data) > self.max_bytes:
+            self._rotate()
+            size = 0
+        with self.path.open("ab") as file:
+            if not size:
+                file.write(CAPTURE_MAGIC)
+            file.write(data)
+
+    def _rotate(self) -> None:
+        if not self.backup_count:
+            self.path.unlink()
+            return
+        for index in range(self.backup_count - 1, 0, -1):
+            source = self._backup_path(index)
+            if source.exists():
+                source.replace(self._backup_path(index + 1))
+        self.path.replace(self._backup_path(1))
+
+    def _backup_path(self, index: int) -> Path:
+        return self.path.with_name(f"{self.path.name}.{index}")
+
+    def files(self) -> list[Path]:
+        """The existing capture files, oldest first."""
+        paths = [self._backup_path(index) for index in range(self.backup_count, 0, -1)]
+        paths.append(self.path)
+        return [path for path in paths if path.exists()]
+
+
+def read_capture(path: str | os.PathLike[str]) -> Iterator[CaptureRecord]:
+    """Read the records of a capture file.
+
+    Raises:
+        ValueError: If the file is not a capture or is truncated.
+    """
+    data = Path(path).read_bytes()
+    return parse_capture(data)
+
+
+def parse_capture(data: bytes) -> Iterator[CaptureRecord]:
+    """Parse the records of the content of a capture file.
+
+    Raises:
+        ValueError: If the content is not a capture or is truncated.
+    """
+    if not data.startswith(CAPTURE_MAGIC):
+        raise ValueError("Not an artsauna capture")
+    position = len(CAPTURE_MAGIC)
+    while position < len(data):
+        if position + RECORD_HEADER_STRUCT.size > len(data):
+            raise ValueError("Truncated capture record")
+        kind, timestamp, length = RECORD_HEADER_STRUCT.unpack_from(data, position)
+        position += RECORD_HEADER_STRUCT.size
+        if position + length > len(data):
+            raise ValueError("Truncated capture record")
+        yield CaptureRecord(
+            CaptureKind(kind), timestamp, data[position : position + length]
+        )
+        position += length
+
+
+async def replay_capture(
+    adapter: ArtsaunaBLEAdapter,
+    records: Iterable[CaptureRecord],
+    speed: float | None = 1.0,
+) -> int:
+    """Feed the captured notifications through the adapter.
+
+    The notifications are fed with their captured timing scaled by the speed,
+    or as fast as possible if the speed is None. Captured writes are skipped.
+    Returns the number of notifications fed.
+    """
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    first_timestamp: float | None = None
+    count = 0
+    for record in records:
+        if record.kind is not CaptureKind.NOTIFICATION:
+            continue
+        if speed is not None:
+            if first_timestamp is None:
+                first_timestamp = record.timestamp
+            delay = start + (record.timestamp - first_timestamp) / speed - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+        adapter._notification_handler(0, bytearray(record.data))
+        count += 1
+    return count
@@ -0,0 +1,88 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+#
+# Artsauna-BLE - integration for Home Assistant
+# Copyright (C) 2025 David & Philipp Aderbauer
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True, slots=True)
+class SignificantChange:
+    """Smallest change of a value that is worth writing.
+
+    A numeric value is significant once it changed by `absolute` or by
+    `relative` times the last written value. Without thresholds every change
+    is significant. After `heartbeat` seconds any value is written again.
+    """
+
+    absolute: float = 0.0
+    relative: float = 0.0
+    heartbeat: float | None = None
+
+    def is_significant(self, previous: object, value: object) -> bool:
+        """Whether `value` differs significantly from `previous`."""
+        if value == previous:
+            return False
+        if (
+            not (self.absolute or self.relative)
+            or not isinstance(value, int | float)
+            or not isinstance(previous, int | float)
+        ):
+            return True
+        delta = abs(value - previous)
+        return bool(
+            (self.absolute and delta >= self.absolute)
+            or (self.relative and delta >= self.relative * abs(previous))
+        )
+
+
+class SignificantChangeFilter:
+    """Suppress the writes of insignificant changes and count the decisions."""
+
+    __slots__ = ("_last_time", "_last_value", "change", "emitted", "suppressed")
+
+    def __init__(self, change: SignificantChange) -> None:
+        self.change = change
+        self.emitted = 0
+        self.suppressed = 0
+        self._last_time: float | None = None
+        self._last_value: object = None
+
+    def should_write(self, value: object, now: float, force: bool = False) -> bool:
+        """Whether `value` is written at `now`, forced writes always are."""
+        if not (
+            force
+            or self._last_time is None
+            or self.change.is_significant(self._last_value, value)
+            or self.heartbeat_delay(now) == 0
+        ):
+            self.suppressed += 1
+            return False
+        self.emitted += 1
+        self._last_time = now
+        self._last_value = value
+        return True
+
+    def heartbeat_delay(self, now: float) -> float | None:
+        """Seconds until the heartbeat is due, None without heartbeat."""
+        if self.change.heartbeat is None or self._last_time is None:
+            return None
+        return max(0.0, self._last_time + self.change.heartbeat - now)
+
+    def as_dict(self) -> dict[str, int]:
+        return {"emitted": self.emitted, "suppressed": self.suppressed}
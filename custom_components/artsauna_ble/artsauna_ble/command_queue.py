@@ -0,0 +1,166 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+#
+# Artsauna-BLE - integration for Home Assistant
+# Copyright (C) 2025 David & Philipp Aderbauer
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+
+from .exceptions import ArtsaunaCommandError
+
+
+class ArtsaunaCommandQueue:
+    """Queue that writes commands in bursts.
+
+    All commands queued until the queue gets its turn in the event loop or
+    while a burst is being written are merged into one burst. A burst is
+    written in order by a single call of the send function.
+
+    Commands queued with a key supersede pending commands with the same key,
+    so only the latest of them is written. Commands without key are written
+    in strict FIFO order.
+
+    Commands may carry a deadline. The send function gets the earliest
+    deadline of the burst and has to give up once it has passed. Commands
+    that expired while queued are failed without being written, so the
+    bursts behind them get their turn.
+    """
+
+    __slots__ = ("_drain_task", "_pending", "_send")
+
+    def __init__(
+        self, send: Callable[[list[bytes], float | None], Awaitable[None]]
+    ) -> None:
+        self._send = send
+        self._pending: list[_QueuedCommands] = []
+        self._drain_task: asyncio.Task[None] | None = None
+
+    def __len__(self) -> int:
+        return sum(len(queued.commands) for queued in self._pending)
+
+    def put(
+        self,
+        commands: list[bytes],
+        key: str | None = None,
+        deadline: float | None = None,
+    ) -> asyncio.Future[None]:
+        """Queue commands, the future is done once they or their successor are written.
+
+        The deadline is in event loop time.
+        """
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[None] = loop.create_future()
+        futures = [future]
+        if key is not None:
+            for index, queued in enumerate(self._pending):
+                if queued.key == key:
+                    futures = [*self._pending.pop(index).futures, future]
+                    break
+        self._pending.append(_QueuedCommands(key, commands, futures, deadline))
+        if self._drain_task is None:
+            self._drain_task = loop.create_task(self._drain())
+        return future
+
+    def cancel(self) -> None:
+        """Drop all queued commands."""
+        if self._drain_task is not None:
+            # a task cancelled before it ran never reaches its finally block
+            self._drain_task.cancel()
+            self._drain_task = None
+        for queued in self._pending:
+            queued.cancel()
+        self._pending = []
+
+    async def _drain(self) -> None:
+        try:
+            while self._pending:
+                burst = self._take_burst()
+                if not burst:
+                    continue
+                deadline = min(
+                    (
+                        queued.deadline
+                        for queued in burst
+                        if queued.deadline is not None
+                    ),
+                    default=None,
+                )
+                try:
+                    await self._send(
+                        [command for queued in burst for command in queued.commands],
+                        deadline,
+                    )
+                except asyncio.CancelledError:
+                    for queued in burst:
+                        queued.cancel()
+                    raise
+                except Exception as exc:  # noqa: BLE001
+                    for queued in burst:
+                        queued.set_exception(exc)
+                else:
+                    for queued in burst:
+                        queued.set_result()
+        finally:
+            if self._drain_task is asyncio.current_task():
+                self._drain_task = None
+
+    def _take_burst(self) -> list[_QueuedCommands]:
+        """Take the pending commands and fail those that are already expired."""
+        burst, self._pending = self._pending, []
+        now = asyncio.get_running_loop().time()
+        live = []
+        for queued in burst:
+            if queued.deadline is not None and queued.deadline <= now:
+                queued.set_exception(
+                    ArtsaunaCommandError("Commands expired before they were written")
+                )
+            else:
+                live.append(queued)
+        return live
+
+
+class _QueuedCommands:
+    """Commands in the queue with the futures of everyone waiting for them."""
+
+    __slots__ = ("commands", "deadline", "futures", "key")
+
+    def __init__(
+        self,
+        key: str | None,
+        commands: list[bytes],
+        futures: list[asyncio.Future[None]],
+        deadline: float | None,
+    ) -> None:
+        self.key = key
+        self.commands = commands
+        self.futures = futures
+        self.deadline = deadline
+
+    def set_result(self) -> None:
+        for future in self.futures:
+            if not future.done():
+                future.set_result(None)
+
+    def set_exception(self, exc: Exception) -> None:
+        for future in self.futures:
+            if not future.done():
+                future.set_exception(exc)
+
+    def cancel(self) -> None:
+        for future in self.futures:
+            future.cancel()
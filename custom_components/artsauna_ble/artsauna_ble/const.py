@@ -20,61 +20,57 @@ from uuid import UUID
 
 from bidict import bidict
 
+from .protocol import (
+    AUTH_FRAME,
+    FM_FRAME_LENGTH,
+    FM_FRAME_START,
+    RGB_FRAMES,
+    STATE_FRAME_LENGTH,
+    STATE_FRAME_START,
+    CommandCode,
+    command_frame,
+)
+
 CHARACTERISTIC_WRITE = UUID("0000ae01-0000-1000-8000-00805f9b34fb")
 CHARACTERISTIC_NOTIFY = UUID("0000ae03-0000-1000-8000-00805f9b34fb")
 
-CMD_APP_AUTH = b"\xff\xaa\x05ASOK3"
-CMD_TOGGLE_POWER = b"\xff\xaa\x05ZG\x0e\x00\xb4"
-CMD_TOGGLE_HEATING = b"\xff\xaa\x05ZG\x00\x02\xa8"
-CMD_TEMP_UP = b"\xff\xaa\x05ZG\x06\x00\xac"
-CMD_TEMP_DOWN = b"\xff\xaa\x05ZG\x07\x00\xad"
-CMD_VOLUME_PREFIX = b"\xff\xaa\x05ZG\r"
-CMD_TIME_UP = b"\xff\xaa\x05ZG\x08\x00\xae"
-CMD_TIME_DOWN = b"\xff\xaa\x05ZG\t\x00\xaf"
-CMD_RGB_PREFIX = b"\xff\xaa\x05ZG\n"
-CMD_RGB_1 = b"\xff\xaa\x05ZG\n\x00\xb0"  # internal: 8
-CMD_RGB_2 = b"\xff\xaa\x05ZG\n\x01\xb1"  # 0
-CMD_RGB_3 = b"\xff\xaa\x05ZG\n\x02\xb2"  # 1
-CMD_RGB_4 = b"\xff\xaa\x05ZG\n\x03\xb3"  # 2
-CMD_RGB_5 = b"\xff\xaa\x05ZG\n\x04\xb4"  # 3
-CMD_RGB_6 = b"\xff\xaa\x05ZG\n\x05\xb5"  # 4
-CMD_RGB_7 = b"\xff\xaa\x05ZG\n\x06\xb6"  # 5
-CMD_RGB_8 = b"\xff\xaa\x05ZG\n\x07\xb7"  # 6
-CMD_RGB_9 = b"\xff\xaa\x05ZG\n\x08\xb8"  # 7
-CMD_RGB_WHITE = CMD_RGB_1
-CMD_RGB_GREEN = CMD_RGB_2
-CMD_RGB_RED = CMD_RGB_3
-CMD_RGB_BLUE = CMD_RGB_4
-CMD_RGB_YELLOW = CMD_RGB_5
-CMD_RGB_CYAN = CMD_RGB_6
-CMD_RGB_PINK = CMD_RGB_7
-CMD_RGB_OFF = CMD_RGB_8
-CMD_RGB_RAINBOW = CMD_RGB_9
-CMD_TOGGLE_EXTERNAL_LIGHT = b"\xff\xaa\x05ZG\x0b\x00\xb1"
-CMD_TOGGLE_INTERNAL_LIGHT = b"\xff\xaa\x05ZG\x0c\x00\xb2"
-CMD_TOGGLE_FM = b"\xff\xaa\x05ZG\x01\x00\xa7"
-CMD_TOGGLE_BT = b"\xff\xaa\x05ZG\x02\x00\xa8"
-CMD_TOGGLE_AUX = b"\xff\xaa\x05ZG\x04\x00\xaa"
-CMD_TOGGLE_USB = b"\xff\xaa\x05ZG\x03\x00\xa9"
-CMD_TOGGLE_UNIT = b"\xff\xaa\x05ZG\x05\x00\xab"
+# the command frames are generated from the tables in protocol.py
+CMD_APP_AUTH = AUTH_FRAME
+CMD_TOGGLE_POWER = command_frame(CommandCode.POWER)
+CMD_TOGGLE_HEATING = command_frame(CommandCode.HEATING)
+CMD_TEMP_UP = command_frame(CommandCode.TEMP_UP)
+CMD_TEMP_DOWN = command_frame(CommandCode.TEMP_DOWN)
+CMD_TIME_UP = command_frame(CommandCode.TIME_UP)
+CMD_TIME_DOWN = command_frame(CommandCode.TIME_DOWN)
+CMD_RGB_1, CMD_RGB_2, CMD_RGB_3, CMD_RGB_4, CMD_RGB_5 = RGB_FRAMES[:5]
+CMD_RGB_6, CMD_RGB_7, CMD_RGB_8, CMD_RGB_9 = RGB_FRAMES[5:]
+CMD_RGB_WHITE = CMD_RGB_1  # internal: 8
+CMD_RGB_GREEN = CMD_RGB_2  # 0
+CMD_RGB_RED = CMD_RGB_3  # 1
+CMD_RGB_BLUE = CMD_RGB_4  # 2
+CMD_RGB_YELLOW = CMD_RGB_5  # 3
+CMD_RGB_CYAN = CMD_RGB_6  # 4
+CMD_RGB_PINK = CMD_RGB_7  # 5
+CMD_RGB_OFF = CMD_RGB_8  # 6
+CMD_RGB_RAINBOW = CMD_RGB_9  # 7
+CMD_TOGGLE_EXTERNAL_LIGHT = command_frame(CommandCode.EXTERNAL_LIGHT)
+CMD_TOGGLE_INTERNAL_LIGHT = command_frame(CommandCode.INTERNAL_LIGHT)
+CMD_TOGGLE_FM = command_frame(CommandCode.FM)
+CMD_TOGGLE_BT = command_frame(CommandCode.BT)
+CMD_TOGGLE_AUX = command_frame(CommandCode.AUX)
+CMD_TOGGLE_USB = command_frame(CommandCode.USB)
+CMD_TOGGLE_UNIT = command_frame(CommandCode.UNIT)
 
-DEVICE_STATE_BYTE_POSITION = -9
-HEATING_STATE_BYTE_POSITION = -8
-CURRENT_TEMP_BYTE_POSITION = -7
-TARGET_TEMP_BYTE_POSITION = -6
-TIME_BYTE_POSITION = -5
-UNIT_BYTE_POSITION = -4
-VOLUME_BYTE_POSITION = -3
-LIGHT_BYTE_POSITION = -2
-CHECKSUM_BYTE_POSITION = -1
-CHECKSUM_BYTES_SLICE = slice(-12, -1)
-FM_FREQUENCY_BYTES_SLICE = slice(-2, None)
+# keys of absolute commands, a newer command supersedes a pending one with the same key
+COMMAND_KEY_VOLUME = "volume"
+COMMAND_KEY_RGB = "rgb"
 
-STATE_NOTIFICATION_START = b"\xff\xaa"
-FM_NOTIFICATION_START = b"B\x02\x03\x00"
+STATE_NOTIFICATION_START = STATE_FRAME_START
+FM_NOTIFICATION_START = FM_FRAME_START
 
-STATE_NOTIFICATION_REGEX = STATE_NOTIFICATION_START + b".{12}"
-FM_NOTIFICATION_REGEX = FM_NOTIFICATION_START + b".{2}"
+STATE_NOTIFICATION_LENGTH = STATE_FRAME_LENGTH
+FM_NOTIFICATION_LENGTH = FM_FRAME_LENGTH
+NOTIFICATION_BUFFER_HIGH_WATER_MARK = 4 * STATE_NOTIFICATION_LENGTH
 
 UNIT_BYTES_MAP = {0: "Celsius", 1: "Fahrenheit"}
 DEVICE_STATE_BYTES_MAP = {5: "OFF", 4: "ON", 0: "RADIO", 1: "AUX/BT", 3: "USB"}
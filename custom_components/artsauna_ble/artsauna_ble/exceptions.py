@@ -0,0 +1,28 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+#
+# Artsauna-BLE - integration for Home Assistant
+# Copyright (C) 2025 David & Philipp Aderbauer
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+
+
+class ArtsaunaError(Exception):
+    """Base class of the errors raised by the library."""
+
+
+class ArtsaunaCommandError(ArtsaunaError):
+    """Commands could not be written within their deadline or retry budget.
+
+    The error is final, it is not retried like the BLE errors.
+    """
@@ -0,0 +1,119 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+#
+# Artsauna-BLE - integration for Home Assistant
+# Copyright (C) 2025 David & Philipp Aderbauer
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+
+from __future__ import annotations
+
+from enum import IntEnum
+
+from .const import (
+    FM_NOTIFICATION_LENGTH,
+    FM_NOTIFICATION_START,
+    NOTIFICATION_BUFFER_HIGH_WATER_MARK,
+    STATE_NOTIFICATION_LENGTH,
+    STATE_NOTIFICATION_START,
+)
+from .protocol import has_valid_checksum
+
+# bytes that have to be kept at the end of the buffer
+# as they may be the beginning of a header that is not complete yet
+_HEADER_TAIL_LENGTH = max(len(STATE_NOTIFICATION_START), len(FM_NOTIFICATION_START)) - 1
+
+
+class FrameType(IntEnum):
+    """Type of a frame received from the Artsauna."""
+
+    STATE = 0
+    FM = 1
+
+
+class ArtsaunaFrameDecoder:
+    """Incremental decoder for the Artsauna notification stream.
+
+    Packets are appended to a bounded buffer and every complete frame is
+    extracted in one pass. State frames with a bad checksum are skipped by
+    resyncing on the next header, bytes that can never be part of a frame
+    are dropped.
+    """
+
+    __slots__ = ("_buffer", "dropped_bytes", "frame_count", "resync_count")
+
+    def __init__(self) -> None:
+        self._buffer = bytearray()
+        self.frame_count = 0
+        self.resync_count = 0
+        self.dropped_bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._buffer)
+
+    def feed(self, data: bytes | bytearray) -> list[tuple[FrameType, bytes]]:
+        """Add a packet to the buffer and return all completed frames in order."""
+        buffer = self._buffer
+        buffer += data
+        frames: list[tuple[FrameType, bytes]] = []
+        view = memoryview(buffer)
+        position = 0
+        try:
+            while True:
+                state_start = buffer.find(STATE_NOTIFICATION_START, position)
+                fm_start = buffer.find(FM_NOTIFICATION_START, position)
+                if state_start < 0 and fm_start < 0:
+                    # no header left, only keep what may be the start of one
+                    junk_end = max(position, len(buffer) - _HEADER_TAIL_LENGTH)
+                    self.dropped_bytes += junk_end - position
+                    position = junk_end
+                    break
+                if fm_start < 0 or 0 <= state_start < fm_start:
+                    start = state_start
+                    frame_type = FrameType.STATE
+                    frame_length = STATE_NOTIFICATION_LENGTH
+                else:
+                    start = fm_start
+                    frame_type = FrameType.FM
+                    frame_length = FM_NOTIFICATION_LENGTH
+
+                self.dropped_bytes += start - position
+                position = start
+                if len(buffer) - start < frame_length:
+                    # wait for the rest of the frame
+                    break
+
+                with view[start : start + frame_length] as frame:
+                    if frame_type is FrameType.STATE and not has_valid_checksum(frame):
+                        # the header was part of garbage, resync behind it
+                        self.resync_count += 1
+                        self.dropped_bytes += 1
+                        position = start + 1
+                        continue
+                    frames.append((frame_type, frame.tobytes()))
+                self.frame_count += 1
+                position = start + frame_length
+        finally:
+            view.release()
+
+        del buffer[:position]
+        overflow = len(buffer) - NOTIFICATION_BUFFER_HIGH_WATER_MARK
+        if overflow > 0:
+            del buffer[:overflow]
+            self.dropped_bytes += overflow
+        return frames
+
+    def reset(self) -> None:
+        """Drop all buffered data, e.g. after a reconnect."""
+        self.dropped_bytes += len(self._buffer)
+        self._buffer.clear()
@@ -0,0 +1,101 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+#
+# Artsauna-BLE - integration for Home Assistant
+# Copyright (C) 2025 David & Philipp Aderbauer
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+
+from __future__ import annotations
+
+from bisect import bisect_left
+
+# upper bounds of the buckets in seconds, the last bucket is unbounded
+DEFAULT_BUCKET_BOUNDS = (
+    0.01,
+    0.02,
+    0.05,
+    0.1,
+    0.2,
+    0.5,
+    1.0,
+    2.0,
+    5.0,
+    10.0,
+    20.0,
+    30.0,
+    60.0,
+)
+
+
+class LatencyHistogram:
+    """Histogram of latencies with fixed buckets.
+
+    Memory does not grow with the number of samples, quantiles are
+    interpolated linearly within their bucket.
+    """
+
+    __slots__ = ("_bounds", "_counts", "count", "max", "total")
+
+    def __init__(self, bounds: tuple[float, ...] = DEFAULT_BUCKET_BOUNDS) -> None:
+        self._bounds = bounds
+        self._counts = [0] * (len(bounds) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def record(self, seconds: float) -> None:
+        """Add a sample."""
+        self._counts[bisect_left(self._bounds, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+
+    def quantile(self, q: float) -> float | None:
+        """Estimate the q-quantile, None without samples."""
+        if not self.count:
+            return None
+        rank = q * self.count
+        cumulative = 0
+        for index, bucket_count in enumerate(self._counts):
+            if not bucket_count or cumulative + bucket_count < rank:
+                cumulative += bucket_count
+                continue
+            lower = self._bounds[index - 1] if index else 0.0
+            # the overflow bucket ends at the largest sample
+            upper = self._bounds[index] if index < len(self._bounds) else self.max
+            upper = min(upper, self.max)
+            return lower + (upper - lower) * (rank - cumulative) / bucket_count
+        return self.max
+
+    @property
+    def mean(self) -> float | None:
+        """Mean of the samples, None without samples."""
+        return self.total / self.count if self.count else None
+
+    def as_dict(self) -> dict[str, object]:
+        """Summary and bucket counts, for the diagnostics."""
+        return {
+            "count": self.count,
+            "mean": self.mean,
+            "p50": self.quantile(0.5),
+            "p95": self.quantile(0.95),
+            "max": self.max,
+            "buckets": {
+                **{
+                    f"le_{bound}": count
+                    for bound, count in zip(self._bounds, self._counts, strict=False)
+                },
+                "overflow": self._counts[-1],
+            },
+        }
@@ -18,12 +18,30 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
+from enum import IntFlag
 
-from . import const
+from . import protocol
 
 
-@dataclass(frozen=True)
+class ArtsaunaField(IntFlag):
+    """Fields of the `ArtsaunaState`, used as bitmask of changes."""
+
+    STATE = 1 << 0
+    PREVIOUS_STATE = 1 << 1
+    HEATING_STATE = 1 << 2
+    TARGET_TEMP = 1 << 3
+    CURRENT_TEMP = 1 << 4
+    REMAINING_TIME = 1 << 5
+    UNIT_IS_CELSIUS = 1 << 6
+    VOLUME = 1 << 7
+    LIGHT = 1 << 8
+    RGB = 1 << 9
+    FM_FREQUENCY = 1 << 10
+    ALL = (1 << 11) - 1
+
+
+@dataclass(frozen=True, slots=True)
 class ArtsaunaState:
     """State of the Artsauna as communicated via BLE.
 
@@ -44,39 +62,99 @@ class ArtsaunaState:
     rgb: int = 0
     fm_frequency: int = 0
 
+    @property
+    def is_external_light_on(self) -> bool:
+        return self.light % 2 == 1
+
+    @property
+    def is_internal_light_on(self) -> bool:
+        return self.light > 2
+
+    @property
+    def is_rgb_on(self) -> bool:
+        return self.rgb != 6
+
+    @property
+    def is_light_on(self) -> bool:
+        return self.is_external_light_on or self.is_internal_light_on or self.is_rgb_on
+
+    @property
+    def is_power_on(self) -> bool:
+        return self.state != 5
+
+    @property
+    def is_heating_on(self) -> bool:
+        return (self.heating_state == 1) and (self.previous_state != 5)
+
+    @property
+    def is_unit_celsius(self) -> bool:
+        return self.unit_is_celsius == 0
+
+    @property
+    def is_fm_on(self) -> bool:
+        return self.state == 0
+
+    @property
+    def is_bt_on(self) -> bool:
+        return self.state == 1
+
+    def changed_fields(self, other: ArtsaunaState) -> ArtsaunaField:
+        """Get the bitmask of the fields that differ between this and another state."""
+        mask = 0
+        for name, flag in _FIELD_FLAGS:
+            if getattr(self, name) != getattr(other, name):
+                mask |= flag
+        return ArtsaunaField(mask)
+
     @staticmethod
-    def validate_ble_state_data(data: bytearray) -> bool:
-        return sum(data[const.CHECKSUM_BYTES_SLICE]) % 256 == int(
-            data[const.CHECKSUM_BYTE_POSITION]
-        )
+    def validate_ble_state_data(data: bytes | bytearray) -> bool:
+        return protocol.has_valid_checksum(data)
 
-    def new_from_ble_state_data(self, ble_state_data: bytearray) -> ArtsaunaState:
+    def new_from_ble_state_data(
+        self, ble_state_data: bytes | bytearray
+    ) -> ArtsaunaState:
+        (
+            state,
+            heating_state,
+            target_temp,
+            current_temp,
+            remaining_time,
+            unit_is_celsius,
+            volume,
+            light,
+            rgb,
+        ) = protocol.decode_state(ble_state_data)
         return ArtsaunaState(
-            state=int(ble_state_data[const.DEVICE_STATE_BYTE_POSITION]),
-            previous_state=self.state,
-            heating_state=int(ble_state_data[const.HEATING_STATE_BYTE_POSITION]),
-            target_temp=int(ble_state_data[const.TARGET_TEMP_BYTE_POSITION]),
-            current_temp=int(ble_state_data[const.CURRENT_TEMP_BYTE_POSITION]),
-            remaining_time=int(ble_state_data[const.TIME_BYTE_POSITION]),
-            unit_is_celsius=int(ble_state_data[const.UNIT_BYTE_POSITION]),
-            volume=int(ble_state_data[const.VOLUME_BYTE_POSITION]),
-            light=int(ble_state_data[const.LIGHT_BYTE_POSITION].to_bytes().hex()[0])
-            % 4,
-            rgb=int(ble_state_data[const.LIGHT_BYTE_POSITION].to_bytes().hex()[1]),
-            fm_frequency=self.fm_frequency,
+            state,
+            self.state,
+            heating_state,
+            target_temp,
+            current_temp,
+            remaining_time,
+            unit_is_celsius,
+            volume,
+            light,
+            rgb,
+            self.fm_frequency,
         )
 
-    def new_from_ble_fm_data(self, ble_fm_data: bytearray) -> ArtsaunaState:
+    def new_from_ble_fm_data(self, ble_fm_data: bytes | bytearray) -> ArtsaunaState:
         return ArtsaunaState(
-            state=self.state,
-            previous_state=self.state,
-            heating_state=self.heating_state,
-            target_temp=self.target_temp,
-            current_temp=self.current_temp,
-            remaining_time=self.remaining_time,
-            unit_is_celsius=self.unit_is_celsius,
-            volume=self.volume,
-            light=self.light,
-            rgb=self.rgb,
-            fm_frequency=int.from_bytes(ble_fm_data[const.FM_FREQUENCY_BYTES_SLICE]),
+            self.state,
+            self.state,
+            self.heating_state,
+            self.target_temp,
+            self.current_temp,
+            self.remaining_time,
+            self.unit_is_celsius,
+            self.volume,
+            self.light,
+            self.rgb,
+            protocol.decode_fm(ble_fm_data),
         )
+
+
+_FIELD_FLAGS = tuple(
+    (field.name, ArtsaunaField[field.name.upper()].value)
+    for field in fields(ArtsaunaState)
+)
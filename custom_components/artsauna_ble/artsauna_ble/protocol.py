@@ -0,0 +1,253 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+#
+# Artsauna-BLE - integration for Home Assistant
+# Copyright (C) 2025 David & Philipp Aderbauer
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+
+"""Declarative tables of the Artsauna BLE protocol.
+
+The command frames and lookup tables are generated from the tables once at
+import, the hot paths only index into them.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping, Sequence
+from enum import IntEnum
+from operator import itemgetter
+from struct import Struct
+from types import MappingProxyType
+from typing import NamedTuple
+
+FRAME_HEADER = b"\xff\xaa"
+
+# payload of the authentication, the only command outside of the ZG group
+AUTH_PAYLOAD = b"\x05ASOK"
+# payload of the commands before the command byte and the argument
+COMMAND_PAYLOAD_PREFIX = b"\x05ZG"
+
+
+class CommandCode(IntEnum):
+    """Command byte of the sauna commands."""
+
+    HEATING = 0x00
+    FM = 0x01
+    BT = 0x02
+    USB = 0x03
+    AUX = 0x04
+    UNIT = 0x05
+    TEMP_UP = 0x06
+    TEMP_DOWN = 0x07
+    TIME_UP = 0x08
+    TIME_DOWN = 0x09
+    RGB = 0x0A
+    EXTERNAL_LIGHT = 0x0B
+    INTERNAL_LIGHT = 0x0C
+    VOLUME = 0x0D
+    POWER = 0x0E
+
+
+# arguments of each command, toggles and steps are sent with the first one
+COMMAND_ARGUMENTS: Mapping[CommandCode, range | tuple[int, ...]] = {
+    CommandCode.HEATING: (2,),
+    CommandCode.FM: (0,),
+    CommandCode.BT: (0,),
+    CommandCode.USB: (0,),
+    CommandCode.AUX: (0,),
+    CommandCode.UNIT: (0,),
+    CommandCode.TEMP_UP: (0,),
+    CommandCode.TEMP_DOWN: (0,),
+    CommandCode.TIME_UP: (0,),
+    CommandCode.TIME_DOWN: (0,),
+    CommandCode.RGB: range(9),
+    CommandCode.EXTERNAL_LIGHT: (0,),
+    CommandCode.INTERNAL_LIGHT: (0,),
+    CommandCode.VOLUME: range(41),
+    CommandCode.POWER: (0,),
+}
+
+
+class StateField(NamedTuple):
+    """Field of the `ArtsaunaState` stored in the bits of a byte of the state frame."""
+
+    name: str
+    # position of the byte from the end of the frame
+    offset: int
+    # position and mask of the bits of the field in its byte
+    shift: int = 0
+    mask: int = 0xFF
+
+
+# in the order of the `ArtsaunaState` fields,
+# the fields sharing a byte follow the fields with a byte of their own
+STATE_FIELDS = (
+    StateField("state", -9),
+    StateField("heating_state", -8),
+    StateField("target_temp", -6),
+    StateField("current_temp", -7),
+    StateField("remaining_time", -5),
+    StateField("unit_is_celsius", -4),
+    StateField("volume", -3),
+    StateField("light", -2, 4, 0x03),
+    StateField("rgb", -2, 0, 0x0F),
+)
+
+STATE_FRAME_START = FRAME_HEADER
+# payload of the state frame before the state bytes
+STATE_PAYLOAD_PREFIX = b"\x0bZG"
+STATE_FRAME_LENGTH = 14
+FM_FRAME_START = b"B\x02\x03\x00"
+FM_FRAME_LENGTH = 6
+# the FM frame ends with the frequency in 10 kHz
+FM_FREQUENCY_STRUCT = Struct(">H")
+
+
+def checksum(payload: bytes | bytearray | memoryview) -> int:
+    """Checksum of the bytes between the header and the checksum of a frame."""
+    return sum(payload) % 256
+
+
+def has_valid_checksum(frame: bytes | bytearray | memoryview) -> bool:
+    """Whether the last byte of a frame with header is its checksum."""
+    return checksum(frame[len(FRAME_HEADER) : -1]) == frame[-1]
+
+
+def _build_frame(payload: bytes) -> bytes:
+    frame = FRAME_HEADER + payload + bytes([checksum(payload)])
+    if not has_valid_checksum(frame):
+        raise ValueError(f"Invalid checksum of the frame {frame!r}")
+    return frame
+
+
+def _build_command_frames() -> Mapping[CommandCode, Mapping[int, bytes]]:
+    frames = {
+        code: MappingProxyType(
+            {
+                argument: _build_frame(COMMAND_PAYLOAD_PREFIX + bytes([code, argument]))
+                for argument in arguments
+            }
+        )
+        for code, arguments in COMMAND_ARGUMENTS.items()
+    }
+    all_frames = [
+        frame for by_argument in frames.values() for frame in by_argument.values()
+    ]
+    if len(set(all_frames)) != len(all_frames):
+        raise ValueError("Two commands share the same frame")
+    return MappingProxyType(frames)
+
+
+# RGB value of the state set by each argument of the RGB command,
+# the first color of the commands is the last one of the state
+RGB_STATE_VALUES = tuple(
+    (argument - 1) % len(COMMAND_ARGUMENTS[CommandCode.RGB])
+    for argument in COMMAND_ARGUMENTS[CommandCode.RGB]
+)
+
+AUTH_FRAME = _build_frame(AUTH_PAYLOAD)
+# frame of every command and argument
+COMMAND_FRAMES = _build_command_frames()
+# frames of the absolute commands by argument
+VOLUME_FRAMES = tuple(COMMAND_FRAMES[CommandCode.VOLUME].values())
+RGB_FRAMES = tuple(COMMAND_FRAMES[CommandCode.RGB].values())
+
+
+def command_frame(code: CommandCode, argument: int | None = None) -> bytes:
+    """Frame of a command, by default with its first argument."""
+    by_argument = COMMAND_FRAMES[code]
+    if argument is None:
+        return next(iter(by_argument.values()))
+    try:
+        return by_argument[argument]
+    except KeyError:
+        raise ValueError(f"Invalid argument {argument} of {code.name}") from None
+
+
+STATE_FIELD_NAMES = tuple(field.name for field in STATE_FIELDS)
+
+
+def _build_state_decoding() -> tuple[
+    itemgetter[bytes | bytearray | memoryview],
+    tuple[tuple[int, tuple[tuple[int, ...], ...]], ...],
+]:
+    byte_fields = [field for field in STATE_FIELDS if field.mask == 0xFF]
+    shared_fields = STATE_FIELDS[len(byte_fields) :]
+    if byte_fields != list(STATE_FIELDS[: len(byte_fields)]):
+        raise ValueError("The fields sharing a byte must follow the other fields")
+    shared_bytes: dict[int, list[StateField]] = {}
+    for field in shared_fields:
+        shared_bytes.setdefault(field.offset, []).append(field)
+    if [field for fields in shared_bytes.values() for field in fields] != list(
+        shared_fields
+    ):
+        raise ValueError("The fields sharing a byte must be listed together")
+    for fields in shared_bytes.values():
+        used_bits = 0
+        for field in fields:
+            bits = field.mask << field.shift
+            if bits & used_bits or bits > 0xFF:
+                raise ValueError(f"The bits of {field.name} overlap or exceed its byte")
+            used_bits |= bits
+    return itemgetter(*(field.offset for field in byte_fields)), tuple(
+        (
+            offset,
+            tuple(
+                tuple((byte >> field.shift) & field.mask for field in fields)
+                for byte in range(256)
+            ),
+        )
+        for offset, fields in shared_bytes.items()
+    )
+
+
+# the bytes of the fields with a byte of their own, the values of the fields
+# sharing a byte by the offset and the value of that byte
+_state_bytes, _SHARED_BYTE_VALUES = _build_state_decoding()
+_STATE_PAYLOAD_LENGTH = STATE_FRAME_LENGTH - len(FRAME_HEADER) - 1
+
+
+def decode_state(frame: bytes | bytearray | memoryview) -> tuple[int, ...]:
+    """Decode the fields of a state frame in the order of `STATE_FIELDS`."""
+    values = _state_bytes(frame)
+    for offset, shared_values in _SHARED_BYTE_VALUES:
+        values += shared_values[frame[offset]]
+    return values
+
+
+def encode_state(values: Sequence[int]) -> bytes:
+    """Encode the fields in the order of `STATE_FIELDS` into a state frame."""
+    if len(values) != len(STATE_FIELDS):
+        raise ValueError(f"Expected {len(STATE_FIELDS)} state values, got {values}")
+    payload = bytearray(STATE_PAYLOAD_PREFIX)
+    payload += bytes(_STATE_PAYLOAD_LENGTH - len(payload))
+    for field, value in zip(STATE_FIELDS, values):
+        if not 0 <= value <= field.mask:
+            raise ValueError(f"Invalid value {value} of {field.name}")
+        # the offset counts from the checksum after the payload
+        payload[field.offset + 1] |= value << field.shift
+    return _build_frame(bytes(payload))
+
+
+def decode_fm(frame: bytes | bytearray | memoryview) -> int:
+    """Decode the frequency of an FM frame."""
+    (fm_frequency,) = FM_FREQUENCY_STRUCT.unpack_from(
+        frame, len(frame) - FM_FREQUENCY_STRUCT.size
+    )
+    return fm_frequency
+
+
+def encode_fm(fm_frequency: int) -> bytes:
+    """Encode a frequency in 10 kHz into an FM frame."""
+    return FM_FRAME_START + FM_FREQUENCY_STRUCT.pack(fm_frequency)
@@ -0,0 +1,118 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+#
+# Artsauna-BLE - integration for Home Assistant
+# Copyright (C) 2025 David & Philipp Aderbauer
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from typing import NamedTuple
+
+HOUR = timedelta(hours=1)
+
+
+class HourlyAggregate(NamedTuple):
+    """Time weighted statistics of a value over an hour."""
+
+    start: datetime
+    mean: float
+    min: float
+    max: float
+
+
+class _Hour:
+    """Accumulator of the samples within an hour."""
+
+    __slots__ = ("duration", "integral", "max", "min")
+
+    def __init__(self, value: float) -> None:
+        self.duration = 0.0
+        self.integral = 0.0
+        self.min = value
+        self.max = value
+
+    def add(self, value: float, duration: float = 0.0) -> None:
+        self.duration += duration
+        self.integral += value * duration
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+
+
+class HourlySampleSeries:
+    """Time weighted hourly aggregates of a sampled value.
+
+    Every sample holds until the next one, so a value that only is sampled
+    when it changes is weighted by how long it lasted.
+    Memory is bounded by the hours since the last `take`.
+    """
+
+    __slots__ = ("_hours", "_last_time", "_last_value")
+
+    def __init__(self) -> None:
+        self._hours: dict[datetime, _Hour] = {}
+        self._last_time: datetime | None = None
+        self._last_value: float | None = None
+
+    def add(self, time: datetime, value: float | None) -> None:
+        """Add a sample, None pauses the series until the next value."""
+        self._advance(time)
+        self._last_value = value
+        if value is None:
+            return
+        start = _hour_start(time)
+        if (hour := self._hours.get(start)) is None:
+            self._hours[start] = _Hour(value)
+        else:
+            hour.add(value)
+
+    def take(self, time: datetime) -> list[HourlyAggregate]:
+        """Aggregates of the hours completed until `time`, oldest first.
+
+        Completed hours are forgotten. The current hour is kept until it is
+        complete, so every hour is taken once with all of its samples.
+        Hours without sampled duration are left out.
+        """
+        self._advance(time)
+        current = _hour_start(time)
+        aggregates = [
+            HourlyAggregate(start, hour.integral / hour.duration, hour.min, hour.max)
+            for start, hour in sorted(self._hours.items())
+            if start < current and hour.duration
+        ]
+        self._hours = {
+            start: hour for start, hour in self._hours.items() if start >= current
+        }
+        return aggregates
+
+    def _advance(self, time: datetime) -> None:
+        """Weight the last value by its duration up to `time`."""
+        if self._last_time is not None and time <= self._last_time:
+            return
+        start, self._last_time = self._last_time, time
+        if start is None or (value := self._last_value) is None:
+            return
+        while start < time:
+            hour_start = _hour_start(start)
+            end = min(time, hour_start + HOUR)
+            duration = (end - start).total_seconds()
+            if (hour := self._hours.get(hour_start)) is None:
+                hour = self._hours[hour_start] = _Hour(value)
+            hour.add(value, duration)
+            start = end
+
+
+def _hour_start(time: datetime) -> datetime:
+    return time.replace(minute=0, second=0, microsecond=0)
@@ -0,0 +1,174 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+#
+# Artsauna-BLE - integration for Home Assistant
+# Copyright (C) 2025 David & Philipp Aderbauer
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+import time
+from typing import Protocol
+
+DEFAULT_TIME_SLICE = 60.0
+
+
+class SlotHolder(Protocol):
+    """A device that holds a connection slot while it is connected."""
+
+    @property
+    def has_slot_priority(self) -> bool:
+        """Whether the device needs its connection more urgently than others."""
+
+    def yield_slot(self) -> None:
+        """Ask the device to disconnect to free its slot for a waiting device."""
+
+
+class ArtsaunaSlotScheduler:
+    """Admits connections of several devices under a shared slot limit.
+
+    Waiting devices with priority are admitted first, the others in the order
+    they started waiting. If devices are waiting and all slots are taken,
+    holders without priority are asked to yield their slot once they held it
+    for a time slice.
+    """
+
+    __slots__ = (
+        "_held",
+        "_preempt_handle",
+        "_sequence",
+        "_waiters",
+        "max_wait_time",
+        "preemption_count",
+        "slots",
+        "time_slice",
+        "total_wait_time",
+        "wait_count",
+    )
+
+    def __init__(
+        self, slots: int | None = None, time_slice: float = DEFAULT_TIME_SLICE
+    ) -> None:
+        # None admits every connection right away
+        self.slots = slots
+        self.time_slice = time_slice
+        self._held: dict[SlotHolder, float] = {}
+        self._waiters: list[tuple[int, SlotHolder, asyncio.Future[None]]] = []
+        self._sequence = itertools.count()
+        self._preempt_handle: asyncio.TimerHandle | None = None
+        self.wait_count = 0
+        self.total_wait_time = 0.0
+        self.max_wait_time = 0.0
+        self.preemption_count = 0
+
+    @property
+    def held(self) -> int:
+        """Number of slots in use."""
+        return len(self._held)
+
+    @property
+    def waiting(self) -> int:
+        """Number of devices waiting for a slot."""
+        return len(self._waiters)
+
+    @property
+    def mean_wait_time(self) -> float:
+        """Mean seconds devices waited for a slot."""
+        return self.total_wait_time / self.wait_count if self.wait_count else 0.0
+
+    async def acquire(self, holder: SlotHolder) -> float:
+        """Wait for a slot, returns the seconds waited."""
+        if holder in self._held:
+            return 0.0
+        start = time.monotonic()
+        if not self._waiters and self._has_free_slot():
+            self._held[holder] = start
+        else:
+            future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+            waiter = (next(self._sequence), holder, future)
+            self._waiters.append(waiter)
+            self._admit()
+            try:
+                await future
+            except BaseException:
+                if waiter in self._waiters:
+                    self._waiters.remove(waiter)
+                elif future.done() and not future.cancelled():
+                    # admitted while being cancelled, pass the slot on
+                    self.release(holder)
+                raise
+        wait_time = time.monotonic() - start
+        self.wait_count += 1
+        self.total_wait_time += wait_time
+        self.max_wait_time = max(self.max_wait_time, wait_time)
+        return wait_time
+
+    def release(self, holder: SlotHolder) -> None:
+        """Free the slot of the holder, does nothing if it holds none."""
+        if self._held.pop(holder, None) is not None:
+            self._admit()
+
+    def set_slots(self, slots: int | None) -> None:
+        """Change the slot limit."""
+        self.slots = slots
+        self._admit()
+
+    def _has_free_slot(self) -> bool:
+        return self.slots is None or len(self._held) < self.slots
+
+    def _admit(self) -> None:
+        """Admit waiters while slots are free, then preempt for the rest."""
+        while self._waiters and self._has_free_slot():
+            waiter = min(
+                self._waiters,
+                key=lambda waiter: (not waiter[1].has_slot_priority, waiter[0]),
+            )
+            self._waiters.remove(waiter)
+            _, holder, future = waiter
+            if future.done():
+                # cancelled, but its task has not resumed to remove it yet
+                continue
+            self._held[holder] = time.monotonic()
+            future.set_result(None)
+        if self._waiters:
+            self._preempt()
+
+    def _preempt(self) -> None:
+        """Ask the longest holder without priority to yield once its slice is over."""
+        if self._preempt_handle is not None:
+            self._preempt_handle.cancel()
+            self._preempt_handle = None
+        candidates = [
+            (since, holder)
+            for holder, since in self._held.items()
+            if not holder.has_slot_priority
+        ]
+        if not candidates:
+            return
+        since, holder = min(candidates, key=lambda candidate: candidate[0])
+        remaining = since + self.time_slice - time.monotonic()
+        if remaining > 0:
+            self._preempt_handle = asyncio.get_running_loop().call_later(
+                remaining, self._admit
+            )
+            return
+        self.preemption_count += 1
+        # restart its slice, it is asked again if it does not yield
+        self._held[holder] = time.monotonic()
+        self._preempt_handle = asyncio.get_running_loop().call_later(
+            self.time_slice, self._admit
+        )
+        holder.yield_slot()
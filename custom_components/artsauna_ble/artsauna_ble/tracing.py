@@ -0,0 +1,151 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+#
+# Artsauna-BLE - integration for Home Assistant
+# Copyright (C) 2025 David & Philipp Aderbauer
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+
+from __future__ import annotations
+
+from collections import deque
+from enum import IntEnum
+from time import perf_counter
+
+from .histogram import LatencyHistogram
+
+# upper bounds of the stage duration buckets in seconds
+TRACE_BUCKET_BOUNDS = (
+    0.00001,
+    0.00002,
+    0.00005,
+    0.0001,
+    0.0002,
+    0.0005,
+    0.001,
+    0.002,
+    0.005,
+    0.01,
+    0.1,
+    0.5,
+    1.0,
+    2.0,
+)
+DEFAULT_TRACE_CAPACITY = 100
+
+
+class PipelineStage(IntEnum):
+    """Stages of a notification on its way to the entity states.
+
+    The duration of a stage is the time since the previous stage reached.
+    """
+
+    RECEIVED = 0
+    # the frames are extracted from the notification buffer
+    PARSED = 1
+    # the frames are decoded into a state
+    DECODED = 2
+    # the callbacks passed the state to the coordinator
+    DISPATCHED = 3
+    # the coordinator debounce passed the changes on to the entities
+    PUBLISHED = 4
+    # all entities wrote their states
+    WRITTEN = 5
+
+
+class PipelineTrace:
+    """Timestamps of one notification passing through the pipeline."""
+
+    __slots__ = ("entity_times", "timestamps")
+
+    def __init__(self) -> None:
+        self.timestamps: list[float | None] = [None] * len(PipelineStage)
+        self.entity_times: list[tuple[str, float]] = []
+
+    def mark(self, stage: PipelineStage) -> None:
+        """Record that the stage is reached now."""
+        self.timestamps[stage] = perf_counter()
+
+    def stage_durations(self) -> dict[PipelineStage, float]:
+        """Durations of the reached stages."""
+        durations = {}
+        previous = None
+        for stage, timestamp in zip(PipelineStage, self.timestamps, strict=True):
+            if timestamp is None:
+                continue
+            if previous is not None:
+                durations[stage] = timestamp - previous
+            previous = timestamp
+        return durations
+
+    def as_dict(self) -> dict[str, object]:
+        return {
+            "stages": {
+                stage.name.lower(): duration
+                for stage, duration in self.stage_durations().items()
+            },
+            "entities": dict(self.entity_times),
+        }
+
+
+class ArtsaunaPipelineTracer:
+    """Keeps the recent pipeline traces and aggregates their stage durations.
+
+    The adapter starts a trace per notification and holds it as the current
+    trace while passing it on, so that a receiver can take it over and finish
+    it once its own stages are done. Traces nobody takes over are finished by
+    the adapter.
+    """
+
+    __slots__ = ("current", "entity_latency", "stage_latency", "traces")
+
+    def __init__(self, capacity: int = DEFAULT_TRACE_CAPACITY) -> None:
+        self.traces: deque[PipelineTrace] = deque(maxlen=capacity)
+        self.current: PipelineTrace | None = None
+        self.stage_latency = {
+            stage: LatencyHistogram(TRACE_BUCKET_BOUNDS)
+            for stage in PipelineStage
+            if stage is not PipelineStage.RECEIVED
+        }
+        self.entity_latency = LatencyHistogram(TRACE_BUCKET_BOUNDS)
+
+    def start(self) -> PipelineTrace:
+        """Start the trace of a new notification and make it the current one."""
+        trace = PipelineTrace()
+        trace.mark(PipelineStage.RECEIVED)
+        self.current = trace
+        return trace
+
+    def take(self) -> PipelineTrace | None:
+        """Take over the current trace, the taker has to finish it."""
+        trace, self.current = self.current, None
+        return trace
+
+    def finish(self, trace: PipelineTrace) -> None:
+        """Add the trace to the recent ones and to the statistics."""
+        self.traces.append(trace)
+        for stage, duration in trace.stage_durations().items():
+            self.stage_latency[stage].record(duration)
+        for _, duration in trace.entity_times:
+            self.entity_latency.record(duration)
+
+    def as_dict(self) -> dict[str, object]:
+        """Statistics and recent traces, for the diagnostics."""
+        return {
+            "stages": {
+                stage.name.lower(): histogram.as_dict()
+                for stage, histogram in self.stage_latency.items()
+            },
+            "entities": self.entity_latency.as_dict(),
+            "traces": [trace.as_dict() for trace in self.traces],
+        }
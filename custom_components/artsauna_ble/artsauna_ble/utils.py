@@ -16,16 +16,28 @@
 # You should have received a copy of the GNU Affero General Public License
 # along with this program. If not, see <https://www.gnu.org/licenses/>.
 
-from .const import CMD_RGB_PREFIX, CMD_VOLUME_PREFIX
+from .protocol import CommandCode, command_frame
+
+
+def format_mac(mac: str) -> str:
+    """Format a mac address like the Home Assistant device registry does."""
+    to_test = mac
+    if len(to_test) == 17 and to_test.count(":") == 5:
+        return to_test.lower()
+    if len(to_test) == 17 and to_test.count("-") == 5:
+        to_test = to_test.replace("-", "")
+    elif len(to_test) == 14 and to_test.count(".") == 2:
+        to_test = to_test.replace(".", "")
+    if len(to_test) == 12:
+        # no separators included
+        return ":".join(to_test.lower()[i : i + 2] for i in range(0, 12, 2))
+    # not sure how it is formatted, return the original
+    return mac
 
 
 def construct_volume_cmd_data(volume: int) -> bytes:
-    data = CMD_VOLUME_PREFIX + bytes([volume])
-    data += bytes([sum(data[2:])])
-    return data
+    return command_frame(CommandCode.VOLUME, volume)
 
 
 def construct_rgb_cmd_data(rgb: int) -> bytes:
-    data = CMD_RGB_PREFIX + bytes([rgb])
-    data += bytes([sum(data[2:])])
-    return data
+    return command_frame(CommandCode.RGB, rgb)
@@ -27,13 +27,14 @@ from homeassistant.components.button import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import EntityCategory, UnitOfTemperature, UnitOfTime
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import device_registry
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .artsauna_ble import ArtsaunaBLEAdapter
+from .artsauna_ble import ArtsaunaBLEAdapter, ArtsaunaCommandError, ArtsaunaField
 from .const import DOMAIN
 from .coordinator import ArtsaunaBLECoordinator
 from .models import ArtsaunaBLEData
@@ -85,6 +86,23 @@ BUTTON_ENTITY_DESCRIPTIONS = [
     CYCLE_RGB_DESCRIPTION,
 ]
 
+BUTTON_FIELDS = {
+    TEMP_UP_DESCRIPTION.key: ArtsaunaField.HEATING_STATE
+    | ArtsaunaField.PREVIOUS_STATE
+    | ArtsaunaField.STATE,
+    TEMP_DOWN_DESCRIPTION.key: ArtsaunaField.HEATING_STATE
+    | ArtsaunaField.PREVIOUS_STATE
+    | ArtsaunaField.STATE,
+    TIME_UP_DESCRIPTION.key: ArtsaunaField.HEATING_STATE
+    | ArtsaunaField.PREVIOUS_STATE
+    | ArtsaunaField.STATE,
+    TIME_DOWN_DESCRIPTION.key: ArtsaunaField.HEATING_STATE
+    | ArtsaunaField.PREVIOUS_STATE
+    | ArtsaunaField.STATE,
+    SEARCH_FM_DESCRIPTION.key: ArtsaunaField.STATE,
+    CYCLE_RGB_DESCRIPTION.key: ArtsaunaField.STATE,
+}
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -119,7 +137,7 @@ class ArtsaunaBLEButton(CoordinatorEntity[ArtsaunaBLECoordinator], ButtonEntity)
         description: ButtonEntityDescription,
     ) -> None:
         """Initialize the sensor."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=BUTTON_FIELDS[description.key])
         self._coordinator = coordinator
         self.entity_description = description
         self._key = description.key
@@ -131,24 +149,41 @@ class ArtsaunaBLEButton(CoordinatorEntity[ArtsaunaBLECoordinator], ButtonEntity)
             manufacturer="HiMaterial",
             model="ArtsaunaBLE",
         )
+        self._generation = coordinator.data.generation
+        self._state = coordinator.data.state
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Take over the published snapshot unless it is already known."""
+        snapshot = self.coordinator.data
+        if snapshot.generation <= self._generation:
+            return
+        self._generation = snapshot.generation
+        self._state = snapshot.state
+        self.async_write_ha_state()
 
     async def async_press(self) -> None:
         """Handle the button press."""
-        match self._key:
-            case "search_fm":
-                return await self._device.send_toggle_fm()
-            case "temp_up":
-                return await self._device.send_temp_up()
-            case "temp_down":
-                return await self._device.send_temp_down()
-            case "time_up":
-                return await self._device.send_time_up()
-            case "time_down":
-                return await self._device.send_time_down()
-            case "cycle_rgb":
-                return await self._device.send_cycle_rgb()
-            case _:
-                _LOGGER.error("Wrong KEY for button: %s", self._key)
+        try:
+            match self._key:
+                case "search_fm":
+                    return await self._device.send_toggle_fm()
+                case "temp_up":
+                    return await self._device.send_temp_up()
+                case "temp_down":
+                    return await self._device.send_temp_down()
+                case "time_up":
+                    return await self._device.send_time_up()
+                case "time_down":
+                    return await self._device.send_time_down()
+                case "cycle_rgb":
+                    return await self._device.send_cycle_rgb()
+                case _:
+                    _LOGGER.error("Wrong KEY for button: %s", self._key)
+        except ArtsaunaCommandError as exc:
+            raise HomeAssistantError(
+                f"Could not send the command to {self._device.name}: {exc}"
+            ) from exc
 
     @property
     def available(self) -> bool:
@@ -156,7 +191,7 @@ class ArtsaunaBLEButton(CoordinatorEntity[ArtsaunaBLECoordinator], ButtonEntity)
             case "temp_up" | "temp_down" | "time_up" | "time_down":
                 return (
                     super().available
-                    and self._device.is_power_on
-                    and self._device.is_heating_on
+                    and self._state.is_power_on
+                    and self._state.is_heating_on
                 )
-        return super().available and self._device.is_power_on
+        return super().available and self._state.is_power_on
@@ -32,9 +32,34 @@ from homeassistant.components.bluetooth import (
     async_discovered_service_info,
 )
 from homeassistant.const import CONF_ADDRESS
+from homeassistant.core import callback
 
 from .artsauna_ble import ArtsaunaBLEAdapter
-from .const import DOMAIN
+from .const import (
+    CONF_CONNECTION_SLOTS,
+    CONF_COUNTDOWN_DEBOUNCE,
+    CONF_COUNTDOWN_MAX_STALENESS,
+    CONF_IDLE_DISCONNECT_TIMEOUT,
+    CONF_PIPELINE_TRACING,
+    CONF_RAW_CAPTURE,
+    CONF_TEMPERATURE_DEBOUNCE,
+    CONF_TEMPERATURE_MAX_STALENESS,
+    CONF_TEMPERATURE_STATISTICS,
+    CONF_TOGGLE_DEBOUNCE,
+    CONF_WRITE_WITHOUT_RESPONSE,
+    DEFAULT_CONNECTION_SLOTS,
+    DEFAULT_COUNTDOWN_DEBOUNCE,
+    DEFAULT_COUNTDOWN_MAX_STALENESS,
+    DEFAULT_IDLE_DISCONNECT_TIMEOUT,
+    DEFAULT_PIPELINE_TRACING,
+    DEFAULT_RAW_CAPTURE,
+    DEFAULT_TEMPERATURE_DEBOUNCE,
+    DEFAULT_TEMPERATURE_MAX_STALENESS,
+    DEFAULT_TEMPERATURE_STATISTICS,
+    DEFAULT_TOGGLE_DEBOUNCE,
+    DEFAULT_WRITE_WITHOUT_RESPONSE,
+    DOMAIN,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -49,6 +74,14 @@ class ArtsaunaBLEConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         self._discovery_info: BluetoothServiceInfoBleak | None = None
         self._discovered_devices: dict[str, BluetoothServiceInfoBleak] = {}
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(
+        config_entry: config_entries.ConfigEntry,
+    ) -> ArtsaunaBLEOptionsFlow:
+        """Get the options flow for this handler."""
+        return ArtsaunaBLEOptionsFlow()
+
     async def async_step_bluetooth(
         self, discovery_info: BluetoothServiceInfoBleak
     ) -> config_entries.ConfigFlowResult:
@@ -124,3 +157,84 @@ class ArtsaunaBLEConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             data_schema=data_schema,
             errors=errors,
         )
+
+
+class ArtsaunaBLEOptionsFlow(config_entries.OptionsFlow):
+    """Handle the options of an artsauna BLE entry."""
+
+    async def async_step_init(
+        self, user_input: dict[str, Any] | None = None
+    ) -> config_entries.ConfigFlowResult:
+        """Manage the options."""
+        if user_input is not None:
+            return self.async_create_entry(data=user_input)
+
+        options = self.config_entry.options
+        data_schema = vol.Schema(
+            {
+                vol.Optional(
+                    CONF_WRITE_WITHOUT_RESPONSE,
+                    default=options.get(
+                        CONF_WRITE_WITHOUT_RESPONSE, DEFAULT_WRITE_WITHOUT_RESPONSE
+                    ),
+                ): bool,
+                vol.Optional(
+                    CONF_IDLE_DISCONNECT_TIMEOUT,
+                    default=options.get(
+                        CONF_IDLE_DISCONNECT_TIMEOUT, DEFAULT_IDLE_DISCONNECT_TIMEOUT
+                    ),
+                ): vol.All(vol.Coerce(int), vol.Range(min=0)),
+                vol.Optional(
+                    CONF_CONNECTION_SLOTS,
+                    default=options.get(
+                        CONF_CONNECTION_SLOTS, DEFAULT_CONNECTION_SLOTS
+                    ),
+                ): vol.All(vol.Coerce(int), vol.Range(min=0)),
+                vol.Optional(
+                    CONF_TOGGLE_DEBOUNCE,
+                    default=options.get(CONF_TOGGLE_DEBOUNCE, DEFAULT_TOGGLE_DEBOUNCE),
+                ): vol.All(vol.Coerce(float), vol.Range(min=0)),
+                vol.Optional(
+                    CONF_TEMPERATURE_DEBOUNCE,
+                    default=options.get(
+                        CONF_TEMPERATURE_DEBOUNCE, DEFAULT_TEMPERATURE_DEBOUNCE
+                    ),
+                ): vol.All(vol.Coerce(float), vol.Range(min=0)),
+                vol.Optional(
+                    CONF_TEMPERATURE_MAX_STALENESS,
+                    default=options.get(
+                        CONF_TEMPERATURE_MAX_STALENESS,
+                        DEFAULT_TEMPERATURE_MAX_STALENESS,
+                    ),
+                ): vol.All(vol.Coerce(float), vol.Range(min=0)),
+                vol.Optional(
+                    CONF_COUNTDOWN_DEBOUNCE,
+                    default=options.get(
+                        CONF_COUNTDOWN_DEBOUNCE, DEFAULT_COUNTDOWN_DEBOUNCE
+                    ),
+                ): vol.All(vol.Coerce(float), vol.Range(min=0)),
+                vol.Optional(
+                    CONF_COUNTDOWN_MAX_STALENESS,
+                    default=options.get(
+                        CONF_COUNTDOWN_MAX_STALENESS, DEFAULT_COUNTDOWN_MAX_STALENESS
+                    ),
+                ): vol.All(vol.Coerce(float), vol.Range(min=0)),
+                vol.Optional(
+                    CONF_TEMPERATURE_STATISTICS,
+                    default=options.get(
+                        CONF_TEMPERATURE_STATISTICS, DEFAULT_TEMPERATURE_STATISTICS
+                    ),
+                ): bool,
+                vol.Optional(
+                    CONF_PIPELINE_TRACING,
+                    default=options.get(
+                        CONF_PIPELINE_TRACING, DEFAULT_PIPELINE_TRACING
+                    ),
+                ): bool,
+                vol.Optional(
+                    CONF_RAW_CAPTURE,
+                    default=options.get(CONF_RAW_CAPTURE, DEFAULT_RAW_CAPTURE),
+                ): bool,
+            }
+        )
+        return self.async_show_form(step_id="init", data_schema=data_schema)
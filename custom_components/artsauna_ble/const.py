@@ -19,3 +19,43 @@
 """Constants for the Artsauna-BLE integration."""
 
 DOMAIN = "artsauna_ble"
+
+CONF_WRITE_WITHOUT_RESPONSE = "write_without_response"
+DEFAULT_WRITE_WITHOUT_RESPONSE = False
+
+CONF_IDLE_DISCONNECT_TIMEOUT = "idle_disconnect_timeout"
+# 0 keeps the connection permanently
+DEFAULT_IDLE_DISCONNECT_TIMEOUT = 0
+
+CONF_PIPELINE_TRACING = "pipeline_tracing"
+DEFAULT_PIPELINE_TRACING = False
+
+CONF_RAW_CAPTURE = "raw_capture"
+DEFAULT_RAW_CAPTURE = False
+
+CONF_CONNECTION_SLOTS = "connection_slots"
+# 0 does not limit the connections
+DEFAULT_CONNECTION_SLOTS = 0
+
+# the slot scheduler shared by all entries in hass.data[DOMAIN]
+DATA_SLOT_SCHEDULER = "slot_scheduler"
+
+# seconds the changes of the discrete fields are debounced, 0 publishes them immediately
+CONF_TOGGLE_DEBOUNCE = "toggle_debounce"
+DEFAULT_TOGGLE_DEBOUNCE = 0.0
+
+# seconds the current temperature changes are debounced and held back at most
+CONF_TEMPERATURE_DEBOUNCE = "temperature_debounce"
+DEFAULT_TEMPERATURE_DEBOUNCE = 5.0
+CONF_TEMPERATURE_MAX_STALENESS = "temperature_max_staleness"
+DEFAULT_TEMPERATURE_MAX_STALENESS = 30.0
+
+# seconds the remaining time changes are debounced and held back at most
+CONF_COUNTDOWN_DEBOUNCE = "countdown_debounce"
+DEFAULT_COUNTDOWN_DEBOUNCE = 5.0
+CONF_COUNTDOWN_MAX_STALENESS = "countdown_max_staleness"
+DEFAULT_COUNTDOWN_MAX_STALENESS = 60.0
+
+# import the temperatures into the long-term statistics
+CONF_TEMPERATURE_STATISTICS = "temperature_statistics"
+DEFAULT_TEMPERATURE_STATISTICS = False
@@ -20,26 +20,95 @@
 
 import logging
 import time
+from collections.abc import Mapping
+from dataclasses import dataclass
 from datetime import datetime
 
 from homeassistant.core import CALLBACK_TYPE, HassJob, HomeAssistant, callback
 from homeassistant.helpers.event import async_call_later
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
-from .artsauna_ble import ArtsaunaBLEAdapter, ArtsaunaState
-from .const import DOMAIN
+from .artsauna_ble import (
+    ArtsaunaBLEAdapter,
+    ArtsaunaField,
+    ArtsaunaState,
+    PipelineStage,
+)
+from .artsauna_ble.tracing import PipelineTrace
+from .const import (
+    DEFAULT_COUNTDOWN_DEBOUNCE,
+    DEFAULT_COUNTDOWN_MAX_STALENESS,
+    DEFAULT_TEMPERATURE_DEBOUNCE,
+    DEFAULT_TEMPERATURE_MAX_STALENESS,
+    DEFAULT_TOGGLE_DEBOUNCE,
+    DOMAIN,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
-NEVER_TIME = -86400.0
-DEBOUNCE_SECONDS = 1.0
 
+@dataclass(frozen=True, slots=True)
+class DebouncePolicy:
+    """How long changes of a group of fields are held back before publishing.
 
-class ArtsaunaBLECoordinator(DataUpdateCoordinator[None]):
+    A change is published once the group did not change for `delay` seconds,
+    but no later than `max_staleness` seconds after its first unpublished change.
+    """
+
+    delay: float = 0.0
+    max_staleness: float = 0.0
+
+    def due_time(self, first_change: float, last_change: float) -> float:
+        """Time at which the pending changes of the group are published."""
+        return min(last_change + self.delay, first_change + self.max_staleness)
+
+
+# fields that drift continuously, everything else is a discrete toggle or setting
+TEMPERATURE_FIELDS = ArtsaunaField.CURRENT_TEMP
+COUNTDOWN_FIELDS = ArtsaunaField.REMAINING_TIME
+DISCRETE_FIELDS = ArtsaunaField.ALL & ~(TEMPERATURE_FIELDS | COUNTDOWN_FIELDS)
+
+DEFAULT_DEBOUNCE_POLICIES: Mapping[ArtsaunaField, DebouncePolicy] = {
+    DISCRETE_FIELDS: DebouncePolicy(DEFAULT_TOGGLE_DEBOUNCE, DEFAULT_TOGGLE_DEBOUNCE),
+    TEMPERATURE_FIELDS: DebouncePolicy(
+        DEFAULT_TEMPERATURE_DEBOUNCE, DEFAULT_TEMPERATURE_MAX_STALENESS
+    ),
+    COUNTDOWN_FIELDS: DebouncePolicy(
+        DEFAULT_COUNTDOWN_DEBOUNCE, DEFAULT_COUNTDOWN_MAX_STALENESS
+    ),
+}
+
+
+@dataclass(frozen=True, slots=True)
+class ArtsaunaStateSnapshot:
+    """State of the sauna as published to the entities.
+
+    The generation increases with every publication, so entities can skip
+    snapshots they have already rendered.
+    """
+
+    generation: int
+    state: ArtsaunaState
+
+
+class ArtsaunaBLECoordinator(DataUpdateCoordinator[ArtsaunaStateSnapshot]):
     """Data coordinator for receiving Artsauna updates."""
 
-    def __init__(self, hass: HomeAssistant, artsauna_ble: ArtsaunaBLEAdapter) -> None:
-        """Initialise the coordinator."""
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        artsauna_ble: ArtsaunaBLEAdapter,
+        debounce_policies: Mapping[ArtsaunaField, DebouncePolicy] | None = None,
+    ) -> None:
+        """Initialise the coordinator.
+
+        Args:
+            hass: The Home Assistant instance.
+            artsauna_ble: The adapter of the sauna.
+            debounce_policies: The debounce policy of each group of fields,
+                the groups must cover all fields.
+                Defaults to `DEFAULT_DEBOUNCE_POLICIES`.
+        """
         super().__init__(
             hass,
             _LOGGER,
@@ -49,43 +118,177 @@ class ArtsaunaBLECoordinator(DataUpdateCoordinator[None]):
         artsauna_ble.register_callback(self._async_handle_update)
         artsauna_ble.register_disconnected_callback(self._async_handle_disconnect)
         self.connected = False
-        self._last_update_time = NEVER_TIME
+        # the entities are unavailable until the first state is published
+        self.last_update_success = False
+        self.data = ArtsaunaStateSnapshot(0, artsauna_ble.state)
+        # latest decoded state, published with the pending changes
+        self._pending_state = artsauna_ble.state
+        # fields changed with the last update passed to the listeners
+        self.changed_fields = ArtsaunaField(0)
+        self._pending_changed_fields = ArtsaunaField(0)
+        # pipeline traces of the pending and the currently published changes
+        self._pending_traces: list[PipelineTrace] = []
+        self._publishing_traces: list[PipelineTrace] = []
+        self._debounce_policies = debounce_policies or DEFAULT_DEBOUNCE_POLICIES
+        # first and last unpublished change and publishing time of the pending groups
+        self._pending_since: dict[ArtsaunaField, float] = {}
+        self._last_changes: dict[ArtsaunaField, float] = {}
+        self._due_times: dict[ArtsaunaField, float] = {}
+        self._debounce_due_time: float | None = None
         self._debounce_cancel: CALLBACK_TYPE | None = None
         self._debounced_update_job = HassJob(
             self._async_handle_debounced_update,
             f"LD2450 {artsauna_ble.address} BLE debounced update",
         )
 
+    @property
+    def debounce_policies(self) -> Mapping[ArtsaunaField, DebouncePolicy]:
+        """The debounce policy of each group of fields."""
+        return self._debounce_policies
+
+    @debounce_policies.setter
+    def debounce_policies(
+        self, debounce_policies: Mapping[ArtsaunaField, DebouncePolicy]
+    ) -> None:
+        """Change the policies, the pending changes are rescheduled with them."""
+        self._debounce_policies = debounce_policies
+        if not self._pending_changed_fields:
+            return
+        self._due_times = {
+            fields: policy.due_time(
+                self._pending_since[fields], self._last_changes[fields]
+            )
+            for fields, policy in debounce_policies.items()
+            if fields in self._pending_since
+        }
+        self._async_schedule_publish(time.monotonic())
+
     @callback
     def _async_handle_debounced_update(self, _now: datetime) -> None:
         """Handle debounced update."""
         self._debounce_cancel = None
-        self._last_update_time = time.monotonic()
-        self.async_set_updated_data(None)
+        self._debounce_due_time = None
+        if not self._pending_changed_fields:
+            return
+        self._async_publish_changes()
 
     @callback
-    def _async_handle_update(self, state: ArtsaunaState) -> None:
-        """Just trigger the callbacks."""
+    def _async_publish_changes(self) -> None:
+        """Pass the changes accumulated since the last update to the listeners."""
+        self._async_cancel_debounce()
+        self._pending_since.clear()
+        self._last_changes.clear()
+        self._due_times.clear()
+        self.changed_fields = self._pending_changed_fields
+        self._pending_changed_fields = ArtsaunaField(0)
+        snapshot = ArtsaunaStateSnapshot(self.data.generation + 1, self._pending_state)
+        if not self._pending_traces:
+            self.async_set_updated_data(snapshot)
+            return
+        traces, self._pending_traces = self._pending_traces, []
+        for trace in traces:
+            trace.mark(PipelineStage.PUBLISHED)
+        self._publishing_traces = traces
+        try:
+            self.async_set_updated_data(snapshot)
+        finally:
+            self._publishing_traces = []
+        if (tracer := self._artsauna_ble.tracer) is not None:
+            for trace in traces:
+                trace.mark(PipelineStage.WRITTEN)
+                tracer.finish(trace)
+
+    @callback
+    def _async_handle_update(
+        self, state: ArtsaunaState, changed: ArtsaunaField
+    ) -> None:
+        """Publish the changes when the debounce policy of a changed group is due."""
+        if (tracer := self._artsauna_ble.tracer) is not None and (
+            trace := tracer.take()
+        ) is not None:
+            trace.mark(PipelineStage.DISPATCHED)
+            self._pending_traces.append(trace)
         self.connected = True
-        previous_last_updated_time = self._last_update_time
-        self._last_update_time = time.monotonic()
-        if self._last_update_time - previous_last_updated_time >= DEBOUNCE_SECONDS:
-            self.async_set_updated_data(None)
+        self._pending_state = state
+        self._pending_changed_fields |= changed
+        now = time.monotonic()
+        for fields, policy in self._debounce_policies.items():
+            if changed & fields:
+                first_change = self._pending_since.setdefault(fields, now)
+                self._last_changes[fields] = now
+                self._due_times[fields] = policy.due_time(first_change, now)
+        self._async_schedule_publish(now)
+
+    @callback
+    def _async_schedule_publish(self, now: float) -> None:
+        """Publish the pending changes once the earliest group is due."""
+        # the earliest group publishes the changes of all groups
+        due_time = min(self._due_times.values(), default=now)
+        if due_time <= now:
+            self._async_publish_changes()
             return
-        if self._debounce_cancel is None:
-            self._debounce_cancel = async_call_later(
-                self.hass, DEBOUNCE_SECONDS, self._debounced_update_job
-            )
+        if self._debounce_due_time == due_time:
+            return
+        self._async_cancel_debounce()
+        self._debounce_due_time = due_time
+        self._debounce_cancel = async_call_later(
+            self.hass, due_time - now, self._debounced_update_job
+        )
+
+    @callback
+    def async_publish_pending(self) -> None:
+        """Publish the pending changes right away, e.g. after a confirmed command."""
+        if self._pending_changed_fields:
+            self._async_publish_changes()
+
+    @callback
+    def _async_cancel_debounce(self) -> None:
+        """Cancel the scheduled publishing of the pending changes."""
+        if self._debounce_cancel is not None:
+            self._debounce_cancel()
+            self._debounce_cancel = None
+        self._debounce_due_time = None
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Update the listeners subscribed to one of the changed fields.
+
+        The context of a listener is the `ArtsaunaField` mask it renders,
+        listeners without context are always updated.
+        """
+        changed_fields = self.changed_fields
+        traces = self._publishing_traces
+        for update_callback, fields in list(self._listeners.values()):
+            if fields is None or fields & changed_fields:
+                if not traces:
+                    update_callback()
+                    continue
+                start = time.perf_counter()
+                update_callback()
+                entity_time = (
+                    _listener_name(update_callback),
+                    time.perf_counter() - start,
+                )
+                for trace in traces:
+                    trace.entity_times.append(entity_time)
 
     @callback
     def _async_handle_disconnect(self) -> None:
         """Trigger the callbacks for disconnected."""
         self.connected = False
-        self.async_update_listeners()
+        if not self.last_update_success:
+            # no state was published yet, the entities stay unavailable
+            return
+        self._pending_changed_fields = ArtsaunaField.ALL
+        self._async_publish_changes()
 
     async def async_shutdown(self) -> None:
         """Shutdown the coordinator."""
-        if self._debounce_cancel is not None:
-            self._debounce_cancel()
-            self._debounce_cancel = None
+        self._async_cancel_debounce()
         await super().async_shutdown()
+
+
+def _listener_name(update_callback: CALLBACK_TYPE) -> str:
+    """Entity id of the listener, for the pipeline traces."""
+    entity = getattr(update_callback, "__self__", None)
+    return getattr(entity, "entity_id", None) or repr(update_callback)
@@ -0,0 +1,99 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+#
+# Artsauna-BLE - integration for Home Assistant
+# Copyright (C) 2025 David & Philipp Aderbauer
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+
+"""Diagnostics support for the Artsauna-BLE integration."""
+
+from __future__ import annotations
+
+import base64
+import dataclasses
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_ADDRESS
+from homeassistant.core import HomeAssistant
+
+from .artsauna_ble import ArtsaunaCaptureWriter
+from .const import DATA_SLOT_SCHEDULER, DOMAIN
+from .models import ArtsaunaBLEData
+
+TO_REDACT = {CONF_ADDRESS, "unique_id"}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    data: ArtsaunaBLEData = hass.data[DOMAIN][entry.entry_id]
+    device = data.device
+    decoder = device.frame_decoder
+    scheduler = hass.data[DOMAIN][DATA_SLOT_SCHEDULER]
+    captures = None
+    if (capture := device.capture) is not None:
+        await capture.async_flush()
+        captures = await hass.async_add_executor_job(_read_captures, capture)
+    return {
+        "entry": async_redact_data(entry.as_dict(), TO_REDACT),
+        "state": dataclasses.asdict(device.state),
+        "published_generation": data.coordinator.data.generation,
+        "published_state": dataclasses.asdict(data.coordinator.data.state),
+        "link": {
+            "frame_count": decoder.frame_count,
+            "resync_count": decoder.resync_count,
+            "dropped_bytes": decoder.dropped_bytes,
+            "write_without_response": device.write_without_response,
+        },
+        "connection": {
+            "connection_count": device.connection_count,
+            "connected_time": device.connected_time,
+            "slot_usage": device.slot_usage,
+            "last_slot_wait_time": device.last_slot_wait_time,
+        },
+        "slot_scheduler": {
+            "slots": scheduler.slots,
+            "held": scheduler.held,
+            "waiting": scheduler.waiting,
+            "wait_count": scheduler.wait_count,
+            "mean_wait_time": scheduler.mean_wait_time,
+            "max_wait_time": scheduler.max_wait_time,
+            "preemption_count": scheduler.preemption_count,
+        },
+        "latency": {
+            "connect": device.connect_latency.as_dict(),
+            "write": device.write_latency.as_dict(),
+            "confirmation": device.confirmation_latency.as_dict(),
+        },
+        "sensor_writes": {
+            key: write_filter.as_dict()
+            for key, write_filter in data.sensor_write_filters.items()
+        },
+        "pipeline": device.tracer.as_dict() if device.tracer is not None else None,
+        "captures": captures,
+    }
+
+
+def _read_captures(capture: ArtsaunaCaptureWriter) -> list[dict[str, str]]:
+    """Read the capture files, base64 encoded to fit into the diagnostics."""
+    return [
+        {
+            "name": path.name,
+            "data": base64.b64encode(path.read_bytes()).decode("ascii"),
+        }
+        for path in capture.files()
+    ]
@@ -20,10 +20,11 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
-from .artsauna_ble import ArtsaunaBLEAdapter
+from .artsauna_ble import ArtsaunaBLEAdapter, SignificantChangeFilter
 from .coordinator import ArtsaunaBLECoordinator
+from .statistics import ArtsaunaTemperatureStatistics
 
 
 @dataclass
@@ -33,3 +34,8 @@ class ArtsaunaBLEData:
     title: str
     device: ArtsaunaBLEAdapter
     coordinator: ArtsaunaBLECoordinator
+    statistics: ArtsaunaTemperatureStatistics | None = None
+    # write filters of the sensors by key
+    sensor_write_filters: dict[str, SignificantChangeFilter] = field(
+        default_factory=dict
+    )
@@ -29,15 +29,16 @@ from homeassistant.components.number import (
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import EntityCategory
 from homeassistant.core import HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import device_registry
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from propcache.api import cached_property
 
-from .artsauna_ble import ArtsaunaBLEAdapter
+from .artsauna_ble import ArtsaunaBLEAdapter, ArtsaunaCommandError, ArtsaunaField
 from .const import DOMAIN
-from .coordinator import ArtsaunaBLECoordinator
+from .coordinator import ArtsaunaBLECoordinator, ArtsaunaStateSnapshot
 from .models import ArtsaunaBLEData
 
 _LOGGER = logging.getLogger(__name__)
@@ -57,6 +58,10 @@ SENSOR_DESCRIPTIONS = [
     VOLUME_DESCRIPTION,
 ]
 
+NUMBER_FIELDS = {
+    VOLUME_DESCRIPTION.key: ArtsaunaField.VOLUME | ArtsaunaField.STATE,
+}
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -91,7 +96,7 @@ class ArtsaunaBLENumber(CoordinatorEntity[ArtsaunaBLECoordinator], NumberEntity)
         description: NumberEntityDescription,
     ) -> None:
         """Initialize the sensor."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=NUMBER_FIELDS[description.key])
         self._coordinator = coordinator
         self._device = device
         self.entity_description = description
@@ -104,28 +109,48 @@ class ArtsaunaBLENumber(CoordinatorEntity[ArtsaunaBLECoordinator], NumberEntity)
             model="Artsauna",
         )
         self._attr_native_value = 0
+        # generation 0 is the undecoded initial state, rendered once published
+        self._generation = 0
+        self._state = coordinator.data.state
+        if coordinator.data.generation:
+            self._render(coordinator.data)
 
     @callback
     def _handle_coordinator_update(self) -> None:
-        """Handle updated data from the coordinator."""
+        """Render the published snapshot unless it is already rendered."""
+        snapshot = self.coordinator.data
+        if snapshot.generation <= self._generation:
+            return
+        self._render(snapshot)
+        self.async_write_ha_state()
+
+    @callback
+    def _render(self, snapshot: ArtsaunaStateSnapshot) -> None:
+        """Update the attributes from a state snapshot."""
+        self._generation = snapshot.generation
+        self._state = snapshot.state
         match self._key:
             case "volume":
-                self._attr_native_value = self._device.volume
+                self._attr_native_value = snapshot.state.volume
             case _:
                 _LOGGER.error("Wrong KEY for number: %s", self._key)
-        self.async_write_ha_state()
 
     async def async_set_native_value(self, value: float) -> None:
         """Update the current value."""
-        match self._key:
-            case "volume":
-                await self._device.send_set_volume(int(value) % 50)
-            case _:
-                _LOGGER.error("Wrong KEY for number: %s", self._key)
+        try:
+            match self._key:
+                case "volume":
+                    await self._device.send_set_volume(int(value) % 50)
+                case _:
+                    _LOGGER.error("Wrong KEY for number: %s", self._key)
+        except ArtsaunaCommandError as exc:
+            raise HomeAssistantError(
+                f"Could not send the command to {self._device.name}: {exc}"
+            ) from exc
 
     @property
     def available(self) -> bool:
-        return super().available and self._device.is_power_on
+        return super().available and self._state.is_power_on
 
     @cached_property
     def icon(self) -> str | None:
@@ -1,6 +1,8 @@
 """LD2450 BLE integration sensor platform."""
 
 import logging
+import time
+from datetime import datetime, timedelta
 
 from homeassistant.components.sensor import (
     SensorDeviceClass,
@@ -10,23 +12,30 @@ from homeassistant.components.sensor import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import (
+    PERCENTAGE,
     EntityCategory,
     UnitOfFrequency,
     UnitOfTemperature,
     UnitOfTime,
 )
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.helpers import device_registry
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.event import async_call_later, async_track_time_interval
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from propcache.api import cached_property
 
 from custom_components.artsauna_ble.artsauna_ble.const import INTERNAL_RGB_COLOR_MAP
 
-from .artsauna_ble import ArtsaunaBLEAdapter
+from .artsauna_ble import (
+    ArtsaunaBLEAdapter,
+    ArtsaunaField,
+    SignificantChange,
+    SignificantChangeFilter,
+)
 from .const import DOMAIN
-from .coordinator import ArtsaunaBLECoordinator
+from .coordinator import ArtsaunaBLECoordinator, ArtsaunaStateSnapshot
 from .models import ArtsaunaBLEData
 
 _LOGGER = logging.getLogger(__name__)
@@ -65,15 +74,113 @@ RGB_MODE_DESCRIPTION = SensorEntityDescription(
     translation_key="rgb_mode",
     icon="mdi:palette",
 )
+CONNECTED_TIME_DESCRIPTION = SensorEntityDescription(
+    key="connected_time",
+    translation_key="connected_time",
+    device_class=SensorDeviceClass.DURATION,
+    state_class=SensorStateClass.TOTAL_INCREASING,
+    native_unit_of_measurement=UnitOfTime.SECONDS,
+    suggested_display_precision=0,
+)
+SLOT_USAGE_DESCRIPTION = SensorEntityDescription(
+    key="slot_usage",
+    translation_key="slot_usage",
+    icon="mdi:bluetooth-connect",
+    state_class=SensorStateClass.MEASUREMENT,
+    native_unit_of_measurement=PERCENTAGE,
+    suggested_display_precision=1,
+)
+SLOT_WAIT_TIME_DESCRIPTION = SensorEntityDescription(
+    key="slot_wait_time",
+    translation_key="slot_wait_time",
+    device_class=SensorDeviceClass.DURATION,
+    state_class=SensorStateClass.MEASUREMENT,
+    native_unit_of_measurement=UnitOfTime.SECONDS,
+    suggested_display_precision=1,
+)
+# latency histogram of the adapter and quantile of each latency sensor
+LATENCY_QUANTILES = {
+    f"{latency}_latency_{name}": (f"{latency}_latency", quantile)
+    for latency in ("connect", "write", "confirmation")
+    for name, quantile in (("p50", 0.5), ("p95", 0.95))
+}
+LATENCY_DESCRIPTIONS = [
+    SensorEntityDescription(
+        key=key,
+        translation_key=key,
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=UnitOfTime.SECONDS,
+        suggested_display_precision=3,
+    )
+    for key in LATENCY_QUANTILES
+]
 
-BUTTON_ENTITY_DESCRIPTIONS = [
+SENSOR_ENTITY_DESCRIPTIONS = [
     TARGET_TEMP_DESCRIPTION,
     CURRENT_TEMP_DESCRIPTION,
     REMAINING_TIME_DESCRIPTION,
     FM_FREQUENCY_DESCRIPTION,
     RGB_MODE_DESCRIPTION,
+    CONNECTED_TIME_DESCRIPTION,
+    SLOT_USAGE_DESCRIPTION,
+    SLOT_WAIT_TIME_DESCRIPTION,
+    *LATENCY_DESCRIPTIONS,
 ]
 
+SENSOR_FIELDS = {
+    TARGET_TEMP_DESCRIPTION.key: ArtsaunaField.TARGET_TEMP
+    | ArtsaunaField.UNIT_IS_CELSIUS
+    | ArtsaunaField.STATE,
+    CURRENT_TEMP_DESCRIPTION.key: ArtsaunaField.CURRENT_TEMP
+    | ArtsaunaField.UNIT_IS_CELSIUS
+    | ArtsaunaField.STATE,
+    REMAINING_TIME_DESCRIPTION.key: ArtsaunaField.REMAINING_TIME | ArtsaunaField.STATE,
+    FM_FREQUENCY_DESCRIPTION.key: ArtsaunaField.FM_FREQUENCY | ArtsaunaField.STATE,
+    RGB_MODE_DESCRIPTION.key: ArtsaunaField.RGB | ArtsaunaField.STATE,
+    # the connection metrics are refreshed with every update and periodically
+    CONNECTED_TIME_DESCRIPTION.key: ArtsaunaField.ALL,
+    SLOT_USAGE_DESCRIPTION.key: ArtsaunaField.ALL,
+    SLOT_WAIT_TIME_DESCRIPTION.key: ArtsaunaField.ALL,
+    **dict.fromkeys(LATENCY_QUANTILES, ArtsaunaField.ALL),
+}
+
+# sensors of the connection rather than the sauna, available while it is off
+CONNECTION_METRIC_KEYS = {
+    CONNECTED_TIME_DESCRIPTION.key,
+    SLOT_USAGE_DESCRIPTION.key,
+    SLOT_WAIT_TIME_DESCRIPTION.key,
+    *LATENCY_QUANTILES,
+}
+
+# the connection metrics also change while the sauna is idle or disconnected
+CONNECTION_METRIC_REFRESH_INTERVAL = timedelta(minutes=1)
+
+# seconds after which insignificant changes are written anyway
+HEARTBEAT_SECONDS = 300.0
+# changes of the other sensors are always significant
+SENSOR_SIGNIFICANT_CHANGES = {
+    CURRENT_TEMP_DESCRIPTION.key: SignificantChange(
+        absolute=2, heartbeat=HEARTBEAT_SECONDS
+    ),
+    REMAINING_TIME_DESCRIPTION.key: SignificantChange(
+        absolute=5, heartbeat=HEARTBEAT_SECONDS
+    ),
+    CONNECTED_TIME_DESCRIPTION.key: SignificantChange(
+        absolute=60, heartbeat=HEARTBEAT_SECONDS
+    ),
+    SLOT_USAGE_DESCRIPTION.key: SignificantChange(
+        absolute=1, heartbeat=HEARTBEAT_SECONDS
+    ),
+    SLOT_WAIT_TIME_DESCRIPTION.key: SignificantChange(
+        relative=0.1, heartbeat=HEARTBEAT_SECONDS
+    ),
+    **dict.fromkeys(
+        LATENCY_QUANTILES,
+        SignificantChange(relative=0.1, heartbeat=HEARTBEAT_SECONDS),
+    ),
+}
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -83,9 +190,21 @@ async def async_setup_entry(
     """Set up the platform for ArtsaunaBLE."""
     data: ArtsaunaBLEData = hass.data[DOMAIN][entry.entry_id]
 
+    data.sensor_write_filters = {
+        description.key: SignificantChangeFilter(
+            SENSOR_SIGNIFICANT_CHANGES.get(description.key, SignificantChange())
+        )
+        for description in SENSOR_ENTITY_DESCRIPTIONS
+    }
     entities = [
-        ArtsaunaBLESensor(data.coordinator, data.device, entry.title, description)
-        for description in BUTTON_ENTITY_DESCRIPTIONS
+        ArtsaunaBLESensor(
+            data.coordinator,
+            data.device,
+            entry.title,
+            description,
+            data.sensor_write_filters[description.key],
+        )
+        for description in SENSOR_ENTITY_DESCRIPTIONS
     ]
 
     async_add_entities(entities)
@@ -105,9 +224,10 @@ class ArtsaunaBLESensor(CoordinatorEntity[ArtsaunaBLECoordinator], SensorEntity)
         device: ArtsaunaBLEAdapter,
         name: str,
         description: SensorEntityDescription,
+        write_filter: SignificantChangeFilter,
     ) -> None:
         """Initialize the sensor."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=SENSOR_FIELDS[description.key])
         self._coordinator = coordinator
         self.entity_description = description
         self._key = description.key
@@ -119,38 +239,126 @@ class ArtsaunaBLESensor(CoordinatorEntity[ArtsaunaBLECoordinator], SensorEntity)
             manufacturer="HiMaterial",
             model="ArtsaunaBLE",
         )
+        self._write_filter = write_filter
+        # availability and unit of the last written state, changes are always written
+        self._written_key: tuple[bool, bool] | None = None
+        self._heartbeat_cancel: CALLBACK_TYPE | None = None
+        # generation 0 is the undecoded initial state, rendered once published
+        self._generation = 0
+        self._state = coordinator.data.state
+        if coordinator.data.generation:
+            self._render(coordinator.data)
 
     @callback
     def _handle_coordinator_update(self) -> None:
-        """Handle updated data from the coordinator."""
+        """Render the published snapshot unless it is already rendered."""
+        snapshot = self.coordinator.data
+        if snapshot.generation <= self._generation:
+            return
+        self._render(snapshot)
+        self._async_write_significant_state()
+
+    @callback
+    def _async_write_significant_state(self) -> None:
+        """Write the state unless the change is insignificant.
+
+        Suppressed changes are written by the heartbeat at the latest.
+        """
+        now = time.monotonic()
+        written_key = (self.available, self._state.is_unit_celsius)
+        if self._write_filter.should_write(
+            self._attr_native_value, now, force=written_key != self._written_key
+        ):
+            self._written_key = written_key
+            self._async_cancel_heartbeat()
+            self.async_write_ha_state()
+        elif self._heartbeat_cancel is None and (
+            (delay := self._write_filter.heartbeat_delay(now)) is not None
+        ):
+            self._heartbeat_cancel = async_call_later(
+                self.hass, delay, self._async_handle_heartbeat
+            )
+
+    @callback
+    def _async_handle_heartbeat(self, _now: datetime) -> None:
+        """Write the suppressed changes."""
+        self._heartbeat_cancel = None
+        self._async_write_significant_state()
+
+    @callback
+    def _async_cancel_heartbeat(self) -> None:
+        if self._heartbeat_cancel is not None:
+            self._heartbeat_cancel()
+            self._heartbeat_cancel = None
+
+    async def async_added_to_hass(self) -> None:
+        """Refresh the connection metrics periodically."""
+        await super().async_added_to_hass()
+        if self._key in CONNECTION_METRIC_KEYS:
+            self.async_on_remove(
+                async_track_time_interval(
+                    self.hass,
+                    self._async_refresh_connection_metric,
+                    CONNECTION_METRIC_REFRESH_INTERVAL,
+                )
+            )
+
+    @callback
+    def _async_refresh_connection_metric(self, _now: datetime) -> None:
+        """Render the metric of the adapter without a published update."""
+        self._render(self.coordinator.data)
+        self._async_write_significant_state()
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Cancel the heartbeat."""
+        self._async_cancel_heartbeat()
+        await super().async_will_remove_from_hass()
+
+    @callback
+    def _render(self, snapshot: ArtsaunaStateSnapshot) -> None:
+        """Update the attributes from a state snapshot."""
+        self._generation = snapshot.generation
+        state = self._state = snapshot.state
         match self._key:
             case "remaining_time":
-                self._attr_native_value = self._device.remaining_time
+                self._attr_native_value = state.remaining_time
             case "target_temp":
-                self._attr_native_value = self._device.target_temp
-                self._sensor_option_unit_of_measurement = (
-                    UnitOfTemperature.CELSIUS
-                    if self._device.is_unit_celsius
-                    else UnitOfTemperature.FAHRENHEIT
-                )
+                self._attr_native_value = state.target_temp
+                self._sensor_option_unit_of_measurement = self._temperature_unit
             case "current_temp":
-                self._attr_native_value = self._device.current_temp
-                self._sensor_option_unit_of_measurement = (
-                    UnitOfTemperature.CELSIUS
-                    if self._device.is_unit_celsius
-                    else UnitOfTemperature.FAHRENHEIT
-                )
+                self._attr_native_value = state.current_temp
+                self._sensor_option_unit_of_measurement = self._temperature_unit
             case "fm_frequency":
-                self._attr_native_value = self._device.fm_frequency
+                self._attr_native_value = state.fm_frequency / 100.0
             case "rgb_mode":
-                self._attr_native_value = self._device.rgb_mode
+                self._attr_native_value = state.rgb
+            case "connected_time":
+                self._attr_native_value = self._device.connected_time
+            case "slot_usage":
+                self._attr_native_value = 100 * self._device.slot_usage
+            case "slot_wait_time":
+                self._attr_native_value = self._device.last_slot_wait_time
+            case key if key in LATENCY_QUANTILES:
+                histogram, quantile = LATENCY_QUANTILES[key]
+                self._attr_native_value = getattr(self._device, histogram).quantile(
+                    quantile
+                )
             case _:
                 _LOGGER.error("Wrong KEY for sensor: %s", self._key)
-        self.async_write_ha_state()
+
+    @property
+    def _temperature_unit(self) -> str:
+        return (
+            UnitOfTemperature.CELSIUS
+            if self._state.is_unit_celsius
+            else UnitOfTemperature.FAHRENHEIT
+        )
 
     @property
     def available(self) -> bool:
-        return super().available and self._device.is_power_on
+        if self._key in CONNECTION_METRIC_KEYS:
+            return super().available
+        return super().available and self._state.is_power_on
 
     @cached_property
     def native_value(self):
@@ -164,9 +372,5 @@ class ArtsaunaBLESensor(CoordinatorEntity[ArtsaunaBLECoordinator], SensorEntity)
     @cached_property
     def native_unit_of_measurement(self) -> str | None:
         if self._key in ["current_temp", "target_temp"]:
-            return (
-                UnitOfTemperature.CELSIUS
-                if self._device.is_unit_celsius
-                else UnitOfTemperature.FAHRENHEIT
-            )
+            return self._temperature_unit
         return super().native_unit_of_measurement
@@ -0,0 +1,153 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+#
+# Artsauna-BLE - integration for Home Assistant
+# Copyright (C) 2025 David & Philipp Aderbauer
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+
+"""Long-term statistics of the Artsauna temperatures."""
+
+from datetime import datetime, timedelta
+
+from homeassistant.components.recorder.models import (
+    StatisticData,
+    StatisticMeanType,
+    StatisticMetaData,
+)
+from homeassistant.components.recorder.statistics import async_add_external_statistics
+from homeassistant.const import UnitOfTemperature
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.util import dt as dt_util
+from homeassistant.util.unit_conversion import TemperatureConverter
+
+from .artsauna_ble import (
+    ArtsaunaBLEAdapter,
+    ArtsaunaField,
+    ArtsaunaState,
+    HourlySampleSeries,
+)
+from .const import DOMAIN
+
+FLUSH_INTERVAL = timedelta(minutes=5)
+
+# name suffix of the statistic of each sampled temperature
+TEMPERATURE_STATISTICS = {
+    "current_temp": "Current Temperature",
+    "target_temp": "Target Temperature",
+}
+SAMPLED_FIELDS = (
+    ArtsaunaField.CURRENT_TEMP
+    | ArtsaunaField.TARGET_TEMP
+    | ArtsaunaField.UNIT_IS_CELSIUS
+    | ArtsaunaField.STATE
+)
+
+
+class ArtsaunaTemperatureStatistics:
+    """Import the temperatures of a sauna into the long-term statistics.
+
+    The decoded temperatures are aggregated per hour in memory and the
+    completed hours are flushed periodically, so the heat-up curve does not
+    depend on recorded states. The current hour is only imported once it is
+    complete, importing it partially would overwrite the earlier samples of
+    the hour after a restart.
+    """
+
+    def __init__(
+        self, hass: HomeAssistant, device: ArtsaunaBLEAdapter, name: str
+    ) -> None:
+        """Initialise the statistics of the device."""
+        self._hass = hass
+        self._device = device
+        object_id = device.address.replace(":", "").lower()
+        self._series = {key: HourlySampleSeries() for key in TEMPERATURE_STATISTICS}
+        self._metadata = {
+            key: StatisticMetaData(
+                mean_type=StatisticMeanType.ARITHMETIC,
+                has_sum=False,
+                name=f"{name} {label}",
+                source=DOMAIN,
+                statistic_id=f"{DOMAIN}:{object_id}_{key}",
+                unit_class=TemperatureConverter.UNIT_CLASS,
+                unit_of_measurement=UnitOfTemperature.CELSIUS,
+            )
+            for key, label in TEMPERATURE_STATISTICS.items()
+        }
+        self._unsubscribers: list[CALLBACK_TYPE] = []
+
+    @callback
+    def async_start(self) -> None:
+        """Start sampling the device and flushing periodically."""
+        self._unsubscribers = [
+            self._device.register_callback(self._async_handle_update),
+            self._device.register_disconnected_callback(self._async_handle_disconnect),
+            async_track_time_interval(self._hass, self._async_flush, FLUSH_INTERVAL),
+        ]
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop sampling and flush the completed hours, the current one is dropped."""
+        for unsubscribe in self._unsubscribers:
+            unsubscribe()
+        self._unsubscribers = []
+        self._async_handle_disconnect()
+        self._async_flush(dt_util.utcnow())
+
+    @callback
+    def _async_handle_update(
+        self, state: ArtsaunaState, changed: ArtsaunaField
+    ) -> None:
+        """Sample the temperatures, they are unknown while the sauna is off."""
+        if not changed & SAMPLED_FIELDS:
+            return
+        now = dt_util.utcnow()
+        for key, series in self._series.items():
+            series.add(now, _temperature(state, key) if state.is_power_on else None)
+
+    @callback
+    def _async_handle_disconnect(self) -> None:
+        """Pause the samples while the temperatures are unknown."""
+        now = dt_util.utcnow()
+        for series in self._series.values():
+            series.add(now, None)
+
+    @callback
+    def _async_flush(self, now: datetime) -> None:
+        """Import the hourly aggregates completed until now."""
+        for key, series in self._series.items():
+            if aggregates := series.take(now):
+                async_add_external_statistics(
+                    self._hass,
+                    self._metadata[key],
+                    [
+                        StatisticData(
+                            start=aggregate.start,
+                            mean=aggregate.mean,
+                            min=aggregate.min,
+                            max=aggregate.max,
+                        )
+                        for aggregate in aggregates
+                    ],
+                )
+
+
+def _temperature(state: ArtsaunaState, key: str) -> float:
+    """Temperature of the state in degrees Celsius."""
+    value = getattr(state, key)
+    if state.is_unit_celsius:
+        return value
+    return TemperatureConverter.convert(
+        value, UnitOfTemperature.FAHRENHEIT, UnitOfTemperature.CELSIUS
+    )
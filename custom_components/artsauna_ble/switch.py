@@ -30,14 +30,15 @@ from homeassistant.components.switch import (
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import EntityCategory
 from homeassistant.core import HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import device_registry
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .artsauna_ble import ArtsaunaBLEAdapter
+from .artsauna_ble import ArtsaunaBLEAdapter, ArtsaunaCommandError, ArtsaunaField
 from .const import DOMAIN
-from .coordinator import ArtsaunaBLECoordinator
+from .coordinator import ArtsaunaBLECoordinator, ArtsaunaStateSnapshot
 from .models import ArtsaunaBLEData
 
 _LOGGER = logging.getLogger(__name__)
@@ -85,6 +86,21 @@ SWITCH_ENTITY_DESCRIPTIONS = [
     UNIT_DESCRIPTION,
 ]
 
+SWITCH_FIELDS = {
+    POWER_DESCRIPTION.key: ArtsaunaField.STATE,
+    HEATING_DESCRIPTION.key: ArtsaunaField.HEATING_STATE
+    | ArtsaunaField.PREVIOUS_STATE
+    | ArtsaunaField.STATE,
+    BT_DESCRIPTION.key: ArtsaunaField.STATE,
+    FM_DESCRIPTION.key: ArtsaunaField.STATE,
+    EXTERNAL_LIGHT_DESCRIPTION.key: ArtsaunaField.LIGHT | ArtsaunaField.STATE,
+    INTERNAL_LIGHT_DESCRIPTION.key: ArtsaunaField.LIGHT | ArtsaunaField.STATE,
+    UNIT_DESCRIPTION.key: ArtsaunaField.UNIT_IS_CELSIUS
+    | ArtsaunaField.HEATING_STATE
+    | ArtsaunaField.PREVIOUS_STATE
+    | ArtsaunaField.STATE,
+}
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -119,7 +135,7 @@ class ArtsaunaBLESwitch(CoordinatorEntity[ArtsaunaBLECoordinator], SwitchEntity)
         description: SwitchEntityDescription,
     ) -> None:
         """Initialize the sensor."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=SWITCH_FIELDS[description.key])
         self._coordinator = coordinator
         self.entity_description = description
         self._key = description.key
@@ -132,52 +148,77 @@ class ArtsaunaBLESwitch(CoordinatorEntity[ArtsaunaBLECoordinator], SwitchEntity)
             model="Artsauna",
         )
         self._attr_is_on = False
+        # generation 0 is the undecoded initial state, rendered once published
+        self._generation = 0
+        self._state = coordinator.data.state
+        if coordinator.data.generation:
+            self._render(coordinator.data)
 
     @callback
     def _handle_coordinator_update(self) -> None:
-        """Handle updated data from the coordinator."""
-        match self._key:
-            case "power":
-                self._attr_is_on = self._device.is_power_on
-            case "heating":
-                self._attr_is_on = self._device.is_heating_on
-            case "external_light":
-                self._attr_is_on = self._device.is_external_light_on
-            case "internal_light":
-                self._attr_is_on = self._device.is_internal_light_on
-            case "bt":
-                self._attr_is_on = self._device.is_bt_on
-            case "fm":
-                self._attr_is_on = self._device.is_fm_on
-            case "unit":
-                self._attr_is_on = self._device.is_unit_celsius
-            case _:
-                _LOGGER.error("Wrong KEY for switch: %s", self._key)
-
+        """Render the published snapshot unless it is already rendered."""
+        snapshot = self.coordinator.data
+        if snapshot.generation <= self._generation:
+            return
+        self._render(snapshot)
         self.async_write_ha_state()
 
-    async def async_turn_on(self, **kwargs: Any) -> None:
+    @callback
+    def _render(self, snapshot: ArtsaunaStateSnapshot) -> None:
+        """Update the attributes from a state snapshot."""
+        self._generation = snapshot.generation
+        state = self._state = snapshot.state
         match self._key:
             case "power":
-                await self._device.send_toggle_power()
+                self._attr_is_on = state.is_power_on
             case "heating":
-                await self._device.send_toggle_heating()
+                self._attr_is_on = state.is_heating_on
             case "external_light":
-                await self._device.send_toggle_external_light()
+                self._attr_is_on = state.is_external_light_on
             case "internal_light":
-                await self._device.send_toggle_internal_light()
+                self._attr_is_on = state.is_internal_light_on
             case "bt":
-                await self._device.send_toggle_bt()
+                self._attr_is_on = state.is_bt_on
             case "fm":
-                await self._device.send_toggle_fm()
+                self._attr_is_on = state.is_fm_on
             case "unit":
-                await self._device.send_toggle_unit()
+                self._attr_is_on = state.is_unit_celsius
             case _:
                 _LOGGER.error("Wrong KEY for switch: %s", self._key)
-                return
-        # manually switch the value for fluid ui
-        if self._key != "heating":  # heating data is flawd
-            self._attr_is_on = not self._attr_is_on
+
+    async def async_turn_on(self, **kwargs: Any) -> None:
+        # heating data is flawed, so the heating toggle can not be confirmed
+        confirm = self._key != "heating"
+        try:
+            match self._key:
+                case "power":
+                    await self._device.send_toggle_power(confirm=confirm)
+                case "heating":
+                    await self._device.send_toggle_heating()
+                case "external_light":
+                    await self._device.send_toggle_external_light(confirm=confirm)
+                case "internal_light":
+                    await self._device.send_toggle_internal_light(confirm=confirm)
+                case "bt":
+                    await self._device.send_toggle_bt(confirm=confirm)
+                case "fm":
+                    await self._device.send_toggle_fm(confirm=confirm)
+                case "unit":
+                    await self._device.send_toggle_unit(confirm=confirm)
+                case _:
+                    _LOGGER.error("Wrong KEY for switch: %s", self._key)
+                    return
+        except TimeoutError as exc:
+            raise HomeAssistantError(
+                f"{self._device.name} did not confirm the change of {self._key}"
+            ) from exc
+        except ArtsaunaCommandError as exc:
+            raise HomeAssistantError(
+                f"Could not send the command to {self._device.name}: {exc}"
+            ) from exc
+        if confirm:
+            # publish the confirmed state right away instead of after the debounce
+            self.coordinator.async_publish_pending()
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         await self.async_turn_on()
@@ -189,10 +230,10 @@ class ArtsaunaBLESwitch(CoordinatorEntity[ArtsaunaBLECoordinator], SwitchEntity)
         if self._key == "unit":
             return (
                 super().available
-                and self._device.is_power_on
-                and self._device.is_heating_on
+                and self._state.is_power_on
+                and self._state.is_heating_on
             )
-        return super().available and self._device.is_power_on
+        return super().available and self._state.is_power_on
 
     @cached_property
     def icon(self) -> str | None:
@@ -200,21 +241,21 @@ class ArtsaunaBLESwitch(CoordinatorEntity[ArtsaunaBLECoordinator], SwitchEntity)
             case "external_light":
                 return (
                     "mdi:lightbulb-on-outline"
-                    if self._device.is_external_light_on
+                    if self._state.is_external_light_on
                     else "mdi:lightbulb-outline"
                 )
             case "internal_light":
                 return (
                     "mdi:lightbulb-on-outline"
-                    if self._device.is_internal_light_on
+                    if self._state.is_internal_light_on
                     else "mdi:lightbulb-outline"
                 )
             case "bt":
-                return "mdi:bluetooth" if self._device.is_bt_on else "mdi:bluetooth-off"
+                return "mdi:bluetooth" if self._state.is_bt_on else "mdi:bluetooth-off"
             case "unit":
                 return (
                     "mdi:temperature-celsius"
-                    if self._device.is_unit_celsius
+                    if self._state.is_unit_celsius
                     else "mdi:temperature-fahrenheit"
                 )
         return super().icon
@@ -0,0 +1,63 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+#
+# Artsauna-BLE - integration for Home Assistant
+# Copyright (C) 2025 David & Philipp Aderbauer
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+
+"""Common fixtures for the artsauna_ble library tests."""
+
+from unittest.mock import patch
+
+import pytest
+from bleak.backends.device import BLEDevice
+
+from custom_components.artsauna_ble.artsauna_ble import ArtsaunaBLEAdapter
+from tests.artsauna.emulator import ArtsaunaEmulator
+
+
+@pytest.fixture
+def ble_device():
+    return BLEDevice("AA:BB:CC:DD:EE:FF", "SAUNA", None)
+
+
+@pytest.fixture
+def emulator():
+    """Emulated sauna that only notifies in answer to commands."""
+    return ArtsaunaEmulator(notification_interval=None)
+
+
+@pytest.fixture
+def establish_connection(emulator):
+    """Connect the adapters to the emulator."""
+    with patch(
+        "custom_components.artsauna_ble.artsauna_ble.artsauna_ble_adapter.establish_connection",
+        wraps=emulator.establish_connection,
+    ) as establish_connection:
+        yield establish_connection
+
+
+@pytest.fixture
+async def emulated_adapter(emulator, establish_connection):
+    """Adapter for the emulator, not connected yet."""
+    adapter = ArtsaunaBLEAdapter(emulator.ble_device)
+    yield adapter
+    await adapter.stop()
+
+
+@pytest.fixture
+async def connected_adapter(emulated_adapter):
+    """Adapter connected to the emulator."""
+    await emulated_adapter.initialise()
+    return emulated_adapter
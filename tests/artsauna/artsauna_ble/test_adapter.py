@@ -0,0 +1,453 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+#
+# Artsauna-BLE - integration for Home Assistant
+# Copyright (C) 2025 David & Philipp Aderbauer
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+
+import asyncio
+import time
+from unittest.mock import AsyncMock, MagicMock, call, patch
+
+import pytest
+from bleak.exc import BleakError
+from bleak_retry_connector import BLEAK_RETRY_EXCEPTIONS, BleakNotFoundError
+
+from custom_components.artsauna_ble.artsauna_ble import (
+    ArtsaunaBLEAdapter,
+    ArtsaunaCommandError,
+    ArtsaunaField,
+    ArtsaunaSlotScheduler,
+)
+from custom_components.artsauna_ble.artsauna_ble.artsauna_ble_adapter import (
+    COMMAND_ATTEMPT_MIN_TIME,
+    COMMAND_ATTEMPTS,
+)
+from custom_components.artsauna_ble.artsauna_ble.const import (
+    CHARACTERISTIC_WRITE,
+    CMD_TEMP_UP,
+)
+
+
+@pytest.fixture
+def data():
+    return bytearray.fromhex("ffaa0b5a470501103c41000b4892")
+
+
+@pytest.fixture
+def send_command():
+    with patch.object(
+        ArtsaunaBLEAdapter, "_send_command", new_callable=AsyncMock
+    ) as send_command:
+        yield send_command
+
+
+@pytest.fixture
+def adapter(send_command, ble_device):
+    return ArtsaunaBLEAdapter(ble_device)
+
+
+@pytest.fixture
+def callback(adapter):
+    callback = MagicMock()
+    adapter.register_callback(callback)
+    return callback
+
+
+def test_first_state_is_passed_in_full(adapter, callback, data):
+    adapter._notification_handler(0, data)
+
+    callback.assert_called_once_with(adapter.state, ArtsaunaField.ALL)
+
+
+def test_unchanged_state_is_not_passed_on(adapter, callback, data):
+    adapter._notification_handler(0, data)
+    adapter._notification_handler(0, data)
+    adapter._notification_handler(0, data)
+
+    # the second frame still changes previous_state
+    assert callback.call_count == 2
+    assert callback.call_args.args[1] == ArtsaunaField.PREVIOUS_STATE
+
+
+def test_changed_fields_are_passed_on(adapter, callback, data):
+    adapter._notification_handler(0, data)
+    adapter._notification_handler(0, data)
+    data[-3] += 1
+    data[-1] += 1
+
+    adapter._notification_handler(0, data)
+
+    assert callback.call_args.args[1] == ArtsaunaField.VOLUME
+
+
+def test_state_is_passed_in_full_after_disconnect(adapter, callback, data):
+    adapter._expected_disconnect = True
+    adapter._notification_handler(0, data)
+
+    adapter._disconnected(MagicMock())
+    adapter._notification_handler(0, data)
+
+    assert callback.call_args.args[1] == ArtsaunaField.ALL
+
+
+async def test_cycle_rgb_from_a_color_without_command(adapter, send_command, data):
+    data[-2] |= 0x0F
+    data[-1] += 7
+    adapter._notification_handler(0, data)
+
+    await adapter.send_cycle_rgb()
+
+    assert adapter.state.rgb == 15
+    send_command.assert_awaited_once()
+
+
+async def test_step_commands_are_coalesced(adapter, send_command):
+    await asyncio.gather(adapter.send_temp_up(), adapter.send_temp_up(steps=2))
+
+    send_command.assert_awaited_once()
+    assert send_command.await_args.args[0] == [CMD_TEMP_UP] * 3
+
+
+async def test_step_progress(adapter, data):
+    adapter._notification_handler(0, data)
+    progress_callback = MagicMock()
+
+    await adapter.send_temp_up(steps=2, progress_callback=progress_callback)
+    for _ in range(3):
+        data[-6] += 1
+        data[-1] += 1
+        adapter._notification_handler(0, data)
+
+    assert [call.args for call in progress_callback.call_args_list] == [(1, 2), (2, 2)]
+
+
+async def test_step_progress_of_steps_reported_by_one_frame(adapter, data):
+    adapter._notification_handler(0, data)
+    progress_callback = MagicMock()
+
+    await adapter.send_temp_up(steps=3, progress_callback=progress_callback)
+    data[-6] += 2
+    data[-1] += 2
+    adapter._notification_handler(0, data)
+    data[-6] += 1
+    data[-1] += 1
+    adapter._notification_handler(0, data)
+
+    assert [call.args for call in progress_callback.call_args_list] == [(2, 3), (3, 3)]
+    assert not adapter._callbacks
+
+
+async def test_step_progress_of_commands_confirmed_by_one_frame(adapter, data):
+    adapter._notification_handler(0, data)
+    temp_progress, time_progress = MagicMock(), MagicMock()
+
+    await adapter.send_temp_up(progress_callback=temp_progress)
+    await adapter.send_time_up(progress_callback=time_progress)
+    data[-6] += 1
+    data[-5] += 1
+    data[-1] += 2
+    adapter._notification_handler(0, data)
+
+    temp_progress.assert_called_once_with(1, 1)
+    time_progress.assert_called_once_with(1, 1)
+
+
+@pytest.fixture
+def write_gatt_char(connected_adapter, emulator):
+    with patch.object(
+        emulator.client, "write_gatt_char", wraps=emulator.client.write_gatt_char
+    ) as write_gatt_char:
+        yield write_gatt_char
+
+
+async def test_write_without_response(connected_adapter, write_gatt_char):
+    connected_adapter.write_without_response = True
+
+    await connected_adapter._send_command([CMD_TEMP_UP])
+
+    write_gatt_char.assert_awaited_once_with(
+        CHARACTERISTIC_WRITE, data=CMD_TEMP_UP, response=False
+    )
+    assert connected_adapter.write_without_response
+
+
+async def test_write_without_response_fallback(
+    connected_adapter, emulator, write_gatt_char
+):
+    connected_adapter.write_without_response = True
+    emulator.notification_delay = 3600
+
+    with patch(
+        "custom_components.artsauna_ble.artsauna_ble.artsauna_ble_adapter.WRITE_CONFIRMATION_TIMEOUT",
+        0.01,
+    ):
+        with pytest.raises(ArtsaunaCommandError):
+            await connected_adapter._send_command([CMD_TEMP_UP])
+        await connected_adapter._send_command([CMD_TEMP_UP])
+
+    # the unconfirmed burst is not written again, only later ones with response
+    assert write_gatt_char.mock_calls == [
+        call(CHARACTERISTIC_WRITE, data=CMD_TEMP_UP, response=False),
+        call(CHARACTERISTIC_WRITE, data=CMD_TEMP_UP),
+    ]
+    assert not connected_adapter.write_without_response
+
+
+async def test_wait_for_state(adapter, data):
+    waiter = asyncio.ensure_future(
+        adapter.wait_for_state(lambda state: state.volume == 11, timeout=1)
+    )
+    await asyncio.sleep(0)
+
+    adapter._notification_handler(0, data)
+
+    assert (await waiter).volume == 11
+    assert not adapter._state_waiters
+
+
+async def test_wait_for_state_satisfied(adapter):
+    state = await adapter.wait_for_state(lambda state: state.volume == 0, timeout=1)
+
+    assert state is adapter.state
+
+
+async def test_wait_for_state_timeout(adapter):
+    with pytest.raises(TimeoutError):
+        await adapter.wait_for_state(lambda state: state.volume == 11, timeout=0)
+
+    assert not adapter._state_waiters
+
+
+async def test_confirmed_command(connected_adapter, emulator):
+    connected_adapter._notification_handler(0, emulator.sauna.state_notification())
+
+    await connected_adapter.send_toggle_power(confirm=True)
+
+    assert connected_adapter.is_power_on
+    assert emulator.sauna.is_power_on
+    assert connected_adapter.last_round_trip_time is not None
+    assert connected_adapter.confirmation_latency.count == 1
+    assert connected_adapter.write_latency.count == 1
+
+
+async def test_confirmation_latency_excludes_the_queue(emulated_adapter, emulator):
+    emulator.connect_delay = 0.05
+    emulated_adapter._notification_handler(0, emulator.sauna.state_notification())
+
+    await emulated_adapter.send_toggle_power(confirm=True)
+
+    assert emulated_adapter.last_round_trip_time < 0.05
+
+
+async def test_reconnect_backs_off(adapter):
+    with (
+        patch.object(
+            adapter, "initialise", side_effect=[BleakNotFoundError, BleakError, None]
+        ) as initialise,
+        patch(
+            "custom_components.artsauna_ble.artsauna_ble.artsauna_ble_adapter.BLEAK_BACKOFF_TIME",
+            0.001,
+        ),
+    ):
+        adapter._schedule_reconnect()
+        adapter._schedule_reconnect()
+        await adapter._reconnect_task
+
+    assert initialise.await_count == 3
+
+
+async def test_reconnect_wakes_on_advertisement(adapter):
+    with (
+        patch.object(
+            adapter, "initialise", side_effect=[BleakError, None]
+        ) as initialise,
+        patch(
+            "custom_components.artsauna_ble.artsauna_ble.artsauna_ble_adapter.BLEAK_BACKOFF_TIME",
+            3600,
+        ),
+    ):
+        adapter._schedule_reconnect()
+        await asyncio.sleep(0)
+        adapter.set_ble_device_and_advertisement_data(adapter._ble_device, MagicMock())
+        async with asyncio.timeout(1):
+            await adapter._reconnect_task
+
+    assert initialise.await_count == 2
+
+
+async def test_advertisements_cut_the_backoff_short_once(adapter):
+    with (
+        patch.object(adapter, "initialise", side_effect=BleakError) as initialise,
+        patch(
+            "custom_components.artsauna_ble.artsauna_ble.artsauna_ble_adapter.BLEAK_BACKOFF_TIME",
+            3600,
+        ),
+    ):
+        adapter._schedule_reconnect()
+        for _ in range(5):
+            await asyncio.sleep(0)
+            adapter.set_ble_device_and_advertisement_data(
+                adapter._ble_device, MagicMock()
+            )
+            await asyncio.sleep(0)
+        adapter._reconnect_task.cancel()
+
+    assert initialise.await_count == 2
+
+
+async def test_command_retries_are_bounded(connected_adapter, emulator):
+    emulator.write_failures = COMMAND_ATTEMPTS + 1
+
+    with pytest.raises(ArtsaunaCommandError):
+        await connected_adapter._send_command([CMD_TEMP_UP])
+
+    assert emulator.written.count(CMD_TEMP_UP) == COMMAND_ATTEMPTS
+    # every failed write drops the connection for the next attempt
+    assert emulator.connection_count == COMMAND_ATTEMPTS
+    assert not connected_adapter._operation_lock.locked()
+
+
+async def test_command_not_in_range_fails_fast(emulated_adapter, establish_connection):
+    establish_connection.side_effect = BleakNotFoundError
+
+    with pytest.raises(ArtsaunaCommandError):
+        await emulated_adapter._send_command([CMD_TEMP_UP])
+
+    assert establish_connection.await_count == 1
+
+
+async def test_command_deadline_bounds_the_connect(
+    emulated_adapter, emulator, establish_connection
+):
+    emulator.connect_delay = 3600
+
+    with pytest.raises(ArtsaunaCommandError):
+        await emulated_adapter._send_command(
+            [CMD_TEMP_UP], asyncio.get_running_loop().time() + 0.01
+        )
+
+    assert establish_connection.await_count == 1
+    assert not emulator.connection_count
+
+
+async def test_command_is_not_retried_close_to_its_deadline(
+    connected_adapter, emulator
+):
+    emulator.write_failures = COMMAND_ATTEMPTS
+
+    with pytest.raises(ArtsaunaCommandError):
+        await connected_adapter._send_command(
+            [CMD_TEMP_UP],
+            asyncio.get_running_loop().time() + COMMAND_ATTEMPT_MIN_TIME / 2,
+        )
+
+    assert emulator.written.count(CMD_TEMP_UP) == 1
+
+
+def test_command_error_is_not_retried():
+    assert not issubclass(ArtsaunaCommandError, BLEAK_RETRY_EXCEPTIONS)
+
+
+async def test_idle_disconnect_when_off(connected_adapter, emulator, data):
+    connected_adapter._notification_handler(0, data)
+    connected_adapter._notification_handler(0, data)
+
+    connected_adapter.idle_disconnect_timeout = 0
+    await asyncio.sleep(0.01)
+
+    assert not emulator.client.is_connected
+    assert connected_adapter._idle_disconnected
+
+
+async def test_no_idle_disconnect_when_on(connected_adapter, emulator):
+    connected_adapter.idle_disconnect_timeout = 0
+    await asyncio.sleep(0.01)
+
+    assert emulator.client.is_connected
+
+
+async def test_advertisement_activity_reconnects(adapter):
+    adapter._idle_disconnected = True
+
+    with patch.object(adapter, "initialise") as initialise:
+        advertisement_data = MagicMock(manufacturer_data={1: b"\x00"})
+        adapter.set_ble_device_and_advertisement_data(
+            adapter._ble_device, advertisement_data
+        )
+        await adapter._reconnect_task
+        adapter.set_ble_device_and_advertisement_data(
+            adapter._ble_device, advertisement_data
+        )
+
+    assert initialise.await_count == 1
+    assert adapter._reconnect_task.done()
+
+
+async def test_yielded_slot_is_waited_for_again(connected_adapter, emulator):
+    connected_adapter.yield_slot()
+    await asyncio.sleep(0.01)
+    await connected_adapter._reconnect_task
+
+    assert emulator.connection_count == 2
+    assert emulator.client.is_connected
+
+
+async def test_start_after_stop_does_not_connect(adapter):
+    await adapter.stop()
+
+    adapter.start()
+
+    assert adapter._reconnect_task is None
+
+
+async def test_stop_cancels_the_background_tasks(connected_adapter, emulator):
+    with patch.object(
+        connected_adapter,
+        "_execute_timed_disconnect",
+        side_effect=asyncio.Event().wait,
+    ):
+        connected_adapter.yield_slot()
+        await asyncio.sleep(0)
+        tasks = set(connected_adapter._tasks)
+        await connected_adapter.stop()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    assert all(task.cancelled() for task in tasks)
+    assert not connected_adapter._tasks
+    assert connected_adapter._reconnect_task is None
+    assert not emulator.client.is_connected
+
+
+def test_connected_time(adapter):
+    adapter._expected_disconnect = True
+    adapter._connected_at = time.monotonic() - 10
+
+    adapter._disconnected(MagicMock())
+
+    assert adapter.connected_time >= 10
+    assert adapter._connected_at is None
+
+
+async def test_connection_holds_a_slot(emulator, establish_connection):
+    scheduler = ArtsaunaSlotScheduler(slots=1)
+    adapter = ArtsaunaBLEAdapter(emulator.ble_device, slot_scheduler=scheduler)
+
+    await adapter.initialise()
+
+    assert scheduler.held == 1
+    assert adapter.last_slot_wait_time is not None
+    assert adapter.connect_latency.count == 1
+    await adapter.stop()
+    assert scheduler.held == 0
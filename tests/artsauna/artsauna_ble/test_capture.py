@@ -0,0 +1,99 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+#
+# Artsauna-BLE - integration for Home Assistant
+# Copyright (C) 2025 David & Philipp Aderbauer
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+
+import pytest
+
+from custom_components.artsauna_ble.artsauna_ble import (
+    ArtsaunaBLEAdapter,
+    ArtsaunaCaptureWriter,
+    CaptureKind,
+    read_capture,
+    replay_capture,
+)
+from custom_components.artsauna_ble.artsauna_ble.const import CMD_TEMP_UP
+
+
+@pytest.fixture
+def data():
+    return bytearray.fromhex("ffaa0b5a470501103c41000b4892")
+
+
+@pytest.fixture
+def capture(tmp_path):
+    return ArtsaunaCaptureWriter(tmp_path / "sauna.cap")
+
+
+@pytest.fixture
+def adapter(ble_device):
+    return ArtsaunaBLEAdapter(ble_device)
+
+
+async def test_capture_roundtrip(capture, data):
+    capture.record(CaptureKind.NOTIFICATION, data)
+    capture.record(CaptureKind.WRITE, CMD_TEMP_UP)
+    await capture.async_flush()
+
+    records = list(read_capture(capture.path))
+
+    assert [(record.kind, record.data) for record in records] == [
+        (CaptureKind.NOTIFICATION, bytes(data)),
+        (CaptureKind.WRITE, CMD_TEMP_UP),
+    ]
+    assert records[0].timestamp <= records[1].timestamp
+
+
+async def test_capture_rotation(tmp_path, data):
+    capture = ArtsaunaCaptureWriter(tmp_path / "sauna.cap", max_bytes=64)
+
+    for _ in range(3):
+        capture.record(CaptureKind.NOTIFICATION, data)
+        await capture.async_flush()
+
+    assert [path.name for path in capture.files()] == ["sauna.cap.1", "sauna.cap"]
+    assert len(list(read_capture(capture.path))) == 1
+
+
+async def test_truncated_capture(capture, data):
+    capture.record(CaptureKind.NOTIFICATION, data)
+    await capture.async_flush()
+    capture.path.write_bytes(capture.path.read_bytes()[:-1])
+
+    with pytest.raises(ValueError):
+        list(read_capture(capture.path))
+
+
+async def test_adapter_records_notifications(adapter, capture, data):
+    adapter.capture = capture
+
+    adapter._notification_handler(0, data)
+    await capture.async_flush()
+
+    assert capture.record_count == 1
+
+
+@pytest.mark.parametrize("speed", [None, 1000.0])
+async def test_replay(adapter, capture, data, speed):
+    capture.record(CaptureKind.WRITE, CMD_TEMP_UP)
+    capture.record(CaptureKind.NOTIFICATION, data[:5])
+    capture.record(CaptureKind.NOTIFICATION, data[5:])
+    await capture.async_flush()
+
+    count = await replay_capture(adapter, read_capture(capture.path), speed=speed)
+
+    assert count == 2
+    assert adapter.volume == 11
@@ -0,0 +1,70 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+#
+# Artsauna-BLE - integration for Home Assistant
+# Copyright (C) 2025 David & Philipp Aderbauer
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+
+import pytest
+
+from custom_components.artsauna_ble.artsauna_ble import (
+    SignificantChange,
+    SignificantChangeFilter,
+)
+
+
+@pytest.mark.parametrize(
+    ("change", "previous", "value", "expected"),
+    [
+        (SignificantChange(), 20, 20, False),
+        (SignificantChange(), 20, 21, True),
+        (SignificantChange(absolute=2), 20, 21, False),
+        (SignificantChange(absolute=2), 20, 18, True),
+        (SignificantChange(relative=0.1), 20, 21, False),
+        (SignificantChange(relative=0.1), 20, 22, True),
+        (SignificantChange(absolute=2), None, 20, True),
+        (SignificantChange(absolute=2), "red", "blue", True),
+    ],
+)
+def test_is_significant(change, previous, value, expected):
+    assert change.is_significant(previous, value) is expected
+
+
+def test_filter_counts_the_writes():
+    write_filter = SignificantChangeFilter(SignificantChange(absolute=2))
+
+    written = [
+        write_filter.should_write(value, now)
+        for now, value in enumerate((20, 21, 22, 23))
+    ]
+
+    assert written == [True, False, True, False]
+    assert write_filter.as_dict() == {"emitted": 2, "suppressed": 2}
+
+
+def test_forced_write():
+    write_filter = SignificantChangeFilter(SignificantChange(absolute=2))
+    write_filter.should_write(20, 0)
+
+    assert write_filter.should_write(20, 1, force=True)
+
+
+def test_heartbeat():
+    write_filter = SignificantChangeFilter(SignificantChange(absolute=2, heartbeat=60))
+    write_filter.should_write(20, 0)
+
+    assert not write_filter.should_write(21, 30)
+    assert write_filter.heartbeat_delay(30) == 30
+    assert write_filter.should_write(21, 60)
+    assert write_filter.heartbeat_delay(60) == 60
@@ -0,0 +1,148 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+#
+# Artsauna-BLE - integration for Home Assistant
+# Copyright (C) 2025 David & Philipp Aderbauer
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from custom_components.artsauna_ble.artsauna_ble.command_queue import (
+    ArtsaunaCommandQueue,
+)
+from custom_components.artsauna_ble.artsauna_ble.exceptions import (
+    ArtsaunaCommandError,
+)
+
+
+@pytest.fixture
+def send():
+    return AsyncMock()
+
+
+@pytest.fixture
+def queue(send):
+    return ArtsaunaCommandQueue(send)
+
+
+async def test_burst_is_written_at_once(queue, send):
+    await asyncio.gather(queue.put([b"a"]), queue.put([b"b", b"b"]), queue.put([b"c"]))
+
+    send.assert_awaited_once_with([b"a", b"b", b"b", b"c"], None)
+
+
+async def test_commands_during_write_form_next_burst(queue, send):
+    written = asyncio.Event()
+
+    async def slow_send(commands, deadline):
+        await written.wait()
+
+    send.side_effect = slow_send
+    first = queue.put([b"a"])
+    await asyncio.sleep(0)
+    second = queue.put([b"b"])
+    third = queue.put([b"c"])
+    written.set()
+    await asyncio.gather(first, second, third)
+
+    assert [call.args[0] for call in send.await_args_list] == [[b"a"], [b"b", b"c"]]
+
+
+async def test_error_is_passed_to_the_burst(queue, send):
+    send.side_effect = [TimeoutError, None]
+
+    with pytest.raises(TimeoutError):
+        await queue.put([b"a"])
+    await queue.put([b"b"])
+
+    assert send.await_count == 2
+
+
+async def test_cancel(queue, send):
+    future = queue.put([b"a"])
+
+    queue.cancel()
+
+    assert future.cancelled()
+    assert len(queue) == 0
+
+
+async def test_keyed_commands_are_superseded(queue, send):
+    futures = [
+        queue.put([b"v1"], "volume"),
+        queue.put([b"t"]),
+        queue.put([b"v2"], "volume"),
+        queue.put([b"r1"], "rgb"),
+        queue.put([b"v3"], "volume"),
+    ]
+    await asyncio.gather(*futures)
+
+    send.assert_awaited_once_with([b"t", b"r1", b"v3"], None)
+
+
+async def test_unkeyed_commands_keep_fifo_order(queue, send):
+    await asyncio.gather(queue.put([b"a"]), queue.put([b"a"]), queue.put([b"b"]))
+
+    send.assert_awaited_once_with([b"a", b"a", b"b"], None)
+
+
+async def test_burst_is_sent_with_its_earliest_deadline(queue, send):
+    deadline = asyncio.get_running_loop().time() + 10
+
+    await asyncio.gather(
+        queue.put([b"a"], deadline=deadline + 1),
+        queue.put([b"b"]),
+        queue.put([b"c"], deadline=deadline),
+    )
+
+    send.assert_awaited_once_with([b"a", b"b", b"c"], deadline)
+
+
+async def test_burst_past_its_deadline_fails(queue, send):
+    async def stall_first_send(commands, deadline):
+        if send.await_count == 1:
+            async with asyncio.timeout_at(deadline):
+                await asyncio.Event().wait()
+
+    send.side_effect = stall_first_send
+    deadline = asyncio.get_running_loop().time() + 0.01
+
+    with pytest.raises(TimeoutError):
+        await queue.put([b"a"], deadline=deadline)
+    await queue.put([b"b"])
+
+    assert send.await_count == 2
+
+
+async def test_expired_commands_are_not_written(queue, send):
+    expired = queue.put([b"a"], deadline=asyncio.get_running_loop().time())
+    await queue.put([b"b"])
+
+    with pytest.raises(ArtsaunaCommandError):
+        await expired
+    send.assert_awaited_once_with([b"b"], None)
+
+
+async def test_put_after_cancel_is_drained(queue, send):
+    cancelled = queue.put([b"a"])
+    # cancelled before the drain task ran
+    queue.cancel()
+
+    await queue.put([b"b"])
+
+    assert cancelled.cancelled()
+    send.assert_awaited_once_with([b"b"], None)
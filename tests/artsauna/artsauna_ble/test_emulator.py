@@ -0,0 +1,128 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+#
+# Artsauna-BLE - integration for Home Assistant
+# Copyright (C) 2025 David & Philipp Aderbauer
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from custom_components.artsauna_ble.artsauna_ble.const import (
+    CHARACTERISTIC_WRITE,
+    CMD_TOGGLE_POWER,
+)
+from tests.artsauna.emulator import ArtsaunaEmulator
+
+
+@pytest.fixture
+def emulator():
+    return ArtsaunaEmulator(notification_interval=0.01, seed=1)
+
+
+async def test_commands_change_the_emulated_state(connected_adapter):
+    # toggles are confirmed against the first state notification
+    await connected_adapter.wait_for_state(lambda state: state.state == 5, timeout=1)
+    await connected_adapter.send_toggle_power(confirm=True)
+    await connected_adapter.send_toggle_heating()
+    await connected_adapter.send_temp_up(steps=3)
+    await connected_adapter.wait_for_state(
+        lambda state: state.target_temp == 63, timeout=1
+    )
+
+    assert connected_adapter.is_power_on
+    assert connected_adapter.is_heating_on
+
+
+async def test_confirmed_set_to_the_current_value(connected_adapter, emulator):
+    await connected_adapter.wait_for_state(lambda state: state.state == 5, timeout=1)
+    await connected_adapter.send_toggle_power(confirm=True)
+
+    with patch(
+        "custom_components.artsauna_ble.artsauna_ble.artsauna_ble_adapter.COMMAND_CONFIRMATION_TIMEOUT",
+        0.1,
+    ):
+        await connected_adapter.send_set_volume(emulator.sauna.volume, confirm=True)
+        await connected_adapter.send_set_volume(emulator.sauna.volume, confirm=True)
+
+    assert connected_adapter.state.volume == emulator.sauna.volume
+
+
+async def test_confirmed_absolute_commands(connected_adapter, emulator):
+    await connected_adapter.wait_for_state(lambda state: state.state == 5, timeout=1)
+    await connected_adapter.send_toggle_power(confirm=True)
+
+    await connected_adapter.send_set_rgb(0, confirm=True)
+    await connected_adapter.send_set_volume(40, confirm=True)
+
+    assert connected_adapter.state.rgb == emulator.sauna.rgb == 8
+    assert connected_adapter.state.volume == emulator.sauna.volume == 40
+
+
+async def test_periodic_notifications(connected_adapter):
+    await connected_adapter.wait_for_state(lambda state: state.state == 5, timeout=1)
+
+    assert connected_adapter.frame_decoder.frame_count >= 1
+
+
+async def test_commands_need_the_handshake(emulator):
+    client = await emulator.establish_connection(None, emulator.ble_device, "SAUNA")
+
+    await client.write_gatt_char(CHARACTERISTIC_WRITE, CMD_TOGGLE_POWER)
+
+    assert not emulator.sauna.is_power_on
+
+
+async def test_faulty_link(emulated_adapter, emulator):
+    emulator.fragment_size = 3
+    emulator.bit_error_rate = 0.5
+    await emulated_adapter.initialise()
+    await asyncio.sleep(0.3)
+    await emulated_adapter.stop()
+
+    decoder = emulated_adapter.frame_decoder
+    assert decoder.frame_count
+    assert decoder.resync_count or decoder.dropped_bytes
+    assert emulated_adapter.state.state == 5
+
+
+async def test_dropped_connection_is_reestablished(connected_adapter, emulator):
+    with patch(
+        "custom_components.artsauna_ble.artsauna_ble.artsauna_ble_adapter.BLEAK_BACKOFF_TIME",
+        0.001,
+    ):
+        emulator.connect_failures = 1
+        emulator.drop_connection()
+        await connected_adapter._reconnect_task
+
+    assert emulator.connection_count == 2
+    assert emulator.client.authenticated
+
+
+async def test_start_connects_in_the_background(emulated_adapter, emulator):
+    emulator.connect_delay = 0.05
+    emulator.connect_failures = 1
+    with patch(
+        "custom_components.artsauna_ble.artsauna_ble.artsauna_ble_adapter.BLEAK_BACKOFF_TIME",
+        0.001,
+    ):
+        emulated_adapter.start()
+
+        assert emulator.connection_count == 0
+        await emulated_adapter.wait_for_state(lambda state: state.state == 5, timeout=1)
+        await emulated_adapter.stop()
+
+    assert emulator.connection_count == 1
@@ -0,0 +1,101 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+#
+# Artsauna-BLE - integration for Home Assistant
+# Copyright (C) 2025 David & Philipp Aderbauer
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+
+import pytest
+
+from custom_components.artsauna_ble.artsauna_ble import const
+from custom_components.artsauna_ble.artsauna_ble.frame_decoder import (
+    ArtsaunaFrameDecoder,
+    FrameType,
+)
+
+
+@pytest.fixture
+def state_frame():
+    return bytes.fromhex("ffaa0b5a470501103c41000b4892")
+
+
+@pytest.fixture
+def fm_frame():
+    return bytes.fromhex("420203002706")
+
+
+@pytest.fixture
+def decoder():
+    return ArtsaunaFrameDecoder()
+
+
+def test_single_state_frame(decoder, state_frame):
+    assert decoder.feed(state_frame) == [(FrameType.STATE, state_frame)]
+    assert decoder.frame_count == 1
+    assert len(decoder) == 0
+
+
+def test_all_frames_of_one_packet(decoder, state_frame, fm_frame):
+    frames = decoder.feed(state_frame + fm_frame + state_frame)
+
+    assert frames == [
+        (FrameType.STATE, state_frame),
+        (FrameType.FM, fm_frame),
+        (FrameType.STATE, state_frame),
+    ]
+    assert decoder.frame_count == 3
+
+
+def test_fragmented_frame(decoder, state_frame):
+    assert decoder.feed(state_frame[:1]) == []
+    assert decoder.feed(state_frame[1:9]) == []
+    assert decoder.feed(state_frame[9:]) == [(FrameType.STATE, state_frame)]
+    assert decoder.dropped_bytes == 0
+
+
+def test_frame_containing_newline(decoder):
+    frame = bytes.fromhex("ffaa0b5a4705010a3c41000b48")
+    frame += bytes([sum(frame[2:]) % 256])
+
+    assert decoder.feed(frame) == [(FrameType.STATE, frame)]
+
+
+def test_resync_on_bad_checksum(decoder, state_frame):
+    corrupted = state_frame[:-1] + b"\x00"
+
+    assert decoder.feed(corrupted + state_frame) == [(FrameType.STATE, state_frame)]
+    assert decoder.resync_count == 1
+    assert decoder.dropped_bytes == len(corrupted)
+
+
+def test_junk_is_dropped(decoder, state_frame):
+    assert decoder.feed(b"\x01\x02\x03\x04\x05\x06") == []
+    assert len(decoder) < len(const.STATE_NOTIFICATION_START) + 2
+    assert decoder.feed(state_frame) == [(FrameType.STATE, state_frame)]
+    assert decoder.dropped_bytes == 6
+
+
+def test_buffer_is_bounded(decoder):
+    for _ in range(100):
+        decoder.feed(bytes(range(0x10, 0x50)))
+
+    assert len(decoder) <= const.NOTIFICATION_BUFFER_HIGH_WATER_MARK
+
+
+def test_reset(decoder, state_frame):
+    decoder.feed(state_frame[:5])
+    decoder.reset()
+
+    assert len(decoder) == 0
+    assert decoder.feed(state_frame[5:]) == []
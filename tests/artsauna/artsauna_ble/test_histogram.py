@@ -0,0 +1,57 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+#
+# Artsauna-BLE - integration for Home Assistant
+# Copyright (C) 2025 David & Philipp Aderbauer
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+
+import pytest
+
+from custom_components.artsauna_ble.artsauna_ble.histogram import LatencyHistogram
+
+
+@pytest.fixture
+def histogram():
+    return LatencyHistogram()
+
+
+def test_empty(histogram):
+    assert histogram.quantile(0.5) is None
+    assert histogram.mean is None
+
+
+def test_quantiles(histogram):
+    for _ in range(90):
+        histogram.record(0.15)
+    for _ in range(10):
+        histogram.record(3.0)
+
+    assert 0.1 < histogram.quantile(0.5) <= 0.2
+    assert 2.0 < histogram.quantile(0.95) <= 3.0
+    assert histogram.count == 100
+    assert histogram.max == 3.0
+
+
+def test_overflow_ends_at_max(histogram):
+    histogram.record(100.0)
+
+    assert histogram.quantile(0.95) <= 100.0
+    assert histogram.as_dict()["buckets"]["overflow"] == 1
+
+
+def test_memory_is_constant(histogram):
+    for sample in range(10000):
+        histogram.record(sample / 100)
+
+    assert len(histogram._counts) == len(histogram._bounds) + 1
@@ -0,0 +1,90 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+#
+# Artsauna-BLE - integration for Home Assistant
+# Copyright (C) 2025 David & Philipp Aderbauer
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+
+"""Import-time regression test of the protocol library.
+
+The library is imported standalone in a subprocess with `python -X importtime`,
+like a daemon using it without Home Assistant would.
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+LIBRARY_PARENT = Path(__file__).parents[3] / "custom_components" / "artsauna_ble"
+# cumulative import time of the bare package, Home Assistant alone takes longer
+PACKAGE_IMPORT_TIME_LIMIT = 0.1
+
+
+def _imported_modules(statement: str) -> dict[str, float]:
+    """Cumulative import time in seconds of every module imported by `statement`."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        cwd=LIBRARY_PARENT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    modules = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        _self_time, cumulative_time, module = line.removeprefix("import time:").split(
+            "|"
+        )
+        modules[module.strip()] = int(cumulative_time) / 1e6
+    return modules
+
+
+def test_package_import_is_lazy():
+    modules = _imported_modules("import artsauna_ble")
+
+    assert modules["artsauna_ble"] < PACKAGE_IMPORT_TIME_LIMIT
+    assert not [module for module in modules if module.startswith("artsauna_ble.")]
+
+
+@pytest.mark.parametrize(
+    "statement",
+    [
+        "from artsauna_ble import ArtsaunaState",
+        "from artsauna_ble.protocol import decode_state",
+        "from artsauna_ble.frame_decoder import ArtsaunaFrameDecoder",
+    ],
+)
+def test_protocol_imports_no_ble_stack(statement):
+    modules = _imported_modules(statement)
+
+    assert not [
+        module
+        for module in modules
+        if module.partition(".")[0] in ("homeassistant", "bleak")
+    ]
+
+
+def test_library_imports_no_home_assistant():
+    pytest.importorskip("bleak_retry_connector")
+    modules = _imported_modules(
+        "import artsauna_ble;"
+        " [getattr(artsauna_ble, name) for name in artsauna_ble.__all__]"
+    )
+
+    # only the adapter depends on the connector
+    assert "bleak_retry_connector" in modules
+    assert not [module for module in modules if module.startswith("homeassistant")]
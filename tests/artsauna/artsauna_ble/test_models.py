@@ -0,0 +1,92 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+#
+# Artsauna-BLE - integration for Home Assistant
+# Copyright (C) 2025 David & Philipp Aderbauer
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+
+import pytest
+
+from custom_components.artsauna_ble.artsauna_ble.models import (
+    ArtsaunaField,
+    ArtsaunaState,
+)
+
+
+@pytest.fixture
+def data():
+    return bytes.fromhex("ffaa0b5a470501103c41000b4892")
+
+
+@pytest.fixture
+def radio_data():
+    return bytes.fromhex("420203002706")
+
+
+def test_validate(data):
+    assert ArtsaunaState.validate_ble_state_data(data)
+    assert not ArtsaunaState.validate_ble_state_data(data[:-1] + b"\x00")
+
+
+def test_new_from_ble_state_data(data):
+    state = ArtsaunaState(state=4, fm_frequency=9990).new_from_ble_state_data(data)
+
+    assert state == ArtsaunaState(
+        state=5,
+        previous_state=4,
+        heating_state=1,
+        target_temp=60,
+        current_temp=16,
+        remaining_time=65,
+        unit_is_celsius=0,
+        volume=11,
+        light=0,
+        rgb=8,
+        fm_frequency=9990,
+    )
+
+
+@pytest.mark.parametrize(
+    "light_byte, expected_light, expected_rgb",
+    [(0x00, 0, 0), (0x16, 1, 6), (0x37, 3, 7), (0xAB, 2, 11), (0xF8, 3, 8)],
+)
+def test_new_from_ble_state_data_light(data, light_byte, expected_light, expected_rgb):
+    data = bytearray(data)
+    data[-2] = light_byte
+
+    state = ArtsaunaState().new_from_ble_state_data(data)
+
+    assert state.light == expected_light
+    assert state.rgb == expected_rgb
+
+
+def test_new_from_ble_fm_data(radio_data):
+    state = ArtsaunaState(state=4, volume=11).new_from_ble_fm_data(radio_data)
+
+    assert state.fm_frequency == 9990
+    assert state.volume == 11
+    assert state.previous_state == 4
+
+
+def test_state_is_slotted():
+    assert not hasattr(ArtsaunaState(), "__dict__")
+
+
+def test_changed_fields():
+    state = ArtsaunaState(state=4, volume=11)
+
+    assert not state.changed_fields(ArtsaunaState(state=4, volume=11))
+    assert state.changed_fields(ArtsaunaState(state=5, volume=12, rgb=3)) == (
+        ArtsaunaField.STATE | ArtsaunaField.VOLUME | ArtsaunaField.RGB
+    )
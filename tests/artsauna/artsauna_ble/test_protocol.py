@@ -0,0 +1,101 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+#
+# Artsauna-BLE - integration for Home Assistant
+# Copyright (C) 2025 David & Philipp Aderbauer
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+
+import pytest
+
+from custom_components.artsauna_ble.artsauna_ble import protocol
+from custom_components.artsauna_ble.artsauna_ble.protocol import CommandCode
+
+
+@pytest.mark.parametrize(
+    ("code", "argument", "frame"),
+    [
+        (CommandCode.POWER, None, b"\xff\xaa\x05ZG\x0e\x00\xb4"),
+        (CommandCode.HEATING, None, b"\xff\xaa\x05ZG\x00\x02\xa8"),
+        (CommandCode.TIME_DOWN, None, b"\xff\xaa\x05ZG\t\x00\xaf"),
+        (CommandCode.RGB, 8, b"\xff\xaa\x05ZG\n\x08\xb8"),
+        (CommandCode.VOLUME, 11, b"\xff\xaa\x05ZG\r\x0b\xbe"),
+    ],
+)
+def test_command_frame(code, argument, frame):
+    assert protocol.command_frame(code, argument) == frame
+
+
+def test_auth_frame():
+    assert protocol.AUTH_FRAME == b"\xff\xaa\x05ASOK3"
+
+
+def test_absolute_command_frames():
+    assert len(protocol.VOLUME_FRAMES) == 41
+    assert len(protocol.RGB_FRAMES) == 9
+    assert all(
+        protocol.has_valid_checksum(frame)
+        for frame in protocol.VOLUME_FRAMES + protocol.RGB_FRAMES
+    )
+
+
+def test_rgb_state_values():
+    assert protocol.RGB_STATE_VALUES == (8, 0, 1, 2, 3, 4, 5, 6, 7)
+
+
+def test_invalid_argument():
+    with pytest.raises(ValueError):
+        protocol.command_frame(CommandCode.VOLUME, 41)
+
+
+def test_decode_state():
+    frame = bytes.fromhex("ffaa0b5a470501103c41000b4892")
+
+    decoded = dict(zip(protocol.STATE_FIELD_NAMES, protocol.decode_state(frame)))
+
+    assert decoded == {
+        "state": 5,
+        "heating_state": 1,
+        "current_temp": 16,
+        "target_temp": 60,
+        "remaining_time": 65,
+        "unit_is_celsius": 0,
+        "volume": 11,
+        "light": 0,
+        "rgb": 8,
+    }
+
+
+def test_decode_fm():
+    assert protocol.decode_fm(b"B\x02\x03\x00)\xae") == 10670
+
+
+def test_encode_state():
+    values = (4, 1, 60, 16, 65, 0, 11, 3, 2)
+
+    frame = protocol.encode_state(values)
+
+    assert frame == bytes.fromhex("ffaa0b5a470401103c41000b327b")
+    assert protocol.decode_state(frame) == values
+
+
+def test_encode_state_invalid_value():
+    values = list(protocol.decode_state(bytes.fromhex("ffaa0b5a470501103c41000b4892")))
+    values[protocol.STATE_FIELD_NAMES.index("rgb")] = 16
+
+    with pytest.raises(ValueError):
+        protocol.encode_state(values)
+
+
+def test_encode_fm():
+    assert protocol.encode_fm(10670) == b"B\x02\x03\x00)\xae"
@@ -0,0 +1,74 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+#
+# Artsauna-BLE - integration for Home Assistant
+# Copyright (C) 2025 David & Philipp Aderbauer
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from custom_components.artsauna_ble.artsauna_ble import (
+    HourlyAggregate,
+    HourlySampleSeries,
+)
+
+START = datetime(2025, 1, 1, 18, tzinfo=UTC)
+
+
+def test_samples_are_weighted_by_duration():
+    series = HourlySampleSeries()
+    series.add(START, 20)
+    series.add(START + timedelta(minutes=45), 60)
+
+    assert series.take(START + timedelta(hours=1)) == [
+        HourlyAggregate(START, 30, 20, 60)
+    ]
+
+
+def test_samples_are_split_at_hours():
+    series = HourlySampleSeries()
+    series.add(START + timedelta(minutes=30), 40)
+
+    aggregates = series.take(START + timedelta(hours=2))
+
+    assert [aggregate.start for aggregate in aggregates] == [
+        START,
+        START + timedelta(hours=1),
+    ]
+    assert aggregates[1].mean == 40
+
+
+def test_take_keeps_the_current_hour():
+    series = HourlySampleSeries()
+    series.add(START, 20)
+
+    assert series.take(START + timedelta(minutes=30)) == []
+    series.add(START + timedelta(minutes=30), 80)
+    (aggregate,) = series.take(START + timedelta(hours=1))
+
+    assert aggregate.mean == pytest.approx(50)
+    assert series.take(START + timedelta(hours=1)) == []
+
+
+def test_pause():
+    series = HourlySampleSeries()
+    series.add(START, 20)
+    series.add(START + timedelta(minutes=10), None)
+
+    (aggregate,) = series.take(START + timedelta(hours=2))
+
+    assert aggregate.mean == 20
+    assert series.take(START + timedelta(hours=3)) == []
@@ -0,0 +1,127 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+#
+# Artsauna-BLE - integration for Home Assistant
+# Copyright (C) 2025 David & Philipp Aderbauer
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+
+from custom_components.artsauna_ble.artsauna_ble.slot_scheduler import (
+    ArtsaunaSlotScheduler,
+)
+
+
+def make_holder(priority=False):
+    return MagicMock(has_slot_priority=priority)
+
+
+@pytest.fixture
+def scheduler():
+    return ArtsaunaSlotScheduler(slots=1, time_slice=3600)
+
+
+async def test_unlimited_slots():
+    scheduler = ArtsaunaSlotScheduler()
+
+    for _ in range(10):
+        await scheduler.acquire(make_holder())
+
+    assert scheduler.held == 10
+
+
+async def test_waits_for_free_slot(scheduler):
+    first, second = make_holder(), make_holder()
+    await scheduler.acquire(first)
+    waiter = asyncio.ensure_future(scheduler.acquire(second))
+    await asyncio.sleep(0)
+
+    assert scheduler.waiting == 1
+    scheduler.release(first)
+
+    assert await waiter >= 0
+    assert scheduler.held == 1
+    assert scheduler.wait_count == 2
+
+
+async def test_priority_waiter_is_admitted_first(scheduler):
+    holder, low, high = make_holder(), make_holder(), make_holder(priority=True)
+    await scheduler.acquire(holder)
+    low_waiter = asyncio.ensure_future(scheduler.acquire(low))
+    high_waiter = asyncio.ensure_future(scheduler.acquire(high))
+    await asyncio.sleep(0)
+
+    scheduler.release(holder)
+    await high_waiter
+
+    assert not low_waiter.done()
+    scheduler.release(high)
+    await low_waiter
+
+
+async def test_holder_without_priority_yields_after_its_slice():
+    scheduler = ArtsaunaSlotScheduler(slots=1, time_slice=0)
+    holder = make_holder()
+    holder.yield_slot.side_effect = lambda: scheduler.release(holder)
+    await scheduler.acquire(holder)
+
+    await scheduler.acquire(make_holder())
+
+    holder.yield_slot.assert_called_once()
+    assert scheduler.preemption_count == 1
+
+
+async def test_holder_with_priority_keeps_its_slot():
+    scheduler = ArtsaunaSlotScheduler(slots=1, time_slice=0)
+    holder = make_holder(priority=True)
+    await scheduler.acquire(holder)
+
+    waiter = asyncio.ensure_future(scheduler.acquire(make_holder()))
+    await asyncio.sleep(0)
+
+    holder.yield_slot.assert_not_called()
+    waiter.cancel()
+
+
+async def test_cancelled_waiter_is_removed(scheduler):
+    await scheduler.acquire(make_holder())
+
+    with pytest.raises(TimeoutError):
+        async with asyncio.timeout(0.01):
+            await scheduler.acquire(make_holder())
+
+    assert scheduler.waiting == 0
+
+
+async def test_cancelled_waiter_is_skipped_on_release(scheduler):
+    holder, cancelled, waiting = make_holder(), make_holder(), make_holder()
+    await scheduler.acquire(holder)
+    cancelled_waiter = asyncio.ensure_future(scheduler.acquire(cancelled))
+    waiter = asyncio.ensure_future(scheduler.acquire(waiting))
+    await asyncio.sleep(0)
+
+    # released before the cancelled task resumes
+    cancelled_waiter.cancel()
+    scheduler.release(holder)
+    await waiter
+
+    with pytest.raises(asyncio.CancelledError):
+        await cancelled_waiter
+    assert scheduler.held == 1
+    assert scheduler.waiting == 0
+    scheduler.release(waiting)
+    assert scheduler.held == 0
@@ -0,0 +1,80 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+#
+# Artsauna-BLE - integration for Home Assistant
+# Copyright (C) 2025 David & Philipp Aderbauer
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+
+import pytest
+
+from custom_components.artsauna_ble.artsauna_ble import (
+    ArtsaunaBLEAdapter,
+    ArtsaunaPipelineTracer,
+    PipelineStage,
+)
+
+
+@pytest.fixture
+def data():
+    return bytearray.fromhex("ffaa0b5a470501103c41000b4892")
+
+
+@pytest.fixture
+def tracer():
+    return ArtsaunaPipelineTracer(capacity=2)
+
+
+@pytest.fixture
+def adapter(tracer, ble_device):
+    adapter = ArtsaunaBLEAdapter(ble_device)
+    adapter.tracer = tracer
+    return adapter
+
+
+def test_untaken_trace_is_finished_by_the_adapter(adapter, tracer, data):
+    adapter._notification_handler(0, data)
+
+    assert tracer.current is None
+    assert set(tracer.traces[0].stage_durations()) == {
+        PipelineStage.PARSED,
+        PipelineStage.DECODED,
+    }
+    assert tracer.stage_latency[PipelineStage.DECODED].count == 1
+
+
+def test_trace_is_taken_over(adapter, tracer, data):
+    taken = []
+
+    def receive(state, changed):
+        trace = tracer.take()
+        trace.mark(PipelineStage.DISPATCHED)
+        trace.entity_times.append(("sensor.sauna", 0.001))
+        taken.append(trace)
+
+    adapter.register_callback(receive)
+    adapter._notification_handler(0, data)
+
+    assert not tracer.traces
+    tracer.finish(taken[0])
+    assert PipelineStage.DISPATCHED in taken[0].stage_durations()
+    assert tracer.entity_latency.count == 1
+    assert tracer.as_dict()["traces"][0]["entities"] == {"sensor.sauna": 0.001}
+
+
+def test_recent_traces_are_bounded(adapter, tracer, data):
+    for _ in range(5):
+        adapter._notification_handler(0, data)
+
+    assert len(tracer.traces) == 2
+    assert tracer.stage_latency[PipelineStage.PARSED].count == 5
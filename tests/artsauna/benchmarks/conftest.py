@@ -0,0 +1,132 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+#
+# Artsauna-BLE - integration for Home Assistant
+# Copyright (C) 2025 David & Philipp Aderbauer
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+
+"""Fixtures for the artsauna-bt benchmarks.
+
+The benchmarks compare against a baseline of earlier results, values reported
+with `Benchmark.report` are only listed in the summary.
+They are configured by environment variables:
+
+ARTSAUNA_BENCHMARK_SAVE: if set, the results of the run are saved as new baseline.
+ARTSAUNA_BENCHMARK_BASELINE: path of the baseline file,
+    defaults to .benchmarks/artsauna_baseline.json in the rootdir.
+ARTSAUNA_BENCHMARK_THRESHOLD: allowed relative slowdown against the baseline,
+    defaults to 0.25.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import timeit
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+
+ROUNDS = 5
+DEFAULT_NUMBER = 10000
+DEFAULT_THRESHOLD = 0.25
+
+_RESULTS_KEY = pytest.StashKey[dict[str, float]]()
+_REPORTS_KEY = pytest.StashKey[dict[str, tuple[float, str]]]()
+
+
+def _baseline_path(config: pytest.Config) -> Path:
+    if path := os.environ.get("ARTSAUNA_BENCHMARK_BASELINE"):
+        return Path(path)
+    return config.rootpath / ".benchmarks" / "artsauna_baseline.json"
+
+
+class Benchmark:
+    """Times callables and checks them against the baseline."""
+
+    def __init__(
+        self,
+        baseline: dict[str, float],
+        results: dict[str, float],
+        reports: dict[str, tuple[float, str]],
+        threshold: float,
+    ) -> None:
+        self._baseline = baseline
+        self._results = results
+        self._reports = reports
+        self._threshold = threshold
+
+    def __call__(
+        self, name: str, func: Callable[[], object], number: int = DEFAULT_NUMBER
+    ) -> float:
+        """Return the best time per call of `func` in seconds.
+
+        Fails if it is slower than the baseline by more than the threshold.
+        """
+        seconds = min(timeit.repeat(func, number=number, repeat=ROUNDS)) / number
+        self._results[name] = seconds
+        if (baseline := self._baseline.get(name)) is not None:
+            assert seconds <= baseline * (1 + self._threshold), (
+                f"{name} regressed: {seconds * 1e9:.0f} ns per call"
+                f" against a baseline of {baseline * 1e9:.0f} ns"
+            )
+        return seconds
+
+    def report(self, name: str, value: float, unit: str) -> None:
+        """List a measured value in the summary, it is not checked."""
+        self._reports[name] = (value, unit)
+
+
+@pytest.fixture(scope="session")
+def benchmark_baseline(pytestconfig: pytest.Config) -> dict[str, float]:
+    path = _baseline_path(pytestconfig)
+    if os.environ.get("ARTSAUNA_BENCHMARK_SAVE") or not path.exists():
+        return {}
+    return json.loads(path.read_text())
+
+
+@pytest.fixture
+def benchmark(
+    pytestconfig: pytest.Config, benchmark_baseline: dict[str, float]
+) -> Benchmark:
+    return Benchmark(
+        benchmark_baseline,
+        pytestconfig.stash.setdefault(_RESULTS_KEY, {}),
+        pytestconfig.stash.setdefault(_REPORTS_KEY, {}),
+        float(os.environ.get("ARTSAUNA_BENCHMARK_THRESHOLD", DEFAULT_THRESHOLD)),
+    )
+
+
+def pytest_sessionfinish(session: pytest.Session) -> None:
+    results = session.config.stash.get(_RESULTS_KEY, {})
+    if not results or not os.environ.get("ARTSAUNA_BENCHMARK_SAVE"):
+        return
+    path = _baseline_path(session.config)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    baseline = json.loads(path.read_text()) if path.exists() else {}
+    baseline.update(results)
+    path.write_text(json.dumps(baseline, indent=2, sort_keys=True))
+
+
+def pytest_terminal_summary(terminalreporter, config: pytest.Config) -> None:
+    results = config.stash.get(_RESULTS_KEY, {})
+    reports = config.stash.get(_REPORTS_KEY, {})
+    if not results and not reports:
+        return
+    terminalreporter.section("artsauna benchmarks")
+    for name, seconds in sorted(results.items()):
+        terminalreporter.line(f"{name:<50} {seconds * 1e9:>10.0f} ns")
+    for name, (value, unit) in sorted(reports.items()):
+        terminalreporter.line(f"{name:<50} {value:>10.2f} {unit}")
@@ -0,0 +1,191 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+#
+# Artsauna-BLE - integration for Home Assistant
+# Copyright (C) 2025 David & Philipp Aderbauer
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+
+"""Load test of the integration with many emulated saunas.
+
+Sets up one config entry per emulated sauna with the coordinator and all
+entities and reports the event loop lag, the CPU time per notification, the
+state writes per second and the memory growth in the benchmark summary.
+It only runs on request and is configured by environment variables:
+
+ARTSAUNA_LOAD_DEVICES: comma separated numbers of saunas, e.g. 1,5,10.
+    The load test is skipped unless it is set.
+ARTSAUNA_LOAD_RATE: notifications per second of each sauna, defaults to 10.
+ARTSAUNA_LOAD_SECONDS: duration of each run, defaults to 5.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import time
+import tracemalloc
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+pytest.importorskip("pytest_homeassistant_custom_component")
+
+from homeassistant.const import CONF_ADDRESS, EVENT_STATE_CHANGED
+from homeassistant.core import Event, HomeAssistant, callback
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+)
+
+from custom_components.artsauna_ble.artsauna_ble.histogram import (
+    LatencyHistogram,
+)
+from custom_components.artsauna_ble.const import DOMAIN
+from tests.artsauna.emulator import HEATING_ON, STATE_ON, ArtsaunaEmulator
+
+DEVICES = [
+    int(devices)
+    for devices in os.environ.get("ARTSAUNA_LOAD_DEVICES", "").split(",")
+    if devices
+]
+RATE = float(os.environ.get("ARTSAUNA_LOAD_RATE", "10"))
+SECONDS = float(os.environ.get("ARTSAUNA_LOAD_SECONDS", "5"))
+PROBE_INTERVAL = 0.01
+LAG_BUCKET_BOUNDS = (0.001, 0.002, 0.005, 0.01, 0.02, 0.05, 0.1, 0.2, 0.5, 1.0)
+
+
+async def _probe_loop_lag(histogram: LatencyHistogram) -> None:
+    """Record how late the event loop wakes up a sleeping task."""
+    loop = asyncio.get_running_loop()
+    while True:
+        expected = loop.time() + PROBE_INTERVAL
+        await asyncio.sleep(PROBE_INTERVAL)
+        histogram.record(max(0.0, loop.time() - expected))
+
+
+async def _churn(emulator: ArtsaunaEmulator) -> None:
+    """Change the emulated volume so every notification changes the state."""
+    while True:
+        await asyncio.sleep(1 / RATE)
+        emulator.sauna.volume = (emulator.sauna.volume + 1) % 50
+
+
+@pytest.mark.skipif(not DEVICES, reason="ARTSAUNA_LOAD_DEVICES is not set")
+# the coordinator debounce may still be pending at the end
+@pytest.mark.parametrize("expected_lingering_timers", [True])
+@pytest.mark.parametrize("devices", DEVICES)
+async def test_load(
+    hass: HomeAssistant,
+    enable_custom_integrations: None,
+    benchmark,
+    devices: int,
+) -> None:
+    emulators: dict[str, ArtsaunaEmulator] = {}
+    for index in range(devices):
+        address = f"AA:BB:CC:DD:{index // 256:02X}:{index % 256:02X}"
+        emulator = ArtsaunaEmulator(
+            address=address, name=f"SAUNA {index}", notification_interval=1 / RATE
+        )
+        # powered on and heating, so every entity is available
+        emulator.sauna.state = STATE_ON
+        emulator.sauna.heating_state = HEATING_ON
+        emulators[address] = emulator
+
+    async def establish_connection(client_class, device, *args, **kwargs):
+        return await emulators[device.address].establish_connection(
+            client_class, device, *args, **kwargs
+        )
+
+    # the bluetooth stack is replaced by the emulators
+    hass.config.components.add("bluetooth_adapters")
+    state_writes = 0
+
+    @callback
+    def _count_state_write(event: Event) -> None:
+        nonlocal state_writes
+        state_writes += 1
+
+    with (
+        patch(
+            "custom_components.artsauna_ble.close_stale_connections_by_address",
+            AsyncMock(),
+        ),
+        patch(
+            "custom_components.artsauna_ble.bluetooth.async_ble_device_from_address",
+            side_effect=lambda hass, address, connectable: (
+                emulators[address].ble_device
+            ),
+        ),
+        patch(
+            "custom_components.artsauna_ble.bluetooth.async_register_callback",
+            return_value=lambda: None,
+        ),
+        patch(
+            "custom_components.artsauna_ble.artsauna_ble.artsauna_ble_adapter.establish_connection",
+            establish_connection,
+        ),
+    ):
+        entries = []
+        for address, emulator in emulators.items():
+            entry = MockConfigEntry(
+                domain=DOMAIN,
+                data={CONF_ADDRESS: address},
+                unique_id=address,
+                title=emulator.ble_device.name,
+            )
+            entry.add_to_hass(hass)
+            assert await hass.config_entries.async_setup(entry.entry_id)
+            entries.append(entry)
+        await hass.async_block_till_done()
+
+        lag = LatencyHistogram(LAG_BUCKET_BOUNDS)
+        tasks = [
+            hass.async_create_background_task(_probe_loop_lag(lag), "lag probe"),
+            *(
+                hass.async_create_background_task(_churn(emulator), "churn")
+                for emulator in emulators.values()
+            ),
+        ]
+        unsubscribe = hass.bus.async_listen(EVENT_STATE_CHANGED, _count_state_write)
+        adapters = [hass.data[DOMAIN][entry.entry_id].device for entry in entries]
+        frames_before = sum(adapter.frame_decoder.frame_count for adapter in adapters)
+        tracemalloc.start()
+        memory_before = tracemalloc.get_traced_memory()[0]
+        cpu_before = time.process_time()
+
+        await asyncio.sleep(SECONDS)
+
+        cpu = time.process_time() - cpu_before
+        memory_growth = tracemalloc.get_traced_memory()[0] - memory_before
+        tracemalloc.stop()
+        frames = (
+            sum(adapter.frame_decoder.frame_count for adapter in adapters)
+            - frames_before
+        )
+        unsubscribe()
+        for task in tasks:
+            task.cancel()
+        for entry in entries:
+            assert await hass.config_entries.async_unload(entry.entry_id)
+        await hass.async_block_till_done()
+
+    name = f"load[{devices}]"
+    benchmark.report(f"{name}_loop_lag_p50", lag.quantile(0.5) * 1e3, "ms")
+    benchmark.report(f"{name}_loop_lag_p95", lag.quantile(0.95) * 1e3, "ms")
+    benchmark.report(f"{name}_loop_lag_max", lag.max * 1e3, "ms")
+    benchmark.report(f"{name}_notifications", frames / SECONDS, "1/s")
+    benchmark.report(f"{name}_cpu_per_notification", cpu / max(frames, 1) * 1e6, "us")
+    benchmark.report(f"{name}_state_writes", state_writes / SECONDS, "1/s")
+    benchmark.report(f"{name}_memory_growth", memory_growth / 1024, "KiB")
+    assert frames
+    assert state_writes
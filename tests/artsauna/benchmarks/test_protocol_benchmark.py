@@ -0,0 +1,114 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+#
+# Artsauna-BLE - integration for Home Assistant
+# Copyright (C) 2025 David & Philipp Aderbauer
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+
+"""Microbenchmarks of the protocol hot paths."""
+
+import pytest
+from bleak.backends.device import BLEDevice
+
+from custom_components.artsauna_ble.artsauna_ble import (
+    ArtsaunaBLEAdapter,
+    ArtsaunaPipelineTracer,
+    utils,
+)
+from custom_components.artsauna_ble.artsauna_ble.models import (
+    ArtsaunaField,
+    ArtsaunaState,
+)
+
+
+@pytest.fixture
+def data():
+    return bytes.fromhex("ffaa0b5a470501103c41000b4892")
+
+
+@pytest.fixture
+def radio_data():
+    return bytes.fromhex("420203002706")
+
+
+@pytest.fixture
+def adapter():
+    return ArtsaunaBLEAdapter(BLEDevice("AA:BB:CC:DD:EE:FF", "SAUNA", None))
+
+
+def test_notification_handler_benchmark(benchmark, adapter, data, radio_data):
+    packet = bytearray(data + radio_data)
+
+    seconds = benchmark(
+        "notification_handler", lambda: adapter._notification_handler(0, packet)
+    )
+
+    benchmark.report("notification_handler_frames", 2 / seconds, "frames/s")
+
+
+def test_notification_handler_traced_benchmark(benchmark, adapter, data, radio_data):
+    packet = bytearray(data + radio_data)
+    adapter.tracer = ArtsaunaPipelineTracer()
+
+    benchmark(
+        "notification_handler_traced", lambda: adapter._notification_handler(0, packet)
+    )
+
+
+def test_notification_handler_fragmented_benchmark(benchmark, adapter, data):
+    first, second = bytearray(data[:5]), bytearray(data[5:])
+
+    def handle() -> None:
+        adapter._notification_handler(0, first)
+        adapter._notification_handler(0, second)
+
+    benchmark("notification_handler_fragmented", handle)
+
+
+def test_validate_ble_state_data_benchmark(benchmark, data):
+    benchmark(
+        "validate_ble_state_data", lambda: ArtsaunaState.validate_ble_state_data(data)
+    )
+
+
+def test_new_from_ble_state_data_benchmark(benchmark, data):
+    state = ArtsaunaState()
+
+    benchmark("new_from_ble_state_data", lambda: state.new_from_ble_state_data(data))
+
+
+def test_new_from_ble_fm_data_benchmark(benchmark, radio_data):
+    state = ArtsaunaState()
+
+    benchmark("new_from_ble_fm_data", lambda: state.new_from_ble_fm_data(radio_data))
+
+
+def test_construct_volume_cmd_data_benchmark(benchmark):
+    benchmark("construct_volume_cmd_data", lambda: utils.construct_volume_cmd_data(20))
+
+
+def test_construct_rgb_cmd_data_benchmark(benchmark):
+    benchmark("construct_rgb_cmd_data", lambda: utils.construct_rgb_cmd_data(4))
+
+
+@pytest.mark.parametrize("subscribers", [1, 10, 100])
+def test_fire_callbacks_benchmark(benchmark, adapter, subscribers):
+    for _ in range(subscribers):
+        adapter.register_callback(lambda state, changed: None)
+
+    benchmark(
+        f"fire_callbacks[{subscribers}]",
+        lambda: adapter._fire_callbacks(ArtsaunaField.ALL),
+        number=100000 // subscribers,
+    )
@@ -0,0 +1,120 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+#
+# Artsauna-BLE - integration for Home Assistant
+# Copyright (C) 2025 David & Philipp Aderbauer
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+
+"""Startup benchmark of the integration against a slowly connecting emulator.
+
+The config entry setup must return while the emulator is still connecting.
+The entities become available once the background connection delivers the
+first state. The setup time and the time to the first state are reported in
+the benchmark summary.
+"""
+
+from __future__ import annotations
+
+import time
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+pytest.importorskip("pytest_homeassistant_custom_component")
+
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.const import CONF_ADDRESS, STATE_UNAVAILABLE
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.artsauna_ble.const import DOMAIN
+from tests.artsauna.emulator import STATE_ON, ArtsaunaEmulator
+
+CONNECT_DELAY = 1.0
+
+
+async def test_startup_benchmark(
+    hass: HomeAssistant, enable_custom_integrations: None, benchmark
+) -> None:
+    emulator = ArtsaunaEmulator(notification_interval=0.01, connect_delay=CONNECT_DELAY)
+    emulator.sauna.state = STATE_ON
+    address = emulator.ble_device.address
+
+    # the bluetooth stack is replaced by the emulator
+    hass.config.components.add("bluetooth_adapters")
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={CONF_ADDRESS: address},
+        unique_id=address,
+        title=emulator.ble_device.name,
+    )
+    entry.add_to_hass(hass)
+
+    with (
+        patch(
+            "custom_components.artsauna_ble.close_stale_connections_by_address",
+            AsyncMock(),
+        ),
+        patch(
+            "custom_components.artsauna_ble.bluetooth.async_ble_device_from_address",
+            return_value=None,
+        ),
+        patch(
+            "custom_components.artsauna_ble.bluetooth.async_register_callback",
+            return_value=lambda: None,
+        ),
+        patch(
+            "custom_components.artsauna_ble.artsauna_ble.artsauna_ble_adapter.establish_connection",
+            emulator.establish_connection,
+        ),
+    ):
+        start = time.perf_counter()
+        assert await hass.config_entries.async_setup(entry.entry_id)
+        setup_time = time.perf_counter() - start
+        await hass.async_block_till_done()
+
+        # the setup did not wait for the connection
+        assert emulator.connection_count == 0
+
+        assert entry.state is ConfigEntryState.LOADED
+        entity_ids = [
+            entity.entity_id
+            for entity in er.async_entries_for_config_entry(
+                er.async_get(hass), entry.entry_id
+            )
+        ]
+        assert entity_ids
+        assert all(
+            hass.states.get(entity_id).state == STATE_UNAVAILABLE
+            for entity_id in entity_ids
+        )
+
+        device = hass.data[DOMAIN][entry.entry_id].device
+        start = time.perf_counter()
+        await device.wait_for_state(
+            lambda state: state.is_power_on, timeout=CONNECT_DELAY + 1
+        )
+        await hass.async_block_till_done()
+        connect_time = time.perf_counter() - start
+        power = er.async_get(hass).async_get_entity_id(
+            "switch", DOMAIN, f"{device.address}_power"
+        )
+        assert hass.states.get(power).state != STATE_UNAVAILABLE
+
+        assert await hass.config_entries.async_unload(entry.entry_id)
+        await hass.async_block_till_done()
+
+    benchmark.report("startup_setup", setup_time * 1e3, "ms")
+    benchmark.report("startup_first_state", connect_time * 1e3, "ms")
@@ -0,0 +1,90 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+#
+# Artsauna-BLE - integration for Home Assistant
+# Copyright (C) 2025 David & Philipp Aderbauer
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+
+"""Microbenchmark of the state decoding against the former hex string decoding."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import pytest
+
+from custom_components.artsauna_ble.artsauna_ble.models import ArtsaunaState
+
+# byte positions of the former decoding, counted from the end of the frame
+DEVICE_STATE_BYTE_POSITION = -9
+HEATING_STATE_BYTE_POSITION = -8
+CURRENT_TEMP_BYTE_POSITION = -7
+TARGET_TEMP_BYTE_POSITION = -6
+TIME_BYTE_POSITION = -5
+UNIT_BYTE_POSITION = -4
+VOLUME_BYTE_POSITION = -3
+LIGHT_BYTE_POSITION = -2
+
+
+@dataclass(frozen=True)
+class LegacyArtsaunaState:
+    """The state decoding as it was done before the struct based decoder."""
+
+    state: int = 0
+    previous_state: int | None = None
+    heating_state: int = 0
+    target_temp: int = 0
+    current_temp: int = 0
+    remaining_time: int = 0
+    unit_is_celsius: int = 0
+    volume: int = 0
+    light: int = 0
+    rgb: int = 0
+    fm_frequency: int = 0
+
+    def new_from_ble_state_data(self, ble_state_data: bytes) -> LegacyArtsaunaState:
+        return LegacyArtsaunaState(
+            state=int(ble_state_data[DEVICE_STATE_BYTE_POSITION]),
+            previous_state=self.state,
+            heating_state=int(ble_state_data[HEATING_STATE_BYTE_POSITION]),
+            target_temp=int(ble_state_data[TARGET_TEMP_BYTE_POSITION]),
+            current_temp=int(ble_state_data[CURRENT_TEMP_BYTE_POSITION]),
+            remaining_time=int(ble_state_data[TIME_BYTE_POSITION]),
+            unit_is_celsius=int(ble_state_data[UNIT_BYTE_POSITION]),
+            volume=int(ble_state_data[VOLUME_BYTE_POSITION]),
+            light=int(ble_state_data[LIGHT_BYTE_POSITION].to_bytes().hex()[0]) % 4,
+            rgb=int(ble_state_data[LIGHT_BYTE_POSITION].to_bytes().hex()[1]),
+            fm_frequency=self.fm_frequency,
+        )
+
+
+@pytest.fixture
+def data():
+    return bytes.fromhex("ffaa0b5a470501103c41000b4892")
+
+
+def test_state_decode_benchmark(benchmark, data):
+    legacy, current = LegacyArtsaunaState(), ArtsaunaState()
+
+    benchmark("state_decode_legacy", lambda: legacy.new_from_ble_state_data(data))
+    benchmark("state_decode", lambda: current.new_from_ble_state_data(data))
+
+
+def test_state_decode_equivalence(data):
+    legacy = LegacyArtsaunaState(state=4).new_from_ble_state_data(data)
+    current = ArtsaunaState(state=4).new_from_ble_state_data(data)
+
+    assert vars(legacy) == {
+        field: getattr(current, field) for field in ArtsaunaState.__slots__
+    }
@@ -0,0 +1,381 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+#
+# Artsauna-BLE - integration for Home Assistant
+# Copyright (C) 2025 David & Philipp Aderbauer
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+
+from __future__ import annotations
+
+import asyncio
+import random
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+from uuid import UUID
+
+from bleak.backends.device import BLEDevice
+from bleak.exc import BleakError
+
+from custom_components.artsauna_ble.artsauna_ble.const import (
+    CHARACTERISTIC_NOTIFY,
+    CHARACTERISTIC_WRITE,
+    CMD_APP_AUTH,
+)
+from custom_components.artsauna_ble.artsauna_ble.protocol import (
+    COMMAND_ARGUMENTS,
+    COMMAND_PAYLOAD_PREFIX,
+    FRAME_HEADER,
+    RGB_STATE_VALUES,
+    CommandCode,
+    encode_fm,
+    encode_state,
+    has_valid_checksum,
+)
+
+COMMAND_PREFIX = FRAME_HEADER + COMMAND_PAYLOAD_PREFIX
+
+STATE_OFF = 5
+STATE_ON = 4
+STATE_RADIO = 0
+STATE_BT = 1
+STATE_USB = 3
+HEATING_ON = 1
+HEATING_OFF = 2
+RGB_OFF = 6
+
+MIN_TEMP_CELSIUS = 30
+MAX_TEMP_CELSIUS = 70
+MAX_TIME = 90
+MAX_VOLUME = COMMAND_ARGUMENTS[CommandCode.VOLUME][-1]
+AMBIENT_TEMP_CELSIUS = 20.0
+# degrees per second towards the target while heating, towards ambient otherwise
+HEATING_RATE = 0.05
+COOLING_RATE = 0.01
+
+
+@dataclass
+class EmulatedSaunaState:
+    """The state machine of the emulated sauna, temperatures in Celsius."""
+
+    state: int = STATE_OFF
+    heating_state: int = HEATING_OFF
+    current_temp: float = AMBIENT_TEMP_CELSIUS
+    target_temp: int = 60
+    remaining_time: int = 60
+    unit_is_celsius: int = 0
+    volume: int = 10
+    light: int = 0
+    rgb: int = RGB_OFF
+    fm_frequency: int = 9990
+    # seconds of heating since the remaining time was last decremented
+    elapsed: float = 0.0
+
+    @property
+    def is_power_on(self) -> bool:
+        return self.state != STATE_OFF
+
+    @property
+    def is_heating(self) -> bool:
+        return self.is_power_on and self.heating_state == HEATING_ON
+
+    def apply(self, command: int, argument: int) -> None:
+        """Apply a command, everything but power is ignored while off."""
+        if command == CommandCode.POWER:
+            self.state = STATE_ON if self.state == STATE_OFF else STATE_OFF
+            self.heating_state = HEATING_OFF
+            return
+        if not self.is_power_on:
+            return
+        match command:
+            case CommandCode.HEATING:
+                self.heating_state = (
+                    HEATING_OFF if self.heating_state == HEATING_ON else HEATING_ON
+                )
+            case CommandCode.TEMP_UP:
+                self.target_temp = min(MAX_TEMP_CELSIUS, self.target_temp + 1)
+            case CommandCode.TEMP_DOWN:
+                self.target_temp = max(MIN_TEMP_CELSIUS, self.target_temp - 1)
+            case CommandCode.TIME_UP:
+                self.remaining_time = min(MAX_TIME, self.remaining_time + 1)
+            case CommandCode.TIME_DOWN:
+                self.remaining_time = max(0, self.remaining_time - 1)
+            case CommandCode.VOLUME:
+                self.volume = min(MAX_VOLUME, argument)
+            case CommandCode.RGB:
+                self.rgb = RGB_STATE_VALUES[argument]
+            case CommandCode.EXTERNAL_LIGHT:
+                self.light ^= 1
+            case CommandCode.INTERNAL_LIGHT:
+                self.light ^= 2
+            case CommandCode.UNIT:
+                self.unit_is_celsius ^= 1
+            case CommandCode.FM:
+                self._toggle_mode(STATE_RADIO)
+            case CommandCode.BT | CommandCode.AUX:
+                self._toggle_mode(STATE_BT)
+            case CommandCode.USB:
+                self._toggle_mode(STATE_USB)
+
+    def _toggle_mode(self, mode: int) -> None:
+        self.state = STATE_ON if self.state == mode else mode
+
+    def tick(self, seconds: float) -> None:
+        """Advance the temperature and the timer."""
+        if self.is_heating:
+            self.current_temp = min(
+                self.target_temp, self.current_temp + HEATING_RATE * seconds
+            )
+            self.elapsed += seconds
+            while self.elapsed >= 60:
+                self.elapsed -= 60
+                self.remaining_time = max(0, self.remaining_time - 1)
+            if not self.remaining_time:
+                self.heating_state = HEATING_OFF
+        else:
+            self.current_temp = max(
+                AMBIENT_TEMP_CELSIUS, self.current_temp - COOLING_RATE * seconds
+            )
+
+    def _displayed_temp(self, celsius: float) -> int:
+        if self.unit_is_celsius == 0:
+            return round(celsius)
+        return round(celsius * 9 / 5 + 32)
+
+    def state_notification(self) -> bytes:
+        """Checksummed state notification."""
+        return encode_state(
+            (
+                self.state,
+                self.heating_state,
+                self._displayed_temp(self.target_temp),
+                self._displayed_temp(self.current_temp),
+                self.remaining_time,
+                self.unit_is_celsius,
+                self.volume,
+                self.light,
+                self.rgb,
+            )
+        )
+
+    def fm_notification(self) -> bytes:
+        return encode_fm(self.fm_frequency)
+
+
+class ArtsaunaEmulator:
+    """In-process emulation of an Artsauna for tests and benchmarks.
+
+    Patch `establish_connection` of the adapter module with
+    `ArtsaunaEmulator.establish_connection` to connect to it. After the
+    `CMD_APP_AUTH` handshake the emulator answers every command with a state
+    notification and sends the state, and the FM frequency while the radio is
+    on, every notification interval.
+
+    Link faults are injected with the fragment size, the bit error rate, the
+    notification and connect delays, `connect_failures`, `write_failures` and
+    `drop_connection`.
+    """
+
+    def __init__(
+        self,
+        address: str = "AA:BB:CC:DD:EE:FF",
+        name: str = "SAUNA",
+        notification_interval: float | None = 1.0,
+        fragment_size: int | None = None,
+        bit_error_rate: float = 0.0,
+        notification_delay: float = 0.0,
+        seed: int | None = None,
+        connect_delay: float = 0.0,
+    ) -> None:
+        self.ble_device = BLEDevice(address, name, None)
+        self.sauna = EmulatedSaunaState()
+        self.notification_interval = notification_interval
+        self.fragment_size = fragment_size
+        self.bit_error_rate = bit_error_rate
+        self.notification_delay = notification_delay
+        self.connect_delay = connect_delay
+        # the next connection attempts that fail
+        self.connect_failures = 0
+        # the next command writes that fail
+        self.write_failures = 0
+        self.connection_count = 0
+        self.written: list[bytes] = []
+        self.client: EmulatedBleakClient | None = None
+        self._random = random.Random(seed)
+
+    async def establish_connection(
+        self,
+        client_class: type,
+        device: BLEDevice,
+        name: str,
+        disconnected_callback: Callable[[Any], None] | None = None,
+        **kwargs: Any,
+    ) -> EmulatedBleakClient:
+        """Stand-in for `bleak_retry_connector.establish_connection`."""
+        if self.connect_delay:
+            await asyncio.sleep(self.connect_delay)
+        if self.connect_failures:
+            self.connect_failures -= 1
+            raise BleakError(f"{name}: emulated connection failure")
+        if self.client is not None and self.client.is_connected:
+            raise BleakError(f"{name}: emulated device is already connected")
+        self.connection_count += 1
+        self.client = EmulatedBleakClient(self, disconnected_callback)
+        return self.client
+
+    def drop_connection(self) -> None:
+        """Disconnect unexpectedly, like a device going out of range."""
+        if self.client is not None:
+            self.client.close(notify=True)
+
+    def frames(self) -> list[bytes]:
+        """The notifications the sauna currently sends."""
+        frames = [self.sauna.state_notification()]
+        if self.sauna.state == STATE_RADIO:
+            frames.append(self.sauna.fm_notification())
+        return frames
+
+    def handle_write(self, data: bytes) -> bool:
+        """Handle a write, returns whether the device answers it."""
+        self.written.append(data)
+        if len(data) < len(COMMAND_PREFIX) + 3 or not has_valid_checksum(data):
+            return False
+        if data == CMD_APP_AUTH:
+            if self.client is not None:
+                self.client.authenticated = True
+            return False
+        if not data.startswith(COMMAND_PREFIX):
+            return False
+        if self.client is None or not self.client.authenticated:
+            return False
+        if self.write_failures:
+            self.write_failures -= 1
+            raise BleakError("Emulated write failure")
+        self.sauna.apply(data[len(COMMAND_PREFIX)], data[len(COMMAND_PREFIX) + 1])
+        return True
+
+    def packets(self, frame: bytes) -> list[bytearray]:
+        """Split a frame into notifications, with bit errors if configured."""
+        data = bytearray(frame)
+        if self.bit_error_rate and self._random.random() < self.bit_error_rate:
+            data[self._random.randrange(len(data))] ^= 1 << self._random.randrange(8)
+        if not self.fragment_size:
+            return [data]
+        return [
+            data[start : start + self.fragment_size]
+            for start in range(0, len(data), self.fragment_size)
+        ]
+
+
+class _EmulatedCharacteristic:
+    def __init__(self, uuid: UUID, properties: list[str]) -> None:
+        self.uuid = uuid
+        self.properties = properties
+
+
+class _EmulatedServices:
+    def __init__(self) -> None:
+        self._characteristics = {
+            CHARACTERISTIC_WRITE: _EmulatedCharacteristic(
+                CHARACTERISTIC_WRITE, ["write", "write-without-response"]
+            ),
+            CHARACTERISTIC_NOTIFY: _EmulatedCharacteristic(
+                CHARACTERISTIC_NOTIFY, ["notify"]
+            ),
+        }
+
+    def get_characteristic(self, uuid: UUID) -> _EmulatedCharacteristic | None:
+        return self._characteristics.get(uuid)
+
+
+class EmulatedBleakClient:
+    """Stand-in for the `BleakClientWithServiceCache` connected to the emulator."""
+
+    def __init__(
+        self,
+        emulator: ArtsaunaEmulator,
+        disconnected_callback: Callable[[Any], None] | None,
+    ) -> None:
+        self._emulator = emulator
+        self._disconnected_callback = disconnected_callback
+        self._notify_callback: Callable[[Any, bytearray], None] | None = None
+        self._notify_task: asyncio.Task[None] | None = None
+        self.services = _EmulatedServices()
+        self.is_connected = True
+        self.authenticated = False
+
+    async def write_gatt_char(
+        self, char_specifier: UUID, data: bytes, response: bool = True
+    ) -> None:
+        if not self.is_connected:
+            raise BleakError("Not connected")
+        if char_specifier != CHARACTERISTIC_WRITE:
+            raise BleakError(f"Characteristic {char_specifier} is not writable")
+        if self._emulator.handle_write(bytes(data)):
+            self._schedule_notify(self._emulator.notification_delay)
+
+    async def start_notify(
+        self, char_specifier: UUID, callback: Callable[[Any, bytearray], None]
+    ) -> None:
+        if not self.is_connected:
+            raise BleakError("Not connected")
+        self._notify_callback = callback
+        if self._emulator.notification_interval is not None:
+            self._notify_task = asyncio.create_task(self._notify_periodically())
+
+    async def stop_notify(self, char_specifier: UUID) -> None:
+        self._notify_callback = None
+        self._cancel_notify_task()
+
+    async def disconnect(self) -> bool:
+        self.close(notify=True)
+        return True
+
+    def close(self, notify: bool) -> None:
+        """Close the connection, calling the disconnected callback if requested."""
+        if not self.is_connected:
+            return
+        self.is_connected = False
+        self._notify_callback = None
+        self._cancel_notify_task()
+        if notify and self._disconnected_callback is not None:
+            self._disconnected_callback(self)
+
+    def _cancel_notify_task(self) -> None:
+        if self._notify_task is not None:
+            self._notify_task.cancel()
+            self._notify_task = None
+
+    async def _notify_periodically(self) -> None:
+        loop = asyncio.get_running_loop()
+        last_tick = loop.time()
+        while True:
+            await asyncio.sleep(self._emulator.notification_interval)
+            now = loop.time()
+            self._emulator.sauna.tick(now - last_tick)
+            last_tick = now
+            self._notify()
+
+    def _schedule_notify(self, delay: float) -> None:
+        if delay:
+            asyncio.get_running_loop().call_later(delay, self._notify)
+        else:
+            asyncio.get_running_loop().call_soon(self._notify)
+
+    def _notify(self) -> None:
+        if not self.authenticated or self._notify_callback is None:
+            return
+        for frame in self._emulator.frames():
+            for packet in self._emulator.packets(frame):
+                self._notify_callback(CHARACTERISTIC_NOTIFY, packet)
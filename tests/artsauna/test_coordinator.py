@@ -0,0 +1,221 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+#
+# Artsauna-BLE - integration for Home Assistant
+# Copyright (C) 2025 David & Philipp Aderbauer
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+
+"""Test the debouncing and publishing of the artsauna-bt coordinator."""
+
+import asyncio
+from collections.abc import AsyncGenerator
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+pytest.importorskip("pytest_homeassistant_custom_component")
+
+from bleak.backends.device import BLEDevice
+from homeassistant.core import HomeAssistant
+
+from custom_components.artsauna_ble.artsauna_ble import (
+    ArtsaunaBLEAdapter,
+    ArtsaunaField,
+)
+from custom_components.artsauna_ble.coordinator import (
+    COUNTDOWN_FIELDS,
+    DISCRETE_FIELDS,
+    TEMPERATURE_FIELDS,
+    ArtsaunaBLECoordinator,
+    ArtsaunaStateSnapshot,
+    DebouncePolicy,
+)
+from custom_components.artsauna_ble.switch import POWER_DESCRIPTION, ArtsaunaBLESwitch
+from tests.artsauna.emulator import STATE_ON, EmulatedSaunaState
+
+# the temperature is published after 0.05s of quiet, but at least every 0.15s
+POLICIES = {
+    DISCRETE_FIELDS: DebouncePolicy(),
+    TEMPERATURE_FIELDS: DebouncePolicy(0.05, 0.15),
+    COUNTDOWN_FIELDS: DebouncePolicy(3600, 3600),
+}
+
+
+@pytest.fixture
+def adapter() -> ArtsaunaBLEAdapter:
+    """Adapter fed with the notifications of the emulated sauna."""
+    return ArtsaunaBLEAdapter(BLEDevice("AA:BB:CC:DD:EE:FF", "SAUNA", None))
+
+
+@pytest.fixture
+def sauna() -> EmulatedSaunaState:
+    """State of the emulated sauna, switched on."""
+    return EmulatedSaunaState(state=STATE_ON)
+
+
+@pytest.fixture
+async def coordinator(
+    hass: HomeAssistant, adapter: ArtsaunaBLEAdapter, sauna: EmulatedSaunaState
+) -> AsyncGenerator[ArtsaunaBLECoordinator]:
+    """Coordinator with the first state of the sauna published."""
+    coordinator = ArtsaunaBLECoordinator(hass, adapter, debounce_policies=POLICIES)
+    # the first state changes all fields and is published right away
+    _notify(adapter, sauna)
+    yield coordinator
+    await coordinator.async_shutdown()
+
+
+def _notify(adapter: ArtsaunaBLEAdapter, sauna: EmulatedSaunaState) -> None:
+    """Send the state of the emulated sauna to the adapter."""
+    adapter._notification_handler(0, bytearray(sauna.state_notification()))
+
+
+async def test_entities_are_unavailable_until_the_first_state(
+    hass: HomeAssistant, adapter: ArtsaunaBLEAdapter, sauna: EmulatedSaunaState
+) -> None:
+    """Test the entities become available with the first published state."""
+    coordinator = ArtsaunaBLECoordinator(hass, adapter)
+
+    assert not coordinator.last_update_success
+    _notify(adapter, sauna)
+
+    assert coordinator.last_update_success
+    assert coordinator.data.generation == 1
+    await coordinator.async_shutdown()
+
+
+async def test_toggles_are_published_right_away(
+    coordinator: ArtsaunaBLECoordinator,
+    adapter: ArtsaunaBLEAdapter,
+    sauna: EmulatedSaunaState,
+) -> None:
+    """Test a discrete change is published without delay."""
+    sauna.heating_state = 1
+    _notify(adapter, sauna)
+
+    assert coordinator.data.generation == 2
+    assert coordinator.changed_fields == ArtsaunaField.HEATING_STATE
+    assert coordinator.data.state.heating_state == 1
+
+
+async def test_changes_are_published_after_the_delay(
+    coordinator: ArtsaunaBLECoordinator,
+    adapter: ArtsaunaBLEAdapter,
+    sauna: EmulatedSaunaState,
+) -> None:
+    """Test a temperature change is published once the delay passed."""
+    sauna.current_temp += 1
+    _notify(adapter, sauna)
+
+    assert coordinator.data.generation == 1
+    await asyncio.sleep(0.1)
+    assert coordinator.data.generation == 2
+    assert coordinator.data.state.current_temp == round(sauna.current_temp)
+
+
+async def test_continuous_changes_are_published_by_the_staleness_cap(
+    coordinator: ArtsaunaBLECoordinator,
+    adapter: ArtsaunaBLEAdapter,
+    sauna: EmulatedSaunaState,
+) -> None:
+    """Test a continuously changing temperature is published by the staleness cap."""
+    for _ in range(20):
+        sauna.current_temp += 1
+        _notify(adapter, sauna)
+        await asyncio.sleep(0.02)
+
+    # the delay never passes, the cap publishes about every 0.15s
+    assert 2 < coordinator.data.generation < 10
+
+
+async def test_earliest_group_publishes_all_groups(
+    coordinator: ArtsaunaBLECoordinator,
+    adapter: ArtsaunaBLEAdapter,
+    sauna: EmulatedSaunaState,
+) -> None:
+    """Test the earliest due group publishes the changes of all groups."""
+    sauna.remaining_time -= 1
+    _notify(adapter, sauna)
+    sauna.volume += 1
+    _notify(adapter, sauna)
+
+    assert coordinator.data.generation == 2
+    assert coordinator.changed_fields == (
+        ArtsaunaField.REMAINING_TIME | ArtsaunaField.VOLUME
+    )
+
+
+async def test_changed_options_reschedule_the_pending_changes(
+    coordinator: ArtsaunaBLECoordinator,
+    adapter: ArtsaunaBLEAdapter,
+    sauna: EmulatedSaunaState,
+) -> None:
+    """Test new debounce policies reschedule the pending changes."""
+    sauna.remaining_time -= 1
+    _notify(adapter, sauna)
+    assert coordinator.data.generation == 1
+
+    coordinator.debounce_policies = {
+        **POLICIES,
+        COUNTDOWN_FIELDS: DebouncePolicy(0.05, 0.05),
+    }
+    await asyncio.sleep(0.1)
+
+    assert coordinator.data.generation == 2
+    assert coordinator.data.state.remaining_time == sauna.remaining_time
+
+
+async def test_listeners_are_updated_for_their_fields(
+    coordinator: ArtsaunaBLECoordinator,
+    adapter: ArtsaunaBLEAdapter,
+    sauna: EmulatedSaunaState,
+) -> None:
+    """Test listeners are only updated for changes of their fields."""
+    volume_listener, heating_listener, listener = MagicMock(), MagicMock(), MagicMock()
+    coordinator.async_add_listener(volume_listener, ArtsaunaField.VOLUME)
+    coordinator.async_add_listener(heating_listener, ArtsaunaField.HEATING_STATE)
+    coordinator.async_add_listener(listener)
+
+    sauna.volume += 1
+    _notify(adapter, sauna)
+
+    volume_listener.assert_called_once()
+    heating_listener.assert_not_called()
+    listener.assert_called_once()
+
+
+async def test_entities_skip_rendered_generations(
+    coordinator: ArtsaunaBLECoordinator,
+    adapter: ArtsaunaBLEAdapter,
+    sauna: EmulatedSaunaState,
+) -> None:
+    """Test entities only write the state of unrendered generations."""
+    switch = ArtsaunaBLESwitch(coordinator, adapter, "SAUNA", POWER_DESCRIPTION)
+    published = coordinator.data
+
+    with patch.object(switch, "async_write_ha_state") as write_state:
+        switch._handle_coordinator_update()
+        switch._handle_coordinator_update()
+        coordinator.data = ArtsaunaStateSnapshot(0, published.state)
+        switch._handle_coordinator_update()
+    coordinator.data = published
+
+    assert write_state.call_count == 0
+    sauna.heating_state = 1
+    _notify(adapter, sauna)
+    with patch.object(switch, "async_write_ha_state") as write_state:
+        switch._handle_coordinator_update()
+        switch._handle_coordinator_update()
+
+    write_state.assert_called_once()